@@ -0,0 +1,81 @@
+"""
+Triple V Card Benchmark
+Run this script to time creating and re-styling tool cards.
+
+Creates 1,000 ToolCard and MyToolCard widgets under the application
+stylesheet, then takes every download button through the Download/Update/
+disabled sequence a status check produces. Runs offscreen, no window is shown.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QWidget, QGridLayout
+
+CARD_COUNT = 1000
+COLUMNS = 4
+
+
+def timed(label, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{label:<45}{elapsed:>10.1f} ms")
+    return result
+
+
+def benchmark_cards(count=CARD_COUNT):
+    app = QApplication(sys.argv)
+    from utils.styles import load_stylesheet
+    app.setStyleSheet(load_stylesheet())
+
+    from ui.components.tool_card import ToolCard
+    from ui.components.my_tool_card import MyToolCard
+
+    container = QWidget()
+    grid = QGridLayout(container)
+
+    def create_tool_cards():
+        cards = []
+        for i in range(count):
+            card = ToolCard(f"Benchmark Tool {i}", "A tool used to benchmark card creation " * 2,
+                            f"https://github.com/example/tool-{i}")
+            grid.addWidget(card, i // COLUMNS, i % COLUMNS)
+            cards.append(card)
+        return cards
+
+    def create_my_tool_cards():
+        return [
+            MyToolCard(f"Benchmark Tool {i}", "1.0.0", f"/nonexistent/tool-{i}", f"https://github.com/example/tool-{i}")
+            for i in range(count)
+        ]
+
+    # (is_update, enabled) as ToolCard.apply_status goes through them for an installed tool
+    status_sequence = [
+        (True, False),   # Checking…
+        (True, True),    # Update available
+        (True, False),   # Up to date
+        (True, False),   # Status re-emitted (e.g. registry reload), nothing changed
+        (False, True),   # Uninstalled: Download
+    ]
+
+    def restyle(cards):
+        for card in cards:
+            for is_update, enabled in status_sequence:
+                card.style_download_button(is_update=is_update, enabled=enabled)
+
+    print("=" * 55)
+    print(f"Benchmarking {count} cards")
+    print("=" * 55)
+    tool_cards = timed(f"Create {count} ToolCards", create_tool_cards)
+    timed("Show and lay out", lambda: (container.resize(1300, 800), container.show(), app.processEvents()))
+    timed(f"Status changes ({count} x {len(status_sequence)})", lambda: restyle(tool_cards))
+    timed("Process pending polish/paint", app.processEvents)
+    timed(f"Create {count} MyToolCards", create_my_tool_cards)
+
+
+if __name__ == "__main__":
+    benchmark_cards()
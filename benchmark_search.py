@@ -0,0 +1,119 @@
+"""
+Triple V Search Benchmark
+Run this script to time catalog searches against the 5 ms budget.
+
+Loads a synthetic 10,000-tool catalog into a fresh ToolRepository, lets it
+build the search index in background as it does after startup, then times
+the very first query and queries while they are typed, including prefixes
+of category words ("au", "autosar", "generic"...) that match most of the
+catalog. Exits with 1 if a query is over budget. Runs offscreen in a
+temporary folder.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+TOOL_COUNT = 10000
+BUDGET_MS = 5.0
+REPEATS = 20
+FIRST_QUERY = "au"
+
+CATEGORIES = ["Classical_AUTOSAR", "Adaptive_AUTOSAR", "generic"]
+NAME_WORDS = [
+    "NvM", "Dump", "Analyzer", "Documentation", "Slayer", "Com", "Stack", "Config", "Checker",
+    "Trace", "Viewer", "Dem", "Dcm", "Signal", "Mapper", "ARXML", "Diff", "Merge", "Report",
+    "Builder", "Log", "Parser", "CAN", "Bus", "Simulator", "Flash", "Bootloader", "Memory",
+    "Autosar", "Audit", "Autogen", "Unit", "Test", "Runner", "Coverage", "Excel", "Export",
+]
+DESCRIPTION_WORDS = [
+    "analyze", "the", "dump", "of", "nvm", "and", "get", "all", "info", "tool", "for",
+    "autosar", "adaptive", "classical", "generic", "unit", "design", "documentation",
+    "export", "results", "excel", "markdown", "word", "document", "visual", "studio",
+    "code", "extension", "automates", "creation", "configuration", "ecu", "signals",
+    "diagnostics", "memory", "stack", "trace", "automatic", "audit", "authoring",
+]
+QUERIES = [
+    "a", "au", "aut", "auto", "autos", "autosar", "adaptive", "adaptive autosar",
+    "classical", "classical autosar", "generic", "gen", "tool", "the",
+    "nvm", "nvm dump", "dump analyzer", "documnetation", "config checker 42", "zzz",
+]
+
+
+def synthetic_catalog(count, seed=7):
+    rng = random.Random(seed)
+    catalog = {category: [] for category in CATEGORIES}
+    for i in range(count):
+        name = " ".join(rng.sample(NAME_WORDS, rng.randint(2, 3))) + f" {i}"
+        description = " ".join(rng.choice(DESCRIPTION_WORDS) for _ in range(rng.randint(8, 20)))
+        catalog[CATEGORIES[i % len(CATEGORIES)]].append({"name": name, "description": description})
+    return catalog
+
+
+def benchmark_search(count=TOOL_COUNT):
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as work_dir:
+        from config.settings import Settings
+        Settings.EXE_DIR = Path(work_dir)
+        Settings.TOOLS_CONFIG_FILE = Path(work_dir) / "tools_registry.json"
+        Settings.CATALOG_DIR = Path(work_dir) / "catalog"
+        with open(Settings.TOOLS_CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(synthetic_catalog(count), f)
+        return run_queries(app, count)
+
+
+def run_queries(app, count):
+    from utils.tool_repository import ToolRepository
+    repository = ToolRepository.instance()
+    print("=" * 62)
+    print(f"Benchmarking search over {count} tools (budget {BUDGET_MS:.0f} ms)")
+    print("=" * 62)
+
+    # What MainWindow.reconcile_state() starts after the first paint
+    started = time.perf_counter()
+    repository.prepare_search_index()
+    while repository._search_index is None:
+        app.processEvents()
+        time.sleep(0.001)
+    print(f"{'Build index (background)':<30}{(time.perf_counter() - started) * 1000:>10.1f} ms")
+
+    over_budget = []
+    # The first search after startup, on one of the broadest prefixes
+    started = time.perf_counter()
+    repository.search(FIRST_QUERY)
+    first = (time.perf_counter() - started) * 1000
+    flag = "  OVER" if first > BUDGET_MS else ""
+    print(f"{'First query ' + repr(FIRST_QUERY):<30}{first:>10.2f} ms{flag}")
+    if first > BUDGET_MS:
+        over_budget.append("first query")
+
+    for query in QUERIES:
+        times = []
+        for _ in range(REPEATS):
+            started = time.perf_counter()
+            results = repository.search(query)
+            times.append((time.perf_counter() - started) * 1000)
+        worst = max(times)
+        flag = "  OVER" if worst > BUDGET_MS else ""
+        print(f"{query!r:<30}{sorted(times)[REPEATS // 2]:>10.2f} ms median{worst:>9.2f} ms max"
+              f"{len(results):>6} hits{flag}")
+        if worst > BUDGET_MS:
+            over_budget.append(query)
+
+    if over_budget:
+        print(f"\nFAILED: over {BUDGET_MS:.0f} ms: {', '.join(over_budget)}")
+        return 1
+    print("\nOK: every query within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_search())
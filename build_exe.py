@@ -6,7 +6,22 @@ Run this script to create a standalone executable
 import os
 import sys
 import shutil
+import json
 import PyInstaller.__main__
+from config.catalog_store import file_digest, write_shards
+from config.settings import Settings
+
+# Sharded catalog staged here and bundled as config/catalog
+CATALOG_BUILD_DIR = os.path.join('build', 'catalog')
+
+def build_catalog_shards():
+    """Split tools_registry.json into an index plus per-category pages"""
+    with open(Settings.TOOLS_CONFIG_FILE, 'r', encoding='utf-8') as f:
+        catalog = json.load(f)
+    index = write_shards(catalog, CATALOG_BUILD_DIR, Settings.CATALOG_PAGE_SIZE,
+                         file_digest(Settings.TOOLS_CONFIG_FILE))
+    pages = sum(len(entry['pages']) for entry in index['categories'].values())
+    print(f"Catalog: {len(index['categories'])} categories in {pages} pages")
 
 def build_exe():
     # Clean previous builds
@@ -14,6 +29,8 @@ def build_exe():
         if os.path.exists(folder):
             shutil.rmtree(folder)
     
+    build_catalog_shards()
+    
     # PyInstaller arguments
     args = [
         'main.py',                    # Entry point
@@ -25,11 +42,13 @@ def build_exe():
         # Add data files
         '--add-data=assets;assets',
         '--add-data=config;config',
+        f'--add-data={CATALOG_BUILD_DIR};config/catalog',
         
         # Hidden imports (if needed)
         '--hidden-import=PyQt5',
         '--hidden-import=requests',
         '--hidden-import=packaging',
+        '--hidden-import=zstandard',
         
         # Paths
         '--distpath=dist',
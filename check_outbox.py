@@ -0,0 +1,163 @@
+"""
+Triple V Outbox Check
+Run this script to test vault submission delivery without a real mail server.
+
+Queues a submission in a temporary outbox while nothing listens on the SMTP
+port (the delivery fails and is rescheduled with backoff), then starts a
+minimal local SMTP stand-in and checks the retry logs in and delivers the
+message once. Also checks that a missing keyring password and the last
+allowed attempt move a message aside as .failed and report it.
+Runs offscreen, no window is shown and no real email is sent.
+"""
+
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QCoreApplication
+
+
+class SMTPStandIn(socketserver.StreamRequestHandler):
+    """Just enough SMTP (no TLS, AUTH PLAIN accepting anything) to accept a message"""
+
+    received = []
+    logins = 0
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.reply("220 triplev-standin ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-triplev-standin")
+                self.reply("250 AUTH PLAIN")
+            elif command.startswith("AUTH PLAIN"):
+                SMTPStandIn.logins += 1
+                self.reply("235 Authentication successful")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for data_line in iter(self.rfile.readline, b""):
+                    if data_line in (b".\r\n", b".\n"):
+                        break
+                    data.append(data_line)
+                self.received.append(b"".join(data).decode(errors="replace"))
+                self.reply("250 Queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_until(app, condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def check_outbox():
+    app = QCoreApplication(sys.argv)
+    from config.settings import Settings
+    import utils.outbox
+    from utils.outbox import OutboxSender
+
+    port = free_port()
+    Settings.SMTP_HOST = "127.0.0.1"
+    Settings.SMTP_PORT = port
+    Settings.SMTP_STARTTLS = False
+    Settings.OUTBOX_RETRY_BASE_SECONDS = 1
+    Settings.OUTBOX_RETRY_MAX_SECONDS = 2
+    # No keyring here; the password only has to be present, the stand-in accepts any
+    utils.outbox.smtp_password = lambda _sender: "check-password"
+
+    failures = []
+    with tempfile.TemporaryDirectory() as outbox_dir:
+        sender = OutboxSender(directory=outbox_dir)
+        delivered = []
+        sender.delivered.connect(delivered.append)
+        gave_up = []
+        sender.gave_up.connect(lambda subject, error: gave_up.append((subject, error)))
+
+        # 1. Nothing listening: the submission must stay queued with a backoff
+        started = time.perf_counter()
+        sender.enqueue("Outbox check", "Queued by check_outbox.py", "reviewers@example.com", "triplev@example.com")
+        enqueue_ms = (time.perf_counter() - started) * 1000
+        run_until(app, lambda: sender._task is None)
+        pending = sender.outbox.pending()
+        if len(pending) != 1 or pending[0][1]["attempts"] != 1:
+            failures.append("a failed delivery did not keep the message queued for retry")
+        else:
+            print(f"Queued in {enqueue_ms:.1f} ms, first attempt failed as expected: {pending[0][1]['last_error']}")
+
+        # 2. Stand-in up: the scheduled retry delivers it
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", port), SMTPStandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            if not run_until(app, lambda: delivered, timeout=15):
+                failures.append("the retry did not deliver the message")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        from email import message_from_string
+        bodies = [message_from_string(raw).get_payload(decode=True).decode() for raw in SMTPStandIn.received]
+        if len(bodies) != 1 or "Queued by check_outbox.py" not in bodies[0]:
+            failures.append(f"stand-in received {len(SMTPStandIn.received)} messages, expected 1")
+        if SMTPStandIn.logins != 1:
+            failures.append(f"the sender logged in {SMTPStandIn.logins} times, expected 1")
+        if sender.outbox.pending():
+            failures.append("the delivered message is still in the outbox")
+
+        # 3. No password: given up at once, without another connection attempt
+        utils.outbox.smtp_password = lambda _sender: None
+        sender.enqueue("No credential", "Never sent", "reviewers@example.com", "triplev@example.com")
+        run_until(app, lambda: sender._task is None and gave_up)
+        # 4. Out of attempts: the last failed attempt is not rescheduled
+        utils.outbox.smtp_password = lambda _sender: "check-password"
+        Settings.OUTBOX_MAX_ATTEMPTS = 1
+        sender.enqueue("Out of attempts", "Never sent", "reviewers@example.com", "triplev@example.com")
+        run_until(app, lambda: sender._task is None and len(gave_up) == 2)
+        failed_files = sorted(Path(outbox_dir).glob("*" + sender.outbox.FAILED_SUFFIX))
+        if [subject for subject, _error in gave_up] != ["No credential", "Out of attempts"]:
+            failures.append(f"expected both failures to be reported, got {gave_up}")
+        elif "keyring" not in gave_up[0][1]:
+            failures.append(f"the missing password was reported as: {gave_up[0][1]}")
+        else:
+            print(f"Reported without retrying: {gave_up[0][1]}")
+        if len(failed_files) != 2 or sender.outbox.pending():
+            failures.append("the given up messages were not moved aside as .failed")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("OK: the submission was queued without blocking and delivered on retry; hopeless ones were reported")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(check_outbox())
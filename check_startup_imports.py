@@ -0,0 +1,97 @@
+"""
+Triple V Startup Import Check
+Run this script (or in CI) to make sure startup imports don't grow.
+
+Imports main.py under `python -X importtime` and fails if any module that
+should only load on first use (networking, email, keyring, archives...) is
+imported at startup, or if the number of modules loaded grows past the budget.
+"""
+
+import os
+import sys
+import subprocess
+
+# Loaded on first use only (downloads, update checks, vault submissions, cold storage...)
+DEFERRED_MODULES = [
+    'requests',
+    'urllib3',
+    'http.client',
+    'ssl',
+    'smtplib',
+    'email.mime',
+    'keyring',
+    'zipfile',
+    'tarfile',
+    'zstandard',
+    'packaging',
+    'webbrowser',
+    'subprocess',
+    'concurrent.futures',
+    'PyQt5.QtSvg',
+    'ui.dialogs.add_vault_dialog',
+    'utils.update_manager',
+    'utils.cold_storage',
+    'utils.integrity',
+]
+
+# Modules imported by `import main` on top of a bare interpreter.
+# Raise deliberately (and say why in the commit) if a new startup import is really needed.
+MAX_STARTUP_MODULES = 60
+
+
+def imported_modules(code):
+    """Return {module: (self_us, cumulative_us)} imported while running code"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(f"'{code}' failed with exit code {result.returncode}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def check_startup_imports():
+    baseline = imported_modules('pass')
+    startup = {
+        name: times for name, times in imported_modules('import main').items()
+        if name not in baseline
+    }
+
+    failures = []
+    for deferred in DEFERRED_MODULES:
+        loaded = [name for name in startup if name == deferred or name.startswith(deferred + '.')]
+        if loaded:
+            failures.append(f"{deferred} is imported at startup ({', '.join(sorted(loaded)[:3])})")
+
+    if len(startup) > MAX_STARTUP_MODULES:
+        failures.append(f"{len(startup)} modules imported at startup, budget is {MAX_STARTUP_MODULES}")
+
+    print("=" * 50)
+    print(f"Startup imports: {len(startup)} modules (budget {MAX_STARTUP_MODULES}), "
+          f"{startup.get('main', (0, 0))[1] / 1000:.0f} ms for 'import main'")
+    print("=" * 50)
+    slowest = sorted(startup.items(), key=lambda item: item[1][0], reverse=True)[:15]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<40}{self_us / 1000:>8.1f} ms{cumulative_us / 1000:>10.1f} ms")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\nOK: no deferred module is imported at startup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(check_startup_imports())
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from utils.log import get_logger
+
+log = get_logger("catalog")
+
+
+INDEX_FILE = "index.json"
+FORMAT_VERSION = 1
+
+
+def shard_name(category, page):
+    """File name of a category page, safe for any category name"""
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", category).strip("_") or "category"
+    return f"{slug}-{page}.json"
+
+
+def tools_digest(tools):
+    """Content hash of a category's tool list, independent of key order"""
+    data = json.dumps(tools, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def file_digest(path):
+    """Content hash of a file, e.g. the tools registry the shards were built from"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_shards(catalog, directory, page_size=200, source_digest=None):
+    """
+    Split a {category: [tool]} catalog into per-category pages of page_size
+    tools plus a compact index.json. The index is written last, so readers
+    never see an index pointing at missing pages. Returns the index dict.
+    source_digest (file_digest() of the registry the catalog was read from)
+    is recorded so a later edit of that file can be told from a copy of it.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    index = {"format": FORMAT_VERSION, "page_size": page_size, "categories": {}}
+    if source_digest is not None:
+        index["source_digest"] = source_digest
+    written = set()
+    for category, tools in catalog.items():
+        pages = []
+        for page, start in enumerate(range(0, len(tools), page_size)):
+            name = shard_name(category, page)
+            with open(directory / name, "w", encoding="utf-8") as f:
+                json.dump(tools[start:start + page_size], f, ensure_ascii=False, separators=(",", ":"))
+            pages.append(name)
+            written.add(name)
+        index["categories"][category] = {"count": len(tools), "pages": pages, "digest": tools_digest(tools)}
+
+    temp_path = directory / (INDEX_FILE + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=4)
+    os.replace(temp_path, directory / INDEX_FILE)
+
+    # Pages of categories that shrank or were removed
+    for path in directory.glob("*.json"):
+        if path.name != INDEX_FILE and path.name not in written:
+            path.unlink()
+    return index
+
+
+class CatalogStore(Mapping):
+    """
+    Read-only {category: [tool]} view over a sharded catalog. Only index.json
+    is read up front; a category's pages are parsed the first time they are
+    needed (page() for scrolling, [category] for the whole list) and kept.
+    """
+
+    _opened = {}  # directory -> (index mtime_ns, index size, store)
+
+    def __init__(self, directory, index):
+        self.directory = Path(directory)
+        self.index = index
+        self.page_size = index.get("page_size", 200)
+        self._categories = index.get("categories", {})
+        self._pages = {}   # (category, page) -> [tool]
+        self._tools = {}   # category -> [tool], once every page is loaded
+        self._dict = None
+
+    @classmethod
+    def open(cls, directory):
+        """
+        The store for directory, reused until its index.json changes.
+        None when there is no (valid) sharded catalog there.
+        """
+        directory = Path(directory)
+        index_path = directory / INDEX_FILE
+        try:
+            stat = index_path.stat()
+        except OSError:
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._opened.get(directory)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning("Could not read %s: %s", index_path, e)
+            return None
+        if not isinstance(index, dict) or index.get("format") != FORMAT_VERSION:
+            log.warning("Unsupported catalog index format in %s", index_path)
+            return None
+
+        store = cls(directory, index)
+        cls._opened[directory] = (*stamp, store)
+        return store
+
+    # ------------------------
+    # Mapping
+    # ------------------------
+    def __getitem__(self, category):
+        if category not in self._categories:
+            raise KeyError(category)
+        tools = self._tools.get(category)
+        if tools is None:
+            tools = []
+            for page in range(self.page_count(category)):
+                tools.extend(self.page(category, page))
+            self._tools[category] = tools
+        return tools
+
+    def __contains__(self, category):
+        # Mapping's default goes through __getitem__, which parses the pages
+        return category in self._categories
+
+    def __iter__(self):
+        return iter(self._categories)
+
+    def __len__(self):
+        return len(self._categories)
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    # ------------------------
+    # Pages
+    # ------------------------
+    def count(self, category):
+        return self._categories.get(category, {}).get("count", 0)
+
+    def page_count(self, category):
+        return len(self._categories.get(category, {}).get("pages", []))
+
+    def page(self, category, page):
+        """Tools of one page, parsed on first access"""
+        key = (category, page)
+        tools = self._pages.get(key)
+        if tools is None:
+            name = self._categories[category]["pages"][page]
+            try:
+                with open(self.directory / name, "r", encoding="utf-8") as f:
+                    tools = json.load(f)
+            except (OSError, ValueError) as e:
+                log.warning("Could not read page %s: %s", name, e)
+                tools = []
+            self._pages[key] = tools
+        return tools
+
+    def digest(self, category):
+        """tools_digest() of a category as recorded in the index, None for older indexes"""
+        return self._categories.get(category, {}).get("digest")
+
+    def is_loaded(self, category):
+        return category in self._tools
+
+    def to_dict(self):
+        """The whole catalog as a plain dict (parses every page)"""
+        if self._dict is None:
+            self._dict = {category: self[category] for category in self}
+        return self._dict
@@ -3,6 +3,35 @@ import json
 import sys
 import re
 from pathlib import Path
+from utils.log import get_logger
+
+log = get_logger("settings")
+
+
+class cached_setting:
+    """
+    Class attribute computed on first access. The result replaces the
+    descriptor on the class, so later reads are plain attribute lookups.
+    Importing this module touches neither the filesystem nor stdout.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = self.func(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+def user_setting(key):
+    """Lazy setting read from the per-user config (see config/user_config.py)"""
+    return cached_setting(lambda cls: cls.USER_CONFIG.get(key))
+
 
 class Settings:
     # ------------------------
@@ -10,26 +39,27 @@ class Settings:
     # ------------------------
     BASE_DIR = Path(__file__).resolve().parent.parent
     CONFIG_DIR = BASE_DIR / "config"
-    
-    # Get the directory where the exe is located
-    if getattr(sys, 'frozen', False):
-        # Running as exe
-        EXE_DIR = Path(sys.executable).parent
-    else:
-        # Running as script
-        EXE_DIR = BASE_DIR / "dist"
-
-    DOWNLOADS_DIR = EXE_DIR / "My Downloaded Tools"
 
     TOOLS_CONFIG_FILE = CONFIG_DIR / "tools_registry.json"
+    # Sharded catalog generated from TOOLS_CONFIG_FILE by build_exe.py (see config/catalog_store.py)
+    CATALOG_DIR = CONFIG_DIR / "catalog"
+    CATALOG_PAGE_SIZE = 200
     ASSETS_DIR = BASE_DIR / "assets"
     LOGO_PATH = ASSETS_DIR / "triple_v_logo.png"
     ICON_PATH = ASSETS_DIR / "triple_v_logo.ico"
 
-    # Ensure necessary directories exist
-    CONFIG_DIR.mkdir(exist_ok=True)
-    DOWNLOADS_DIR.mkdir(exist_ok=True)
-    ASSETS_DIR.mkdir(exist_ok=True)
+    @cached_setting
+    def EXE_DIR(cls):
+        """Directory of the running exe, or dist/ when running as a script"""
+        if getattr(sys, 'frozen', False):
+            return Path(sys.executable).parent
+        return cls.BASE_DIR / "dist"
+
+    @cached_setting
+    def DOWNLOADS_DIR(cls):
+        downloads_dir = cls.EXE_DIR / "My Downloaded Tools"
+        downloads_dir.mkdir(parents=True, exist_ok=True)
+        return downloads_dir
 
     # ------------------------
     # Local Version Loading
@@ -61,21 +91,21 @@ class Settings:
             match = re.search(r'TripleV_v(\d+\.\d+\.\d+)', filename.replace('.exe', ''))
             if match:
                 version_str = match.group(1)
-                print(f"[Settings] Extracted version {version_str} from {filename}")
+                log.debug("Extracted version %s from %s", version_str, filename)
                 return version_str
             else:
-                print(f"[Settings] Could not extract version from {filename}, using default")
+                log.warning("Could not extract version from %s, using default", filename)
                 return default_version
 
         except Exception as e:
-            print(f"[Settings] Error extracting version: {e}")
+            log.warning("Error extracting version: %s", e)
             return default_version
 
     # ------------------------
     # Application Info
     # ------------------------
     APP_NAME = "Triple V"
-    APP_VERSION = _load_local_version()
+    APP_VERSION = cached_setting(lambda cls: cls._load_local_version())
     ORGANIZATION = "Triple V Platform"
 
     # ------------------------
@@ -85,6 +115,76 @@ class Settings:
     GITHUB_API_URL = "https://api.github.com/repos/abdallahIssa1/Triple-V/releases/latest"
     # This URL is used if no valid download_url is provided by the updater manifest.
     UPDATE_CHECK_URL = "https://raw.githubusercontent.com/abdallahIssa1/Triple-V/main/dist/TripleV.zip"
+    # Published tools registry, synced over the copy bundled in the exe
+    CATALOG_REMOTE_URL = "https://raw.githubusercontent.com/abdallahIssa1/Triple-V/main/config/tools_registry.json"
+    CATALOG_CACHE_FILE = cached_setting(lambda cls: cls.EXE_DIR / "catalog_cache.json")
+    # New TripleV exe downloaded in background, swapped in on restart or next launch
+    UPDATE_STAGING_DIR = cached_setting(lambda cls: cls.EXE_DIR / "update_staging")
+    # Tool updates downloaded ahead of the Update click, one folder per tool
+    TOOL_UPDATE_STAGING_DIR = cached_setting(lambda cls: cls.EXE_DIR / "tool_update_staging")
+
+    # Rotating log written by utils/log.py; the last records are also kept for the About dialog
+    LOG_DIR = cached_setting(lambda cls: cls.EXE_DIR / "logs")
+    LOG_FILE_MAX_BYTES = 1024 * 1024
+    LOG_FILE_BACKUPS = 3
+    LOG_RING_BUFFER_SIZE = 2000
+
+    # Vault submissions waiting for delivery (see utils/outbox.py)
+    OUTBOX_DIR = cached_setting(lambda cls: cls.EXE_DIR / "outbox")
+    OUTBOX_RETRY_BASE_SECONDS = 30
+    OUTBOX_RETRY_MAX_SECONDS = 60 * 60
+    # Then the message is moved aside as .failed and the user is told (about 5 hours of retries)
+    OUTBOX_MAX_ATTEMPTS = 12
+    SUBMISSION_SENDER_EMAIL = "abdallahissa9800@gmail.com"
+    SUBMISSION_RECIPIENT_EMAIL = "abdallah.issa@vehiclevo.com"
+
+    # Last known tool state, rendered at startup while it is re-checked
+    STATE_SNAPSHOT_FILE = cached_setting(lambda cls: cls.EXE_DIR / "state_snapshot.json")
+    STATE_SNAPSHOT_SAVE_DELAY_MS = 5000
+
+    # ------------------------
+    # User Performance Settings
+    # ------------------------
+    # Persisted per user in USER_CONFIG_FILE, defaults in UserConfig.DEFAULTS
+    USER_CONFIG_FILE = cached_setting(lambda cls: cls.EXE_DIR / "user_config.json")
+
+    @cached_setting
+    def USER_CONFIG(cls):
+        from config.user_config import UserConfig
+        return UserConfig.load(cls.USER_CONFIG_FILE)
+
+    REQUEST_TIMEOUT = user_setting("request_timeout")
+    PROBE_TIMEOUT = user_setting("probe_timeout")
+    DOWNLOAD_TIMEOUT = user_setting("download_timeout")
+    DOWNLOAD_CHUNK_SIZE = user_setting("download_chunk_size")
+    BANDWIDTH_LIMIT_KBPS = user_setting("bandwidth_limit_kbps")
+    # Background workers resolving tool install/update status
+    STATUS_CHECK_WORKERS = user_setting("status_check_workers")
+    INTEGRITY_WORKERS = user_setting("integrity_workers")
+    PIXMAP_CACHE_KB = user_setting("pixmap_cache_kb")
+    RESOLVED_URL_CACHE_SIZE = user_setting("resolved_url_cache_size")
+    SEARCH_RESULT_LIMIT = user_setting("search_result_limit")
+    CATALOG_SYNC_INTERVAL_MINUTES = user_setting("catalog_sync_interval_minutes")
+    # Opt-in background download of tool updates, see utils/tool_update_stager.py
+    PRESTAGE_TOOL_UPDATES = user_setting("prestage_tool_updates")
+    PRESTAGE_START_HOUR = user_setting("prestage_start_hour")
+    PRESTAGE_END_HOUR = user_setting("prestage_end_hour")
+    PRESTAGE_IDLE_SECONDS = user_setting("prestage_idle_seconds")
+    # Opt-in, see utils/cold_storage.py
+    COLD_STORAGE_ENABLED = user_setting("cold_storage_enabled")
+    COLD_STORAGE_AFTER_DAYS = user_setting("cold_storage_after_days")
+    COLD_STORAGE_ZSTD_LEVEL = user_setting("cold_storage_zstd_level")
+    SMTP_HOST = user_setting("smtp_host")
+    SMTP_PORT = user_setting("smtp_port")
+    SMTP_STARTTLS = user_setting("smtp_starttls")
+    LOG_LEVEL = user_setting("log_level")
+
+    # ------------------------
+    # Cold Storage
+    # ------------------------
+    # With COLD_STORAGE_ENABLED, tools unused for COLD_STORAGE_AFTER_DAYS are compressed
+    # into COLD_STORAGE_DIR and extracted again on the next Run
+    COLD_STORAGE_DIR = cached_setting(lambda cls: cls.EXE_DIR / "Cold Storage")
 
     # ------------------------
     # UI Settings
@@ -92,6 +192,8 @@ class Settings:
     SIDEBAR_WIDTH = 60
     SIDEBAR_EXPANDED_WIDTH = 250
     ANIMATION_DURATION = 300
+    # Build the category views in idle time after the first paint instead of on first click
+    PREBUILD_VIEWS_ON_IDLE = False
 
     # ------------------------
     # Colors (Hex Codes)
@@ -101,30 +203,118 @@ class Settings:
     BACKGROUND_COLOR = "#1a1a1a"
     SURFACE_COLOR    = "#2d2d2d"
     TEXT_COLOR       = "#ffffff"
+    SUCCESS_COLOR    = "#4CAF50"
 
     # ------------------------
     # Tools Config Load/Save
     # ------------------------
+    # (mtime_ns, size, parsed catalog) of the last load_tools_config() parse
+    _tools_config_cache = None
+    # (registry and index stamps, shards usable) of the last _open_catalog_store() check
+    _shards_checked = None
+
+    @classmethod
+    def load_catalog(cls):
+        """
+        The tools catalog as a {category: [tool]} mapping. With a sharded
+        catalog only its index is read here and categories are parsed on first
+        access; otherwise this is load_tools_config().
+        """
+        store = cls._open_catalog_store()
+        if store is not None:
+            return store
+        return cls.load_tools_config()
+
+    @classmethod
+    def _open_catalog_store(cls):
+        """
+        The sharded catalog, or None if there is none or it no longer matches
+        TOOLS_CONFIG_FILE. The shards are built from that file, so once it is
+        edited (newer than index.json with other contents) they are rebuilt
+        from it, or skipped if they cannot be written.
+        """
+        from config.catalog_store import CatalogStore, INDEX_FILE, file_digest, write_shards
+        try:
+            index_stat = (cls.CATALOG_DIR / INDEX_FILE).stat()
+        except OSError:
+            return None
+        store = CatalogStore.open(cls.CATALOG_DIR)
+        try:
+            registry_stat = cls.TOOLS_CONFIG_FILE.stat()
+        except OSError:
+            return store
+        if registry_stat.st_mtime_ns <= index_stat.st_mtime_ns:
+            return store
+
+        stamp = (registry_stat.st_mtime_ns, registry_stat.st_size, index_stat.st_mtime_ns, index_stat.st_size)
+        if cls._shards_checked is not None and cls._shards_checked[0] == stamp:
+            return store if cls._shards_checked[1] else None
+        # Unpacking the exe renews both mtimes, so a newer registry may still be the same file
+        try:
+            digest = file_digest(cls.TOOLS_CONFIG_FILE)
+        except OSError as e:
+            log.warning("Could not read %s: %s", cls.TOOLS_CONFIG_FILE, e)
+            return store
+        if store is not None and store.index.get("source_digest") == digest:
+            cls._shards_checked = (stamp, True)
+            return store
+
+        config_data = cls._parse_tools_registry()
+        if config_data is None:
+            # Half-saved edit; keep the last good catalog until it parses
+            return store
+        log.info("%s changed since the catalog shards were built, rebuilding them", cls.TOOLS_CONFIG_FILE.name)
+        try:
+            write_shards(config_data, cls.CATALOG_DIR, cls.CATALOG_PAGE_SIZE, digest)
+        except OSError as e:
+            log.warning("Could not rebuild the catalog shards, reading %s instead: %s", cls.TOOLS_CONFIG_FILE.name, e)
+            cls._shards_checked = (stamp, False)
+            return None
+        return CatalogStore.open(cls.CATALOG_DIR)
+
     @classmethod
     def load_tools_config(cls):
         """
-        Load the tools registry from JSON.
-        If the file does not exist, return a default structure.
+        Load the tools registry as a plain dict: every shard of the sharded
+        catalog if there is one, else the JSON file.
+        If neither exists, return a default structure.
+        The parse is memoized and only redone when the file's mtime or size
+        changes, so callers share one (read-only) result.
         """
-        if cls.TOOLS_CONFIG_FILE.exists():
-            try:
-                with open(cls.TOOLS_CONFIG_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading tools config: {e}")
-                # Return default structure on error
-                return {
-                    "Classical_AUTOSAR": [],
-                    "Adaptive_AUTOSAR": [],
-                    "generic": [],
-                    "My downloaded Tools": []
-                }
-        # Default categories if no file is present
+        store = cls._open_catalog_store()
+        if store is not None:
+            return store.to_dict()
+
+        config_data = cls._parse_tools_registry()
+        if config_data is None:
+            # Default categories if no file is present or it is invalid
+            return cls._default_tools_config()
+        return config_data
+
+    @classmethod
+    def _parse_tools_registry(cls):
+        """The parsed TOOLS_CONFIG_FILE (memoized on mtime and size), None if missing or invalid"""
+        try:
+            stat = cls.TOOLS_CONFIG_FILE.stat()
+        except OSError:
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._tools_config_cache
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+
+        try:
+            with open(cls.TOOLS_CONFIG_FILE, "r", encoding="utf-8") as f:
+                config_data = json.load(f)
+        except Exception as e:
+            log.error("Could not load tools config: %s", e)
+            return None
+        cls._tools_config_cache = (*stamp, config_data)
+        return config_data
+
+    @staticmethod
+    def _default_tools_config():
         return {
             "Classical_AUTOSAR": [],
             "Adaptive_AUTOSAR": [],
@@ -142,5 +332,11 @@ class Settings:
             cls.TOOLS_CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
             with open(cls.TOOLS_CONFIG_FILE, "w", encoding="utf-8") as f:
                 json.dump(config_data, f, indent=4, ensure_ascii=False)
+            # Keep an existing sharded copy in step, it takes precedence when loading
+            if (cls.CATALOG_DIR / "index.json").exists():
+                from config.catalog_store import file_digest, write_shards
+                write_shards(config_data, cls.CATALOG_DIR, cls.CATALOG_PAGE_SIZE,
+                             file_digest(cls.TOOLS_CONFIG_FILE))
         except Exception as e:
-            print(f"Error saving tools config: {e}")
+            log.error("Could not save tools config: %s", e)
+        cls._tools_config_cache = None
@@ -0,0 +1,129 @@
+import json
+from pathlib import Path
+from utils.log import get_logger
+
+log = get_logger("config")
+
+
+class UserConfig:
+    """
+    Per-user performance and connection settings, persisted as JSON next to the executable.
+    Missing or invalid entries fall back to DEFAULTS; the file is rewritten with
+    every known key so users can find and edit the knobs.
+    """
+
+    DEFAULTS = {
+        # Network timeouts in seconds
+        "request_timeout": 10,
+        "probe_timeout": 5,
+        "download_timeout": 30,
+        # Streaming downloads
+        "download_chunk_size": 64 * 1024,
+        # Total download bandwidth in KB/s, 0 = unlimited
+        "bandwidth_limit_kbps": 0,
+        # Remote catalog sync period, 0 = never sync
+        "catalog_sync_interval_minutes": 60,
+        # Concurrency limits
+        "status_check_workers": 4,
+        "integrity_workers": 8,
+        # Cache sizes
+        "pixmap_cache_kb": 20 * 1024,
+        "resolved_url_cache_size": 512,
+        "search_result_limit": 200,
+        # Download pending tool updates in the background (see utils/tool_update_stager.py)
+        "prestage_tool_updates": False,
+        # Only stage between these local hours (start == end: any time) ...
+        "prestage_start_hour": 0,
+        "prestage_end_hour": 24,
+        # ... and after this many seconds without user input
+        "prestage_idle_seconds": 300,
+        # Compress tools unused for this many days into "Cold Storage" (see utils/cold_storage.py)
+        "cold_storage_enabled": False,
+        "cold_storage_after_days": 90,
+        # zstd level 1-22: higher packs smaller but archives slower
+        "cold_storage_zstd_level": 10,
+        # Mail server for vault submissions (point it at a local stand-in to test)
+        "smtp_host": "smtp.gmail.com",
+        "smtp_port": 587,
+        "smtp_starttls": True,
+        # DEBUG, INFO, WARNING or ERROR (see logs/triplev.log next to the executable)
+        "log_level": "INFO",
+    }
+
+    # Smallest accepted value per key (0 everywhere else)
+    MINIMUMS = {
+        "request_timeout": 1,
+        "probe_timeout": 1,
+        "download_timeout": 1,
+        "download_chunk_size": 1024,
+        "status_check_workers": 1,
+        "integrity_workers": 1,
+        "search_result_limit": 1,
+        "cold_storage_after_days": 1,
+        "cold_storage_zstd_level": 1,
+        "smtp_port": 1,
+    }
+
+    # Largest accepted value per key (unbounded everywhere else)
+    MAXIMUMS = {
+        "prestage_start_hour": 24,
+        "prestage_end_hour": 24,
+        "cold_storage_zstd_level": 22,
+        "smtp_port": 65535,
+    }
+
+    def __init__(self, path, values=None):
+        self.path = Path(path)
+        self.values = dict(self.DEFAULTS)
+        if values:
+            self.values.update(values)
+
+    @classmethod
+    def load(cls, path):
+        """Read the config at path; create or complete the file if needed"""
+        config = cls(path)
+        stored = {}
+        try:
+            with open(config.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Could not read %s, using defaults: %s", config.path, e)
+
+        if not isinstance(stored, dict):
+            stored = {}
+        for key, default in cls.DEFAULTS.items():
+            value = stored.get(key, default)
+            if isinstance(default, (bool, str)):
+                valid = isinstance(value, type(default)) and value != ""
+            else:
+                # Numbers only; bool is an int subclass but never a numeric knob
+                valid = (not isinstance(value, bool) and isinstance(value, (int, float))
+                         and cls.MINIMUMS.get(key, 0) <= value <= cls.MAXIMUMS.get(key, value))
+                # Whole numbers for int knobs: 0.5 KB/s must not turn into 0 (unlimited)
+                if valid and isinstance(default, int) and isinstance(value, float):
+                    valid = value.is_integer()
+            if not valid:
+                log.warning("Invalid value for %s: %r, using %r", key, value, default)
+                value = default
+            config.values[key] = type(default)(value)
+
+        if stored != config.values:
+            config.save()
+        return config
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.values, f, indent=4)
+        except Exception as e:
+            log.error("Could not save %s: %s", self.path, e)
+
+    def get(self, key):
+        return self.values[key]
+
+    def set(self, key, value):
+        self.values[key] = value
+        self.save()
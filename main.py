@@ -1,28 +1,62 @@
+import time
+STARTUP_TIME = time.perf_counter()
+
 import sys
+from utils.startup_profiler import profiler
+if "--profile-startup" in sys.argv:
+    # Installed before PyQt5 and the app modules are imported so they get timed
+    profiler.start(origin=STARTUP_TIME)
+
 import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QPixmap
-from ui.main_window import MainWindow
-from utils.styles import load_stylesheet
+with profiler.span("Import PyQt5"):
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
+with profiler.span("Import application modules"):
+    from ui.main_window import MainWindow
+    from utils.styles import load_stylesheet
+    from config.settings import Settings
+    from utils.log import get_logger, setup_logging
+
+log = get_logger("main")
+
+def apply_staged_update():
+    """Swap in an update staged by the last session and start it; True if this process should exit"""
+    if not getattr(sys, "frozen", False):
+        return False
+    from utils.update_staging import UpdateStaging
+    try:
+        return UpdateStaging().apply(relaunch=True) is not None
+    except Exception as e:
+        log.error("Could not apply staged update: %s", e)
+        return False
 
 def main():
+    setup_logging()
+    if apply_staged_update():
+        return
+
     # Enable high DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     
-    app = QApplication(sys.argv)
+    with profiler.span("Create QApplication"):
+        app = QApplication(sys.argv)
     app.setApplicationName("Triple V")
     app.setOrganizationName("Triple V Platform")
+    QPixmapCache.setCacheLimit(Settings.PIXMAP_CACHE_KB)
 
     icon_path = os.path.join(os.path.dirname(__file__), "assets", "triple_v_logo.ico")
     app.setWindowIcon(QIcon(str(icon_path)))
     # Load stylesheet
-    app.setStyleSheet(load_stylesheet())
+    with profiler.span("load_stylesheet"):
+        app.setStyleSheet(load_stylesheet())
     
     # Create and show main window
-    window = MainWindow()
-    window.show()
+    with profiler.span("MainWindow()"):
+        window = MainWindow(startup_time=STARTUP_TIME)
+    with profiler.span("MainWindow.show"):
+        window.show()
     
     sys.exit(app.exec_())
 
@@ -1,33 +1,50 @@
-from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox, QProgressDialog, QMenu
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QRect
+from PyQt5.QtGui import QFont, QColor
 from config.settings import Settings
-import subprocess
+from ui.components.tool_grid import CardDelegate, ToolListModel
+from utils.styles import set_state
+from utils.tool_repository import ToolRepository
 import os
+import time
 from pathlib import Path
-import webbrowser
+from utils.log import get_logger
+
+log = get_logger("tools")
+
+
+def running_text(supervisor, tool_name):
+    """e.g. "● Running · 3% CPU · 120 MB" for the path line of a running tool"""
+    count = len(supervisor.processes(tool_name))
+    parts = ["● Running" if count == 1 else f"● {count} running"]
+    cpu_percent, rss_bytes = supervisor.stats(tool_name)
+    if cpu_percent is not None:
+        parts.append(f"{cpu_percent:.0f}% CPU")
+    if rss_bytes is not None:
+        parts.append(f"{rss_bytes / 2**20:.0f} MB")
+    return " · ".join(parts)
+
 
 class MyToolCard(QFrame):
-    def __init__(self, name, version, path, github_url):
+    def __init__(self, name, version, path, github_url, state="hot", single_instance=True):
         super().__init__()
         self.name = name
         self.version = version
         self.tool_path = Path(path)
         self.github_url = github_url
+        self.state = state
+        self.single_instance = single_instance
+        self.repository = ToolRepository.instance()
+        self.supervisor = self.repository.supervisor
         self.init_ui()
+        self.supervisor.process_started.connect(self.on_process_changed)
+        self.supervisor.process_exited.connect(self.on_process_changed)
+        self.supervisor.stats_updated.connect(self.on_process_changed)
+        self.update_running()
         
     def init_ui(self):
         self.setFixedSize(300, 200)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: #2a2a2a;
-                border: 1px solid #444;
-                border-radius: 12px;
-            }}
-            QFrame:hover {{
-                border-color: {Settings.PRIMARY_COLOR};
-            }}
-        """)
+        self.setObjectName("MyToolCard")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -38,15 +55,16 @@ class MyToolCard(QFrame):
         name_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
         name_label.setWordWrap(True)
         
-        version_label = QLabel(f"Version: {self.version}")
-        version_label.setFont(QFont("Segoe UI", 10))
-        version_label.setStyleSheet("color: #aaa;")
+        self.version_label = QLabel(f"Version: {self.version}")
+        self.version_label.setFont(QFont("Segoe UI", 10))
+        self.version_label.setObjectName("SecondaryLabel")
         
         # Path info
-        path_label = QLabel(f"📁 {self.tool_path.name}")
-        path_label.setFont(QFont("Segoe UI", 9))
-        path_label.setStyleSheet("color: #888;")
-        path_label.setWordWrap(True)
+        self.path_label = QLabel()
+        self.path_label.setFont(QFont("Segoe UI", 9))
+        self.path_label.setObjectName("MutedLabel")
+        self.path_label.setWordWrap(True)
+        self.update_path_label()
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -56,93 +74,253 @@ class MyToolCard(QFrame):
         self.run_btn = QPushButton("▶ Run")
         self.run_btn.setFixedHeight(35)
         self.run_btn.setCursor(Qt.PointingHandCursor)
+        self.run_btn.setObjectName("PrimaryButton")
         self.run_btn.clicked.connect(self.run_tool)
-        self.run_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Settings.PRIMARY_COLOR};
-                border: none;
-                border-radius: 6px;
-                color: {Settings.BACKGROUND_COLOR};
-                font-weight: bold;
-                padding: 0 15px;
-            }}
-            QPushButton:hover {{
-                background-color: {Settings.SECONDARY_COLOR};
-            }}
-        """)
         
         # Open folder button
         folder_btn = QPushButton("📂")
         folder_btn.setFixedSize(35, 35)
         folder_btn.setCursor(Qt.PointingHandCursor)
         folder_btn.setToolTip("Open folder")
+        folder_btn.setObjectName("IconButton")
         folder_btn.clicked.connect(self.open_folder)
-        folder_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333;
-                border: 1px solid #555;
-                border-radius: 6px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #444;
-            }
-        """)
         
         # GitHub button
         github_btn = QPushButton("GitHub")
         github_btn.setFixedHeight(35)
         github_btn.setCursor(Qt.PointingHandCursor)
-        github_btn.clicked.connect(lambda: webbrowser.open(self.github_url))
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333;
-                border: 1px solid #555;
-                border-radius: 6px;
-                color: white;
-                font-weight: bold;
-                padding: 0 15px;
-            }
-            QPushButton:hover {
-                background-color: #444;
-            }
-        """)
+        github_btn.setObjectName("SecondaryButton")
+        github_btn.clicked.connect(self.open_github)
         
         button_layout.addWidget(self.run_btn)
         button_layout.addWidget(folder_btn)
         button_layout.addWidget(github_btn)
         
         layout.addWidget(name_label)
-        layout.addWidget(version_label)
-        layout.addWidget(path_label)
+        layout.addWidget(self.version_label)
+        layout.addWidget(self.path_label)
         layout.addStretch()
         layout.addLayout(button_layout)
         
+    def update_path_label(self):
+        if self.supervisor.is_running(self.name):
+            self.path_label.setText(running_text(self.supervisor, self.name))
+            set_state(self.path_label, "running")
+            return
+        set_state(self.path_label, "")
+        if self.state == "cold":
+            self.path_label.setText(f"❄ {self.tool_path.name} (archived, restored on Run)")
+        elif self.tool_path.exists():
+            self.path_label.setText(f"📁 {self.tool_path.name}")
+        else:
+            self.path_label.setText(f"⚠ {self.tool_path.name} (missing)")
+
+    def update_info(self, version, path, github_url, state="hot", single_instance=True):
+        """Refresh the card in place after the registry entry changed"""
+        self.version = version
+        self.tool_path = Path(path)
+        self.github_url = github_url
+        self.state = state
+        self.single_instance = single_instance
+        self.version_label.setText(f"Version: {self.version}")
+        self.update_running()
+
+    def on_process_changed(self, tool_name, *_args):
+        if tool_name == self.name:
+            self.update_running()
+
+    def update_running(self):
+        """Running indicator on the path line; Run is blocked for single-instance tools"""
+        self.update_path_label()
+        blocked = self.single_instance and self.supervisor.is_running(self.name)
+        self.run_btn.setText("● Running" if blocked else "▶ Run")
+        self.run_btn.setEnabled(not blocked)
+        self.run_btn.setToolTip("Already running. Right-click the card to allow several instances" if blocked else "")
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        multiple_action = menu.addAction("Allow multiple instances")
+        multiple_action.setCheckable(True)
+        multiple_action.setChecked(not self.single_instance)
+        history_action = menu.addAction("Launch history…")
+        chosen = menu.exec_(event.globalPos())
+        if chosen is multiple_action:
+            self.repository.registry.set_single_instance(self.name, not multiple_action.isChecked())
+            self.repository.reload_installed(invalidate_status=False)
+        elif chosen is history_action:
+            self.show_launch_history()
+
+    def show_launch_history(self):
+        lines = []
+        for launch in self.repository.registry.launch_history(self.name, limit=10):
+            started = time.strftime("%Y-%m-%d %H:%M", time.localtime(launch["started_at"]))
+            if launch["ended_at"] is None:
+                lines.append(f"{started}  PID {launch['pid']}  still running or untracked")
+                continue
+            details = [f"{(launch['ended_at'] - launch['started_at']) / 60:.1f} min",
+                       f"exit code {launch['exit_code']}"]
+            if launch["cpu_seconds"] is not None:
+                details.append(f"{launch['cpu_seconds']:.1f} s CPU")
+            if launch["peak_rss"]:
+                details.append(f"peak {launch['peak_rss'] / 2**20:.0f} MB")
+            lines.append(f"{started}  " + ", ".join(details))
+        QMessageBox.information(self, f"{self.name} launch history",
+                                "\n".join(lines) if lines else "Not launched from Triple V yet.")
+        
     def run_tool(self):
         """Run the tool executable"""
-        self.run_tool_static(self.name, self.tool_path)
+        self.run_tool_static(self.name, self.tool_path, parent_widget=self)
 
     @staticmethod
-    def run_tool_static(tool_name, tool_path):
+    def rehydrate_tool(tool_name, registry, parent_widget=None):
+        """Restore a cold tool from its local archive, showing progress"""
+        from utils.cold_storage import ColdStorage
+
+        progress = QProgressDialog(f"Restoring {tool_name} from cold storage...", None, 0, 100, parent_widget)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setAutoClose(True)
+
+        def report(read_bytes, total_bytes):
+            progress.setValue(int(read_bytes * 100 / total_bytes))
+
+        try:
+            return ColdStorage(registry).rehydrate(tool_name, progress_callback=report)
+        except Exception as e:
+            log.error("Failed to restore %s: %s", tool_name, e)
+            QMessageBox.critical(parent_widget, "Error",
+                                 f"Could not restore {tool_name} from cold storage: {str(e)}\n\n"
+                                 "Re-download it from its category page.")
+            return False
+        finally:
+            progress.close()
+
+    @staticmethod
+    def run_tool_static(tool_name, tool_path, parent_widget=None):
         """Static method to run a tool from any location"""
-        from pathlib import Path
+        from utils.download_manager import DownloadManager
         tool_path = Path(tool_path)
 
         try:
-            # Find the exe file in the tool directory
-            exe_files = list(tool_path.glob("*.exe"))
-            if exe_files:
-                exe_path = exe_files[0]  # Take the first exe found
-                subprocess.Popen(str(exe_path), cwd=str(tool_path))
-                print(f"{tool_name} started successfully!")
+            repository = ToolRepository.instance()
+            registry = repository.registry
+            tool_info = registry.get(tool_name) or {}
+
+            if tool_info.get("single_instance", True) and repository.supervisor.is_running(tool_name):
+                pid = repository.supervisor.processes(tool_name)[0].pid
+                QMessageBox.information(parent_widget, "Already running",
+                                        f"{tool_name} is already running (PID {pid}).")
+                return
+
+            # Archived tools are unpacked from cold storage first
+            if tool_info.get("state") == "cold":
+                if not MyToolCard.rehydrate_tool(tool_name, registry, parent_widget):
+                    return
+                tool_info = registry.get(tool_name) or {}
+
+            # Use the entry point indexed at install time; only legacy installs
+            # (or ones changed behind our back) need a directory scan
+            entry_point = tool_info.get("entry_point")
+            if not entry_point or not (tool_path / entry_point).is_file():
+                entry_point = DownloadManager.resolve_entry_point(tool_path, tool_name)
+                if tool_info:
+                    registry.set_entry_point(tool_name, entry_point)
+
+            if entry_point:
+                exe_path = tool_path / entry_point
+                repository.supervisor.launch(tool_name, exe_path)
+                if tool_info:
+                    registry.mark_run(tool_name)
             else:
-                print(f"No executable file found in {tool_name} directory")
+                log.warning("No executable file found in %s directory", tool_name)
         except Exception as e:
-            print(f"Failed to run {tool_name}: {str(e)}")
+            log.error("Failed to run %s: %s", tool_name, e)
             
     def open_folder(self):
         """Open the tool folder in explorer"""
         try:
             os.startfile(str(self.tool_path))
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not open folder: {str(e)}")
\ No newline at end of file
+            QMessageBox.warning(self, "Error", f"Could not open folder: {str(e)}")
+
+    def open_github(self):
+        import webbrowser
+        webbrowser.open(self.github_url)
+
+
+class MyToolCardDelegate(CardDelegate):
+    """Paints installed-tool cards like MyToolCard; a real card is created on hover/focus"""
+
+    def __init__(self, parent=None):
+        super().__init__(QSize(300, 200), parent=parent)
+        self.name_font = QFont("Segoe UI", 14, QFont.Bold)
+        self.version_font = QFont("Segoe UI", 10)
+        self.path_font = QFont("Segoe UI", 9)
+        self.button_font = QFont()
+        self.button_font.setBold(True)
+        self.emoji_font = QFont("Segoe UI Emoji", 12)
+        self.supervisor = ToolRepository.instance().supervisor
+
+    @staticmethod
+    def path_text(tool):
+        tool_path = Path(tool.get("path", ""))
+        if tool.get("state") == "cold":
+            return f"❄ {tool_path.name} (archived, restored on Run)"
+        if tool.get("present", tool_path.exists()):
+            return f"📁 {tool_path.name}"
+        return f"⚠ {tool_path.name} (missing)"
+
+    def paint_content(self, painter, rect, tool):
+        content = rect.adjusted(20, 20, -20, -20)
+
+        painter.setFont(self.name_font)
+        painter.setPen(QColor(Settings.TEXT_COLOR))
+        name_rect = QRect(content.x(), content.y(), content.width(), 28)
+        painter.drawText(name_rect, Qt.AlignVCenter | Qt.AlignLeft, tool["name"])
+
+        painter.setFont(self.version_font)
+        painter.setPen(QColor("#aaa"))
+        version_rect = QRect(content.x(), name_rect.bottom() + 10, content.width(), 20)
+        painter.drawText(version_rect, Qt.AlignVCenter | Qt.AlignLeft, f"Version: {tool.get('version', 'Unknown')}")
+
+        running = self.supervisor.is_running(tool["name"])
+        painter.setFont(self.path_font)
+        path_rect = QRect(content.x(), version_rect.bottom() + 10, content.width(), 30)
+        if running:
+            painter.setPen(QColor(Settings.SUCCESS_COLOR))
+            painter.drawText(path_rect, Qt.AlignTop | Qt.TextWordWrap, running_text(self.supervisor, tool["name"]))
+        else:
+            painter.setPen(QColor("#888"))
+            painter.drawText(path_rect, Qt.AlignTop | Qt.TextWordWrap, self.path_text(tool))
+
+        # Buttons: Run | folder | GitHub
+        button_top = content.bottom() - 35 + 1
+        github_rect = QRect(content.right() - 80 + 1, button_top, 80, 35)
+        folder_rect = QRect(github_rect.x() - 45, button_top, 35, 35)
+        run_rect = QRect(content.x(), button_top, folder_rect.x() - 10 - content.x(), 35)
+        painter.setFont(self.button_font)
+        if running and tool.get("single_instance", True):
+            self.paint_button(painter, run_rect, "● Running", "#444", "#888")
+        else:
+            self.paint_button(painter, run_rect, "▶ Run", Settings.PRIMARY_COLOR, Settings.BACKGROUND_COLOR)
+        self.paint_button(painter, github_rect, "GitHub", "#333", Settings.TEXT_COLOR, border="#555")
+        painter.setFont(self.emoji_font)
+        self.paint_button(painter, folder_rect, "📂", "#333", Settings.TEXT_COLOR, border="#555")
+
+    def create_card(self, tool, parent):
+        card = MyToolCard(
+            name=tool["name"],
+            version=tool.get("version", "Unknown"),
+            path=tool.get("path", ""),
+            github_url=tool.get("github_url", ""),
+            state=tool.get("state", "hot"),
+            single_instance=tool.get("single_instance", True)
+        )
+        card.setParent(parent)
+        return card
+
+    def setEditorData(self, editor, index):
+        tool = index.data(ToolListModel.ToolRole)
+        editor.update_info(tool.get("version", "Unknown"), tool.get("path", ""),
+                           tool.get("github_url", ""), tool.get("state", "hot"),
+                           tool.get("single_instance", True))
\ No newline at end of file
@@ -1,9 +1,10 @@
 from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QRect
 from PyQt5.QtGui import QFont, QPainter, QColor
 from config.settings import Settings
-from utils.download_manager import DownloadManager
-import webbrowser
+from ui.components.tool_grid import CardDelegate
+from utils.styles import set_state
+from utils.tool_repository import ToolRepository
 
 class ToolCard(QFrame):
     def __init__(self, name, description, github_url, icon="🔧"):
@@ -12,23 +13,17 @@ class ToolCard(QFrame):
         self.description = description
         self.github_url = github_url
         self.icon = icon
-        self.download_manager = DownloadManager()
+        self.repository = ToolRepository.instance()
         self.init_ui()
-        # Delay the check to ensure UI is ready
-        QTimer.singleShot(100, self.check_installed_status)
+        self.repository.status_changed.connect(self.on_status_changed)
+        self.repository.tool_removed.connect(self.on_status_changed)
+        self.repository.progress.connect(self.on_progress)
+        # Local state shows right away; network checks run on the repository's workers
+        self.apply_status()
 
     def init_ui(self):
         self.setFixedSize(300, 250)  # Increased height
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: #2a2a2a;
-                border: 1px solid #444;
-                border-radius: 12px;
-            }}
-            QFrame:hover {{
-                border-color: {Settings.PRIMARY_COLOR};
-            }}
-        """)
+        self.setObjectName("ToolCard")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -39,7 +34,7 @@ class ToolCard(QFrame):
         
         icon_label = QLabel(self.icon)
         icon_label.setFont(QFont("Segoe UI Emoji", 32))
-        icon_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        icon_label.setObjectName("AccentLabel")
         
         name_label = QLabel(self.name)
         name_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
@@ -52,7 +47,7 @@ class ToolCard(QFrame):
         desc_label = QLabel(self.description)
         desc_label.setFont(QFont("Segoe UI", 10))
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #aaa; line-height: 1.4;")
+        desc_label.setObjectName("SecondaryLabel")
         desc_label.setMinimumHeight(60)  # Ensure minimum space
         
         # Buttons
@@ -62,27 +57,15 @@ class ToolCard(QFrame):
         self.download_btn = QPushButton("Download")
         self.download_btn.setFixedHeight(35)
         self.download_btn.setCursor(Qt.PointingHandCursor)
+        self.download_btn.setObjectName("PrimaryButton")
         self.download_btn.clicked.connect(self.handle_download)
         self.style_download_button()
         
         self.github_btn = QPushButton("GitHub")
         self.github_btn.setFixedHeight(35)
         self.github_btn.setCursor(Qt.PointingHandCursor)
-        self.github_btn.clicked.connect(lambda: webbrowser.open(self.github_url))
-        self.github_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #333;
-                border: 1px solid #555;
-                border-radius: 6px;
-                color: white;
-                font-weight: bold;
-                padding: 0 15px;
-            }}
-            QPushButton:hover {{
-                background-color: #444;
-                border-color: {Settings.PRIMARY_COLOR};
-            }}
-        """)
+        self.github_btn.setObjectName("SecondaryButton")
+        self.github_btn.clicked.connect(self.open_github)
         
         button_layout.addWidget(self.download_btn)
         button_layout.addWidget(self.github_btn)
@@ -93,43 +76,41 @@ class ToolCard(QFrame):
         layout.addLayout(button_layout)
         
     def style_download_button(self, is_update=False, enabled=True):
-        if enabled:
-            self.download_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Settings.PRIMARY_COLOR if not is_update else '#ff9900'};
-                    border: none;
-                    border-radius: 6px;
-                    color: {Settings.BACKGROUND_COLOR};
-                    font-weight: bold;
-                    padding: 0 15px;
-                }}
-                QPushButton:hover {{
-                    background-color: {Settings.SECONDARY_COLOR if not is_update else '#ffaa00'};
-                }}
-            """)
-        else:
-            self.download_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #444;
-                    border: 1px solid #555;
-                    border-radius: 6px;
-                    color: #888;
-                    font-weight: bold;
-                    padding: 0 15px;
-                }
-            """)
+        # Colors come from the app stylesheet; disabled is the :disabled pseudo-state
+        self.download_btn.setEnabled(enabled)
+        set_state(self.download_btn, "update" if is_update else "download")
             
-    def check_installed_status(self):
-        is_installed, installed_version = self.download_manager.is_tool_installed(self.name)
+    def check_installed_status(self, priority=False):
+        self.repository.request_status(self.name, self.github_url, priority=priority)
+
+    def on_status_changed(self, tool_name):
+        if tool_name == self.name:
+            self.apply_status()
+
+    def on_progress(self, tool_name, percent):
+        if tool_name == self.name:
+            self.download_btn.setText(f"{percent}%")
+
+    def apply_status(self):
+        is_installed, _installed_version = self.repository.is_tool_installed(self.name)
+        if self.repository.is_stale(self.name):
+            self.download_btn.setToolTip("Last known status, re-checking in the background")
+            self.check_installed_status()
+        else:
+            self.download_btn.setToolTip("")
         
-        if is_installed:
-            # Check for updates
-            has_update, latest_version = self.download_manager.check_tool_update(self.github_url, installed_version)
-            
-            if has_update:
+        if is_installed and not self.repository.has_status(self.name):
+            self.download_btn.setText("Checking…")
+            self.download_btn.setEnabled(False)
+            self.style_download_button(is_update=True, enabled=False)
+            self.check_installed_status()
+        elif is_installed:
+            if self.repository.latest_version(self.name):
                 self.download_btn.setText("Update")
                 self.download_btn.setEnabled(True)
                 self.style_download_button(is_update=True, enabled=True)
+                if self.repository.is_update_staged(self.name):
+                    self.download_btn.setToolTip("Already downloaded, updates instantly")
             else:
                 self.download_btn.setText("Update")
                 self.download_btn.setEnabled(False)
@@ -140,14 +121,88 @@ class ToolCard(QFrame):
             self.style_download_button(is_update=False, enabled=True)
             
     def handle_download(self):
-        if self.download_btn.text() == "Download":
-            success = self.download_manager.download_tool(self.github_url, self.name)
+        is_installed, _installed_version = self.repository.is_tool_installed(self.name)
+        if not is_installed:
+            success = self.repository.download_tool(self.github_url, self.name)
             if success:
                 # Auto-open the tool after successful download
                 from ui.components.my_tool_card import MyToolCard
-                MyToolCard.run_tool_static(self.name, self.download_manager.downloads_dir / self.name)
-                self.check_installed_status()
+                MyToolCard.run_tool_static(self.name, Settings.DOWNLOADS_DIR / self.name)
+            else:
+                self.apply_status()
         else:
-            success = self.download_manager.update_tool(self.github_url, self.name)
-            if success:
-                self.check_installed_status()
\ No newline at end of file
+            success = self.repository.update_tool(self.github_url, self.name)
+            if not success:
+                self.apply_status()
+
+    def open_github(self):
+        import webbrowser
+        webbrowser.open(self.github_url)
+
+
+
+class ToolCardDelegate(CardDelegate):
+    """Paints catalog cards like ToolCard; a real ToolCard is created on hover/focus"""
+
+    def __init__(self, parent=None):
+        super().__init__(QSize(300, 250), parent=parent)
+        self.repository = ToolRepository.instance()
+        self.icon_font = QFont("Segoe UI Emoji", 32)
+        self.name_font = QFont("Segoe UI", 14, QFont.Bold)
+        self.desc_font = QFont("Segoe UI", 10)
+        self.button_font = QFont()
+        self.button_font.setBold(True)
+
+    def download_button_state(self, tool_name):
+        """(text, background, foreground) of the Download/Update button"""
+        is_installed, _installed_version = self.repository.is_tool_installed(tool_name)
+        if not is_installed:
+            return "Download", Settings.PRIMARY_COLOR, Settings.BACKGROUND_COLOR
+        if not self.repository.has_status(tool_name):
+            return "Checking…", "#444", "#888"
+        if self.repository.latest_version(tool_name):
+            return "Update", "#ff9900", Settings.BACKGROUND_COLOR
+        return "Update", "#444", "#888"
+
+    def paint_content(self, painter, rect, tool):
+        content = rect.adjusted(20, 20, -20, -20)
+
+        # Icon and name
+        painter.setFont(self.icon_font)
+        painter.setPen(QColor(Settings.PRIMARY_COLOR))
+        icon_rect = QRect(content.x(), content.y(), 60, 60)
+        painter.drawText(icon_rect, Qt.AlignVCenter | Qt.AlignLeft, tool.get("icon", "🔧"))
+
+        painter.setFont(self.name_font)
+        painter.setPen(QColor(Settings.TEXT_COLOR))
+        name_rect = QRect(icon_rect.right() + 6, content.y(), content.width() - 66, 60)
+        painter.drawText(name_rect, Qt.AlignVCenter | Qt.TextWordWrap, tool["name"])
+
+        # Description
+        painter.setFont(self.desc_font)
+        painter.setPen(QColor("#aaa"))
+        desc_rect = QRect(content.x(), icon_rect.bottom() + 10, content.width(), content.height() - 60 - 10 - 45)
+        painter.drawText(desc_rect, Qt.AlignTop | Qt.TextWordWrap, tool.get("description", ""))
+
+        # Buttons
+        painter.setFont(self.button_font)
+        button_top = content.bottom() - 35 + 1
+        github_rect = QRect(content.right() - 90 + 1, button_top, 90, 35)
+        download_rect = QRect(content.x(), button_top, content.width() - 100, 35)
+        text, background, foreground = self.download_button_state(tool["name"])
+        if self.repository.is_stale(tool["name"]):
+            # Restored from the last session, dimmed until re-checked
+            painter.setOpacity(0.6)
+        self.paint_button(painter, download_rect, text, background, foreground)
+        painter.setOpacity(1.0)
+        self.paint_button(painter, github_rect, "GitHub", "#333", Settings.TEXT_COLOR, border="#555")
+
+    def create_card(self, tool, parent):
+        card = ToolCard(
+            tool["name"],
+            tool["description"],
+            tool["github_url"],
+            tool.get("icon", "🔧")
+        )
+        card.setParent(parent)
+        return card
\ No newline at end of file
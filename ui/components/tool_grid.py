@@ -0,0 +1,284 @@
+from abc import ABCMeta, abstractmethod
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QPersistentModelIndex, QSize, QRect, QRectF
+from PyQt5.QtGui import QPainter, QColor, QPen
+from config.settings import Settings
+
+
+class ToolListModel(QAbstractListModel):
+    """
+    Flat list of tool dicts (catalog entries or installed tools), keyed by "name".
+    Views only paint what is visible, so this scales to catalogs of thousands of tools.
+    """
+
+    ToolRole = Qt.UserRole + 1
+
+    def __init__(self, tools=None, parent=None):
+        super().__init__(parent)
+        self._tools = []
+        self._rows = {}
+        self._more_pages = None
+        if tools:
+            self.set_tools(tools)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tools)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        tool = self._tools[index.row()]
+        if role == Qt.DisplayRole:
+            return tool["name"]
+        if role == Qt.ToolTipRole:
+            return tool.get("description")
+        if role == self.ToolRole:
+            return tool
+        return None
+
+    def _reindex(self):
+        self._rows = {tool["name"]: row for row, tool in enumerate(self._tools)}
+
+    def set_tools(self, tools, more_pages=None):
+        """
+        Show tools; more_pages optionally iterates over further lists of tools,
+        appended one page at a time as the view scrolls to the end (fetchMore)
+        """
+        self.beginResetModel()
+        self._tools = list(tools)
+        self._more_pages = more_pages
+        self._reindex()
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._more_pages is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._more_pages is None:
+            return
+        page = next(self._more_pages, None)
+        if page is None:
+            self._more_pages = None
+            return
+        if not page:
+            return
+        first = len(self._tools)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._tools.extend(page)
+        for row in range(first, len(self._tools)):
+            self._rows[self._tools[row]["name"]] = row
+        self.endInsertRows()
+
+    def tools(self):
+        return self._tools
+
+    def row_of(self, tool_name):
+        return self._rows.get(tool_name, -1)
+
+    def tool_at(self, row):
+        return self._tools[row]
+
+    def upsert_tool(self, tool, row=None):
+        """Replace the tool with the same name, or insert it (at the end by default)"""
+        existing = self.row_of(tool["name"])
+        if existing >= 0:
+            self._tools[existing] = tool
+            index = self.index(existing)
+            self.dataChanged.emit(index, index)
+            return
+        row = len(self._tools) if row is None else row
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tools.insert(row, tool)
+        self._reindex()
+        self.endInsertRows()
+
+    def sync_tools(self, tools):
+        """
+        Bring the model to the given list with row removes, moves, inserts and
+        dataChanged instead of a reset, so scroll position and the hovered card survive
+        """
+        # The full list supersedes any pages not fetched yet
+        self._more_pages = None
+        names = {tool["name"] for tool in tools}
+        for tool in [tool for tool in self._tools if tool["name"] not in names]:
+            self.remove_tool(tool["name"])
+
+        for row, tool in enumerate(tools):
+            existing = self.row_of(tool["name"])
+            if existing < 0:
+                self.upsert_tool(tool, row)
+                continue
+            if existing != row:
+                # Rows before `row` are already in place, so this is always a move up
+                self.beginMoveRows(QModelIndex(), existing, existing, QModelIndex(), row)
+                self._tools.insert(row, self._tools.pop(existing))
+                self._reindex()
+                self.endMoveRows()
+            changed = self._tools[row] != tool
+            self._tools[row] = tool
+            if changed:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def remove_tool(self, tool_name):
+        row = self.row_of(tool_name)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tools[row]
+        self._reindex()
+        self.endRemoveRows()
+
+    def refresh_tool(self, tool_name):
+        """Repaint a tool whose external state (install/update status) changed"""
+        row = self.row_of(tool_name)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class _DelegateMeta(type(QStyledItemDelegate), ABCMeta):
+    """Lets a Qt class declare abstract methods"""
+
+
+class CardDelegate(QStyledItemDelegate, metaclass=_DelegateMeta):
+    """
+    Paints tool cards directly and only creates a real card widget (as a
+    persistent editor) for the hovered or focused card. Subclasses implement
+    paint_content() and create_card().
+    """
+
+    def __init__(self, card_size, spacing=20, parent=None):
+        super().__init__(parent)
+        self.card_size = card_size
+        self.spacing = spacing
+        self.border_pen = QPen(QColor("#444"), 1)
+        self.hover_pen = QPen(QColor(Settings.PRIMARY_COLOR), 1)
+        self.card_brush = QColor("#2a2a2a")
+
+    def sizeHint(self, option, index):
+        return QSize(self.card_size.width() + self.spacing, self.card_size.height() + self.spacing)
+
+    def card_rect(self, option_rect):
+        """The card area centered inside its grid cell"""
+        return QRect(
+            option_rect.x() + (option_rect.width() - self.card_size.width()) // 2,
+            option_rect.y() + (option_rect.height() - self.card_size.height()) // 2,
+            self.card_size.width(),
+            self.card_size.height(),
+        )
+
+    def paint(self, painter, option, index):
+        tool = index.data(ToolListModel.ToolRole)
+        if tool is None:
+            return
+        rect = self.card_rect(option.rect)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self.hover_pen if hovered else self.border_pen)
+        painter.setBrush(self.card_brush)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+        self.paint_content(painter, rect, tool)
+        painter.restore()
+
+    def paint_button(self, painter, rect, text, background, foreground, border=None):
+        painter.setPen(QPen(QColor(border), 1) if border else Qt.NoPen)
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(QRectF(rect), 6, 6)
+        painter.setPen(QColor(foreground))
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    @abstractmethod
+    def paint_content(self, painter, rect, tool):
+        """Paint the card's text, badges and buttons inside rect (the frame is already drawn)"""
+
+    @abstractmethod
+    def create_card(self, tool, parent):
+        """The live card widget shown over the hovered or focused card"""
+
+    def createEditor(self, parent, option, index):
+        return self.create_card(index.data(ToolListModel.ToolRole), parent)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(self.card_rect(option.rect))
+
+    def setEditorData(self, editor, index):
+        # Cards keep themselves current through ToolRepository signals
+        pass
+
+    def setModelData(self, editor, model, index):
+        pass
+
+
+class ToolGridView(QListView):
+    """
+    Virtualized card grid: a wrapping icon-mode list whose column count follows
+    the viewport width. At most two live card widgets exist at a time (hovered
+    and current), everything else is painted by the delegate.
+    """
+
+    def __init__(self, delegate, parent=None):
+        super().__init__(parent)
+        self.setItemDelegate(delegate)
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setGridSize(delegate.sizeHint(None, QModelIndex()))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(30)
+        self.setMouseTracking(True)
+        self.setObjectName("ToolGrid")
+
+        self._hover_index = QPersistentModelIndex()
+        self._current_index = QPersistentModelIndex()
+        self.entered.connect(self.on_entered)
+
+    def setModel(self, model):
+        super().setModel(model)
+        self.selectionModel().currentChanged.connect(self.on_current_changed)
+        model.modelAboutToBeReset.connect(self.close_cards)
+
+    def _swap_card(self, old_index, new_index):
+        if old_index.isValid() and old_index != new_index and \
+                old_index not in (self._hover_index, self._current_index):
+            self.closePersistentEditor(self.model().index(old_index.row(), 0))
+        if new_index.isValid() and not self.isPersistentEditorOpen(new_index):
+            self.openPersistentEditor(new_index)
+
+    def on_entered(self, index):
+        old_index, self._hover_index = self._hover_index, QPersistentModelIndex(index)
+        self._swap_card(old_index, index)
+
+    def on_current_changed(self, current, _previous):
+        old_index, self._current_index = self._current_index, QPersistentModelIndex(current)
+        self._swap_card(old_index, current)
+
+    def close_cards(self):
+        for index in (self._hover_index, self._current_index):
+            if index.isValid():
+                self.closePersistentEditor(self.model().index(index.row(), 0))
+        self._hover_index = QPersistentModelIndex()
+        self._current_index = QPersistentModelIndex()
+
+    def columns(self):
+        return max(1, self.viewport().width() // self.gridSize().width())
+
+    def visible_rows(self):
+        """Rows inside the viewport, computed from the uniform grid (no per-item geometry)"""
+        count = self.model().rowCount() if self.model() else 0
+        if count == 0:
+            return range(0)
+        line_height = self.gridSize().height()
+        first_line = self.verticalOffset() // line_height
+        last_line = (self.verticalOffset() + self.viewport().height()) // line_height
+        columns = self.columns()
+        return range(min(first_line * columns, count), min((last_line + 1) * columns, count))
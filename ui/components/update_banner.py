@@ -0,0 +1,51 @@
+from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+
+
+class UpdateBanner(QFrame):
+    """Non-modal strip above the views announcing a staged Triple V update"""
+
+    restart_clicked = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("UpdateBanner")
+        self.setFixedHeight(52)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(40, 8, 40, 8)
+        layout.setSpacing(10)
+
+        self.message_label = QLabel()
+        self.message_label.setFont(QFont("Segoe UI", 11))
+
+        self.restart_btn = QPushButton("Restart now")
+        self.restart_btn.setFixedHeight(32)
+        self.restart_btn.setCursor(Qt.PointingHandCursor)
+        self.restart_btn.setObjectName("PrimaryButton")
+        self.restart_btn.clicked.connect(self.restart_clicked.emit)
+
+        later_btn = QPushButton("Later")
+        later_btn.setFixedHeight(32)
+        later_btn.setCursor(Qt.PointingHandCursor)
+        later_btn.setObjectName("SecondaryButton")
+        later_btn.clicked.connect(self.hide)
+
+        layout.addWidget(self.message_label)
+        layout.addStretch()
+        layout.addWidget(self.restart_btn)
+        layout.addWidget(later_btn)
+
+        self.hide()
+
+    def show_version(self, version, can_restart=True):
+        """can_restart=False (running from source): the update is only installed next to the exe, nothing restarts"""
+        self.message_label.setText(f"Triple V v{version} is ready to install")
+        if can_restart:
+            self.restart_btn.setText("Restart now")
+            self.message_label.setToolTip("It is installed when you restart, or the next time Triple V starts")
+        else:
+            self.restart_btn.setText("Install")
+            self.message_label.setToolTip("The new exe is installed next to the current one; start it to use the update")
+        self.show()
@@ -17,13 +17,7 @@ class AboutDialog(QDialog):
 
     def init_ui(self):
         # Overall dialog style
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {Settings.SURFACE_COLOR};
-                border: 2px solid {Settings.PRIMARY_COLOR};
-                border-radius: 16px;
-            }}
-        """)
+        self.setObjectName("AboutDialog")
 
         # --- STEP 1: Create a QVBoxLayout for the dialog itself ---
         main_layout = QVBoxLayout(self)
@@ -48,14 +42,14 @@ class AboutDialog(QDialog):
         header = QLabel("About Triple V")
         header.setFont(QFont("Segoe UI", 24, QFont.Bold))
         header.setAlignment(Qt.AlignCenter)
-        header.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        header.setObjectName("AccentLabel")
         layout.addWidget(header)
 
         # Version info
         version_label = QLabel(f"Triple-V Platform - Version {Settings.APP_VERSION}")
         version_label.setFont(QFont("Segoe UI", 12))
         version_label.setAlignment(Qt.AlignCenter)
-        version_label.setStyleSheet("color: #ddd;")
+        version_label.setObjectName("LightLabel")
         layout.addWidget(version_label)
 
         # Developer info container
@@ -65,7 +59,7 @@ class AboutDialog(QDialog):
         dev_header = QLabel("Development Team")
         dev_header.setFont(QFont("Segoe UI", 16, QFont.Bold))
         dev_header.setAlignment(Qt.AlignCenter)
-        dev_header.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        dev_header.setObjectName("AccentLabel")
         dev_container.addWidget(dev_header)
 
         developers = [
@@ -77,7 +71,7 @@ class AboutDialog(QDialog):
             dev_label = QLabel(f"<b>{role}:</b> {name}")
             dev_label.setFont(QFont("Segoe UI", 11))
             dev_label.setAlignment(Qt.AlignCenter)
-            dev_label.setStyleSheet("color: #ccc;")
+            dev_label.setObjectName("LightLabel")
             dev_container.addWidget(dev_label)
 
         layout.addLayout(dev_container)
@@ -90,35 +84,36 @@ class AboutDialog(QDialog):
         description.setFont(QFont("Segoe UI", 11))
         description.setWordWrap(True)
         description.setAlignment(Qt.AlignCenter)
-        description.setStyleSheet("color: #aaa; line-height: 1.5;")
+        description.setObjectName("SecondaryLabel")
         layout.addWidget(description)
 
         # Copyright
         copyright_label = QLabel("© 2025 Triple V Platform. All rights reserved.")
         copyright_label.setFont(QFont("Segoe UI", 10))
         copyright_label.setAlignment(Qt.AlignCenter)
-        copyright_label.setStyleSheet("color: #888;")
+        copyright_label.setObjectName("MutedLabel")
         layout.addWidget(copyright_label)
 
         layout.addStretch()
 
-        # Close button
+        # Log and close buttons
+        buttons = QHBoxLayout()
+        buttons.setAlignment(Qt.AlignCenter)
+        log_btn = QPushButton("Show log")
+        log_btn.setFixedHeight(36)
+        log_btn.setCursor(Qt.PointingHandCursor)
+        log_btn.clicked.connect(self.show_log)
+        log_btn.setObjectName("OutlineButton")
+        buttons.addWidget(log_btn)
+
         close_btn = QPushButton("Close")
         close_btn.setFixedHeight(36)
         close_btn.setCursor(Qt.PointingHandCursor)
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 2px solid {Settings.PRIMARY_COLOR};
-                border-radius: 8px;
-                color: {Settings.PRIMARY_COLOR};
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {Settings.PRIMARY_COLOR};
-                color: {Settings.BACKGROUND_COLOR};
-            }}
-        """)
-        layout.addWidget(close_btn, alignment=Qt.AlignCenter)
+        close_btn.setObjectName("OutlineButton")
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def show_log(self):
+        from ui.dialogs.log_dialog import LogDialog
+        LogDialog(self).exec_()
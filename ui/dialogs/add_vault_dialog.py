@@ -3,17 +3,53 @@ from PyQt5.QtWidgets import (
     QLineEdit, QCheckBox, QPushButton, QMessageBox,
     QComboBox, QScrollArea, QWidget, QTextEdit
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont
 from config.settings import Settings
-import smtplib
+from utils.styles import set_state
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import re
-import keyring
+from utils.log import get_logger
+
+log = get_logger("vault")
+
+
+class RepoCheckSignals(QObject):
+    finished = pyqtSignal(int, object)  # check number, DownloadManager.inspect_repository() result
+
+
+class RepoCheckTask(QRunnable):
+    """Resolves the submitted repository on a pool thread; cancel() stops it between requests"""
+
+    def __init__(self, number, github_url, download_manager):
+        super().__init__()
+        self.number = number
+        self.github_url = github_url
+        self.download_manager = download_manager
+        self.cancelled = False
+        self.signals = RepoCheckSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.download_manager.inspect_repository(self.github_url, should_stop=lambda: self.cancelled)
+        except Exception as e:
+            result = {"status": "unreachable", "message": f"Could not check the repository: {e}"}
+        try:
+            self.signals.finished.emit(self.number, result)
+        except RuntimeError:
+            # The dialog was closed while the check was running
+            pass
+
 
 class AddVaultDialog(QDialog):
+    # Wait for typing to pause before resolving the repository
+    REPO_CHECK_DELAY_MS = 600
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Add to Vault")
@@ -26,6 +62,15 @@ class AddVaultDialog(QDialog):
         self.mail_regex = r'\b[A-Za-z0-9._%+-]+@vehiclevo\.(com|de)\b'
         self.url_regex = r'^(https?:\/\/)?github\.com\/[A-Za-z0-9_.-]+(?:\/[A-Za-z0-9_.-]+)?$'
 
+        # Background repository check of the GitHub URL (only the latest one counts)
+        self.repo_check_number = 0
+        self.repo_check_task = None
+        self.repo_status = None
+        self.repo_check_timer = QTimer(self)
+        self.repo_check_timer.setSingleShot(True)
+        self.repo_check_timer.setInterval(self.REPO_CHECK_DELAY_MS)
+        self.repo_check_timer.timeout.connect(self.start_repo_check)
+
         self.init_ui()
 
         # Adjust size based on screen
@@ -54,22 +99,7 @@ class AddVaultDialog(QDialog):
         scroll.setWidgetResizable(True)  # Let the content widget expand to the width
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)  # Always show scrollbar
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)  # No horizontal scroll
-        scroll.setStyleSheet("""
-        QScrollArea {
-            background-color: transparent;
-            border: none;
-        }
-        QScrollBar:vertical {
-            background-color: #2d2d2d;
-            width: 10px;
-            border-radius: 5px;
-        }
-        QScrollBar::handle:vertical {
-            background-color: #40E0D0;
-            border-radius: 5px;
-            min-height: 20px;
-        }
-    """)
+        scroll.setObjectName("FormScroll")
         main_layout.addWidget(scroll)
 
         # 3) Create a separate QWidget to hold all form content
@@ -85,7 +115,7 @@ class AddVaultDialog(QDialog):
         header = QLabel("Add to Vault")
         header.setFont(QFont("Segoe UI", 28, QFont.Bold))
         header.setAlignment(Qt.AlignCenter)
-        header.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        header.setObjectName("AccentLabel")
         layout.addWidget(header)
 
         # Add some vertical space after header
@@ -103,25 +133,7 @@ class AddVaultDialog(QDialog):
             checkbox = QCheckBox(text)
             checkbox.setFont(QFont("Segoe UI", 11))
             checkbox.stateChanged.connect(self.check_form_complete)
-            checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    color: {Settings.TEXT_COLOR};
-                    spacing: 10px;
-                    padding: 5px 0;
-                }}
-                /* Draw a light border so the user sees a checkbox box */
-                QCheckBox::indicator {{
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid {Settings.PRIMARY_COLOR};
-                    border-radius: 3px;
-                    background-color: {Settings.BACKGROUND_COLOR};
-                }}
-                /* When checked, let Qt draw the standard checkmark over the colored box */
-                QCheckBox::indicator:checked {{
-                    background-color: {Settings.PRIMARY_COLOR};
-                }}
-            """)
+            checkbox.setObjectName("ConfirmCheckBox")
             self.checkboxes.append(checkbox)
             layout.addWidget(checkbox)
         layout.addSpacing(15)
@@ -129,7 +141,7 @@ class AddVaultDialog(QDialog):
         # ----- CATEGORY DROPDOWN -----
         category_label = QLabel("Which Category")
         category_label.setFont(QFont("Segoe UI", 13, QFont.Bold))
-        category_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        category_label.setObjectName("AccentLabel")
         layout.addWidget(category_label)
 
         self.category_combo = QComboBox()
@@ -139,96 +151,46 @@ class AddVaultDialog(QDialog):
             "Generic Tools"
         ])
         self.category_combo.currentTextChanged.connect(self.check_form_complete)
-        self.category_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(255, 255, 255, 0.05);
-                border: 2px solid #444;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: {Settings.TEXT_COLOR};
-                font-size: 14px;
-                min-height: 25px;
-            }}
-            QComboBox:focus {{
-                border-color: {Settings.PRIMARY_COLOR};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 30px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid {Settings.PRIMARY_COLOR};
-                margin-right: 10px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {Settings.SURFACE_COLOR};
-                border: 1px solid {Settings.PRIMARY_COLOR};
-                selection-background-color: {Settings.PRIMARY_COLOR};
-                color: {Settings.TEXT_COLOR};
-            }}
-        """)
+        self.category_combo.setObjectName("FormInput")
         layout.addWidget(self.category_combo)
         layout.addSpacing(15)
 
         # ----- EMAIL INPUT -----
         email_label = QLabel("Your Email")
         email_label.setFont(QFont("Segoe UI", 13, QFont.Bold))
-        email_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        email_label.setObjectName("AccentLabel")
         layout.addWidget(email_label)
 
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("your.name@vehiclevo.com or @vehiclevo.de")
         self.email_input.textChanged.connect(self.check_form_complete)
-        self.email_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: rgba(255, 255, 255, 0.05);
-                border: 2px solid #444;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: {Settings.TEXT_COLOR};
-                font-size: 14px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Settings.PRIMARY_COLOR};
-                background-color: rgba(0, 255, 136, 0.05);
-            }}
-        """)
+        self.email_input.setObjectName("FormInput")
         layout.addWidget(self.email_input)
         layout.addSpacing(15)
 
         # ----- GITHUB URL INPUT -----
         github_label = QLabel("Link to GitHub Repository")
         github_label.setFont(QFont("Segoe UI", 13, QFont.Bold))
-        github_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        github_label.setObjectName("AccentLabel")
         layout.addWidget(github_label)
 
         self.github_input = QLineEdit()
         self.github_input.setPlaceholderText("https://github.com/username/repository")
+        self.github_input.textChanged.connect(self.on_github_url_changed)
         self.github_input.textChanged.connect(self.check_form_complete)
-        self.github_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: rgba(255, 255, 255, 0.05);
-                border: 2px solid #444;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: {Settings.TEXT_COLOR};
-                font-size: 14px;
-                min-height: 25px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Settings.PRIMARY_COLOR};
-                background-color: rgba(0, 255, 136, 0.05);
-            }}
-        """)
+        self.github_input.setObjectName("FormInput")
         layout.addWidget(self.github_input)
+
+        self.repo_check_label = QLabel("")
+        self.repo_check_label.setObjectName("RepoCheckLabel")
+        self.repo_check_label.setWordWrap(True)
+        self.repo_check_label.hide()
+        layout.addWidget(self.repo_check_label)
         layout.addSpacing(15)
 
         # ----- ERROR LABEL -----
         self.error_label = QLabel("")
-        self.error_label.setStyleSheet("color: #ff4444; font-size: 12px; padding: 5px 0;")
+        self.error_label.setObjectName("ErrorLabel")
         self.error_label.setWordWrap(True)
         self.error_label.hide()
         layout.addWidget(self.error_label)
@@ -238,55 +200,29 @@ class AddVaultDialog(QDialog):
         # ----- TOOL ICON -----
         icon_label = QLabel("Tool Icon (Emoji)")
         icon_label.setFont(QFont("Segoe UI", 13, QFont.Bold))
-        icon_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        icon_label.setObjectName("AccentLabel")
         layout.addWidget(icon_label)
 
         self.icon_input = QLineEdit()
         self.icon_input.setPlaceholderText("e.g., 🔧 or 📊 or 💻")
         self.icon_input.setMaxLength(2)  # Usually one emoji
         self.icon_input.textChanged.connect(self.check_form_complete)
-        self.icon_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: rgba(255, 255, 255, 0.05);
-                border: 2px solid #444;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: {Settings.TEXT_COLOR};
-                font-size: 20px;
-                min-height: 25px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Settings.PRIMARY_COLOR};
-                background-color: rgba(0, 255, 136, 0.05);
-            }}
-        """)
+        self.icon_input.setObjectName("FormInput")
+        self.icon_input.setProperty("state", "emoji")
         layout.addWidget(self.icon_input)
         layout.addSpacing(15)
 
         # ----- TOOL DESCRIPTION -----
         desc_label = QLabel("Tool Description")
         desc_label.setFont(QFont("Segoe UI", 13, QFont.Bold))
-        desc_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        desc_label.setObjectName("AccentLabel")
         layout.addWidget(desc_label)
 
         self.desc_input = QTextEdit()
         self.desc_input.setPlaceholderText("Brief description of what your tool does...")
         self.desc_input.setMaximumHeight(80)
         self.desc_input.textChanged.connect(self.check_form_complete)
-        self.desc_input.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: rgba(255, 255, 255, 0.05);
-                border: 2px solid #444;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: {Settings.TEXT_COLOR};
-                font-size: 14px;
-            }}
-            QTextEdit:focus {{
-                border-color: {Settings.PRIMARY_COLOR};
-                background-color: rgba(0, 255, 136, 0.05);
-            }}
-        """)
+        self.desc_input.setObjectName("FormInput")
         layout.addWidget(self.desc_input)
         layout.addSpacing(15)
         
@@ -300,60 +236,20 @@ class AddVaultDialog(QDialog):
         self.submit_btn.setFixedWidth(180)
         self.submit_btn.setEnabled(False)
         self.submit_btn.setCursor(Qt.PointingHandCursor)
+        self.submit_btn.setObjectName("SubmitButton")
         self.submit_btn.clicked.connect(self.submit_form)
-        self.update_submit_button_style()
 
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setFixedHeight(45)
         cancel_btn.setFixedWidth(180)
         cancel_btn.setCursor(Qt.PointingHandCursor)
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 2px solid {Settings.PRIMARY_COLOR};
-                border-radius: 8px;
-                color: {Settings.PRIMARY_COLOR};
-                font-weight: bold;
-                font-size: 15px;
-            }}
-            QPushButton:hover {{
-                background-color: {Settings.PRIMARY_COLOR};
-                color: {Settings.BACKGROUND_COLOR};
-            }}
-        """)
+        cancel_btn.setObjectName("OutlineButton")
 
         button_layout.addWidget(self.submit_btn)
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
 
-    def update_submit_button_style(self):
-        if self.submit_btn.isEnabled():
-            self.submit_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Settings.PRIMARY_COLOR};
-                    border: none;
-                    border-radius: 8px;
-                    color: {Settings.BACKGROUND_COLOR};
-                    font-size: 16px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: {Settings.SECONDARY_COLOR};
-                }}
-            """)
-        else:
-            self.submit_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #444;
-                    border: none;
-                    border-radius: 8px;
-                    color: #888;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
-    
 
     def check_form_complete(self):
         # Check that all checkboxes are checked
@@ -384,11 +280,57 @@ class AddVaultDialog(QDialog):
         else:
             self.error_label.hide()
 
-        # Enable submit only if everything is filled and valid
+        # Enable submit only if everything is filled and valid; an offline check does not block
         all_filled = bool(email and github_url and icon and description)
-        all_valid = bool(email_valid and url_valid)
+        all_valid = bool(email_valid and url_valid and self.repo_status in ("ok", "unreachable"))
         self.submit_btn.setEnabled(all_checked and all_filled and all_valid)
-        self.update_submit_button_style()
+
+    def on_github_url_changed(self, text):
+        """Drop the running check and schedule a new one once typing pauses"""
+        self.cancel_repo_check()
+        self.repo_status = None
+        if re.match(self.url_regex, text.strip()):
+            self.show_repo_check("Checking repository…", "checking")
+            self.repo_check_timer.start()
+        else:
+            self.repo_check_timer.stop()
+            self.repo_check_label.hide()
+
+    def cancel_repo_check(self):
+        if self.repo_check_task is not None:
+            self.repo_check_task.cancel()
+            self.repo_check_task = None
+
+    def start_repo_check(self):
+        from utils.tool_repository import ToolRepository
+        github_url = self.github_input.text().strip()
+        if not github_url.startswith(("http://", "https://")):
+            github_url = "https://" + github_url
+        self.repo_check_number += 1
+        self.repo_check_task = RepoCheckTask(self.repo_check_number, github_url,
+                                             ToolRepository.instance().download_manager)
+        self.repo_check_task.signals.finished.connect(self.on_repo_checked)
+        QThreadPool.globalInstance().start(self.repo_check_task)
+
+    def on_repo_checked(self, number, result):
+        if number != self.repo_check_number or result["status"] == "cancelled":
+            # Superseded by a newer URL
+            return
+        self.repo_check_task = None
+        self.repo_status = result["status"]
+        state, mark = {"ok": ("ok", "✓"), "unreachable": ("warning", "⚠")}.get(self.repo_status, ("error", "✗"))
+        self.show_repo_check(f"{mark} {result['message']}", state)
+        self.check_form_complete()
+
+    def show_repo_check(self, text, state):
+        self.repo_check_label.setText(text)
+        set_state(self.repo_check_label, state)
+        self.repo_check_label.show()
+
+    def done(self, result):
+        self.repo_check_timer.stop()
+        self.cancel_repo_check()
+        super().done(result)
 
     def submit_form(self):
         # Collect form data
@@ -401,40 +343,25 @@ class AddVaultDialog(QDialog):
 
         }
 
-        # Send email
-        if self.send_email(form_data):
-            # Show success label, then auto‐close
-            self.show_success_splash()
-            QTimer.singleShot(2000, self.accept)
-        else:
-            QMessageBox.warning(self, "Error", "Failed to send email. Please try again.")
-
-    def send_email(self, form_data):
-        """Send email with vault submission data."""
+        # Queued on disk and mailed in the background (with retries), so nothing blocks here
+        from utils.outbox import OutboxSender
+        subject, body = self.build_email(form_data)
         try:
-            # Email configuration (update with real SMTP settings)
-            smtp_server = "smtp.gmail.com"
-            smtp_port = 587
-            sender_email = "abdallahissa9800@gmail.com"
-            
-            # sender_password = ""
-            # I'll use library called Keyring here to not show my password in the code
-            # -> needs additional tweaks in the future to be sent from my veh email (TODO: contact IT guys)
-            
-            # Get password from system keyring
-            sender_password = keyring.get_password("Triple_V", sender_email)
-            print(f"sender password: {sender_password}")
-            if not sender_password:
-                print("Email password not found in keyring")
-                return False
-            recipient_email = "abdallah.issa@vehiclevo.com"
-
-            msg = MIMEMultipart()
-            msg['From'] = sender_email
-            msg['To'] = recipient_email
-            msg['Subject'] = f"New Tool Submission - {form_data['category']}"
-
-            body = f"""
+            OutboxSender.instance().enqueue(subject, body, Settings.SUBMISSION_RECIPIENT_EMAIL,
+                                            Settings.SUBMISSION_SENDER_EMAIL)
+        except OSError as e:
+            log.error("Failed to queue submission: %s", e)
+            QMessageBox.warning(self, "Error", f"Could not save your submission: {e}")
+            return
+
+        self.show_success_splash()
+        self.accept()
+
+    @staticmethod
+    def build_email(form_data):
+        """(subject, body) of the submission email sent to the reviewers"""
+        subject = f"New Tool Submission - {form_data['category']}"
+        body = f"""
             New Tool Submission to Triple V Vault
             =====================================
 
@@ -456,34 +383,17 @@ class AddVaultDialog(QDialog):
             Triple V Platform
             Automated Submission System
             """
-            msg.attach(MIMEText(body, 'plain'))
-
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(sender_email, sender_password)
-                server.send_message(msg)
-
-            print(f"Email sent successfully for: {form_data}")
-            return True
-
-        except Exception as e:
-            print(f"Failed to send email: {e}")
-            return False
+        return subject, body
 
     def show_success_splash(self):
-        splash = QLabel("✓ Successfully Added to Vault!", self)
+        # Shown over the main window, the dialog closes right away
+        host = self.parentWidget() or self
+        splash = QLabel("✓ Submitted to Vault!", host)
         splash.setAlignment(Qt.AlignCenter)
         splash.setFont(QFont("Segoe UI", 20, QFont.Bold))
-        splash.setStyleSheet(f"""
-            QLabel {{
-                background-color: {Settings.PRIMARY_COLOR};
-                color: {Settings.BACKGROUND_COLOR};
-                padding: 40px 60px;
-                border-radius: 16px;
-            }}
-        """)
+        splash.setObjectName("SplashLabel")
         splash.resize(400, 100)
-        # Center the splash inside the dialog’s 550×600 area
-        splash.move((550 - splash.width()) // 2, (600 - splash.height()) // 2)
+        splash.move((host.width() - splash.width()) // 2, (host.height() - splash.height()) // 2)
         splash.show()
         splash.raise_()
+        QTimer.singleShot(2000, splash.deleteLater)
@@ -0,0 +1,60 @@
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QApplication
+from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtGui import QFont, QDesktopServices
+from config.settings import Settings
+from utils.log import recent_lines
+
+
+class LogDialog(QDialog):
+    """Read-only view of the recent log records kept in memory, newest at the bottom"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Triple V Log")
+        self.setObjectName("LogDialog")
+        self.resize(900, 550)
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        self.log_view = QPlainTextEdit()
+        self.log_view.setObjectName("LogView")
+        self.log_view.setReadOnly(True)
+        self.log_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_view.setFont(QFont("Consolas", 9))
+        self.log_view.setMaximumBlockCount(Settings.LOG_RING_BUFFER_SIZE)
+        layout.addWidget(self.log_view)
+
+        buttons = QHBoxLayout()
+        for text, slot in (("Refresh", self.refresh), ("Copy", self.copy),
+                           ("Open log folder", self.open_log_folder)):
+            btn = QPushButton(text)
+            btn.setFixedHeight(36)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setObjectName("OutlineButton")
+            btn.clicked.connect(slot)
+            buttons.addWidget(btn)
+        buttons.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.setFixedHeight(36)
+        close_btn.setCursor(Qt.PointingHandCursor)
+        close_btn.setObjectName("OutlineButton")
+        close_btn.clicked.connect(self.accept)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def refresh(self):
+        self.log_view.setPlainText("\n".join(recent_lines()))
+        scroll_bar = self.log_view.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def copy(self):
+        QApplication.clipboard().setText(self.log_view.toPlainText())
+
+    def open_log_folder(self):
+        Settings.LOG_DIR.mkdir(parents=True, exist_ok=True)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(Settings.LOG_DIR)))
@@ -1,18 +1,22 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QStackedWidget, QLabel, QGraphicsDropShadowEffect, QMessageBox)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, QThread
-from PyQt5.QtGui import QColor, QPalette
-from PyQt5.QtSvg import QSvgWidget
+                            QPushButton, QStackedWidget, QLabel, QGraphicsDropShadowEffect, QMessageBox,
+                            QLineEdit, QShortcut, QApplication)
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, QThread, QEvent
+from PyQt5.QtGui import QColor, QPalette, QKeySequence
 from config.settings import Settings
 from ui.sidebar import Sidebar
 from ui.views.main_view import MainView
 from ui.views.tools_view import ToolsView
-from ui.dialogs.add_vault_dialog import AddVaultDialog
-from ui.dialogs.about_dialog import AboutDialog
-from utils.update_manager import UpdateManager
-import webbrowser
+from utils.startup_profiler import profiler
+from utils.tool_repository import ToolRepository
+import time
 from PyQt5.QtWidgets import QDesktopWidget
 from ui.views.my_tools_view import MyToolsView
+from ui.views.search_view import SearchView
+from ui.components.update_banner import UpdateBanner
+from utils.log import get_logger, start_log_writer
+
+log = get_logger("ui")
 
 class UpdateCheckThread(QThread):
     update_available = pyqtSignal(str, dict)  # version, release_data
@@ -27,16 +31,58 @@ class UpdateCheckThread(QThread):
             if has_update:
                 self.update_available.emit(latest_version, release_data)
         except Exception as e:
-            print(f"Update check failed: {e}")
+            log.warning("Update check failed: %s", e)
+
+
+class UpdateStageThread(QThread):
+    """Downloads and verifies an app update in background; run at lowest priority"""
+    staged = pyqtSignal(str)  # version
+
+    def __init__(self, update_manager, latest_version, release_data):
+        super().__init__()
+        self.update_manager = update_manager
+        self.latest_version = latest_version
+        self.release_data = release_data
+
+    def run(self):
+        manifest = self.update_manager.stage_update(
+            self.latest_version, self.release_data, should_stop=self.isInterruptionRequested
+        )
+        if manifest:
+            self.staged.emit(manifest["version"])
+
+
+class ColdStorageThread(QThread):
+    def __init__(self, supervisor, parent=None):
+        super().__init__(parent)
+        self.supervisor = supervisor
+
+    def run(self):
+        try:
+            from utils.cold_storage import ColdStorage
+            archived = ColdStorage(is_running=self.supervisor.is_running).apply_policy()
+            if archived:
+                log.info("Moved to cold storage: %s", ", ".join(archived))
+        except Exception as e:
+            log.error("Cold storage pass failed: %s", e)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, startup_time=None):
         super().__init__()
-        self.update_manager = UpdateManager()
+        # perf_counter() at process start, used for the time-to-first-paint report
+        self.startup_time = startup_time if startup_time is not None else time.perf_counter()
+        self.first_paint_done = False
+        self.update_manager = None
+        self.update_stage_thread = None
+        QApplication.instance().aboutToQuit.connect(self.stop_update_staging)
         self.init_ui()
         # Start automatic update check after UI is ready
         QTimer.singleShot(2000, self.check_updates_automatically)
+        # Re-check the state restored from the last session
+        QTimer.singleShot(500, self.reconcile_state)
+        # Archive rarely used tools once the app has settled
+        QTimer.singleShot(10000, self.apply_cold_storage_policy)
         
     def init_ui(self):
         self.setWindowTitle(Settings.APP_NAME)
@@ -68,34 +114,122 @@ class MainWindow(QMainWindow):
         main_layout.setSpacing(0)
         
         # Sidebar
-        self.sidebar = Sidebar()
+        with profiler.span("Build sidebar"):
+            self.sidebar = Sidebar()
         # FIX: Connect the navigation signal to the handler
         self.sidebar.navigation_clicked.connect(self.on_navigation_clicked)
         main_layout.addWidget(self.sidebar)
         
-        # Content area
+        # Content area: global search box above the views
+        content_area = QWidget()
+        content_layout = QVBoxLayout(content_area)
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(0)
+        content_layout.addWidget(self.create_search_bar())
+
+        self.update_banner = UpdateBanner()
+        self.update_banner.restart_clicked.connect(self.restart_to_update)
+        content_layout.addWidget(self.update_banner)
+
         self.content_stack = QStackedWidget()
-        main_layout.addWidget(self.content_stack)
+        content_layout.addWidget(self.content_stack)
+        main_layout.addWidget(content_area)
         
-        # Views
-        self.main_view = MainView()
+        # Views: Home is built right away, the others on first navigation
+        with profiler.span("Build view main"):
+            self.main_view = MainView()
         self.main_view.add_vault_clicked.connect(self.show_add_vault_dialog)
         self.main_view.about_clicked.connect(self.show_about_dialog)
         
-        self.Classical_AUTOSAR = ToolsView("Classical AUTOSAR Tools", "Classical_AUTOSAR")
-        self.Adaptive_AUTOSAR_view = ToolsView("Adaptive AUTOSAR Tools", "Adaptive_AUTOSAR")
-        self.generic_view = ToolsView("Generic Tools", "generic")
-        self.my_tools_view = MyToolsView()
+        self.view_factories = {
+            "Classical_AUTOSAR": lambda: ToolsView("Classical AUTOSAR Tools", "Classical_AUTOSAR"),
+            "Adaptive_AUTOSAR": lambda: ToolsView("Adaptive AUTOSAR Tools", "Adaptive_AUTOSAR"),
+            "generic": lambda: ToolsView("Generic Tools", "generic"),
+            "My downloaded Tools": MyToolsView,
+        }
+        self.views = {"main": self.main_view}
+        self.search_view = None
+        self.view_before_search = None
         
         # Add views to stack
         self.content_stack.addWidget(self.main_view)
-        self.content_stack.addWidget(self.Classical_AUTOSAR)
-        self.content_stack.addWidget(self.Adaptive_AUTOSAR_view)
-        self.content_stack.addWidget(self.generic_view)
-        self.content_stack.addWidget(self.my_tools_view)
         
         # Set initial view
         self.content_stack.setCurrentWidget(self.main_view)
+
+        # Report time-to-first-paint once the Home view is drawn
+        self.main_view.installEventFilter(self)
+        
+    def create_search_bar(self):
+        search_bar = QWidget()
+        search_layout = QHBoxLayout(search_bar)
+        search_layout.setContentsMargins(40, 20, 40, 0)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search tools by name, description or category…  (Ctrl+F)")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setFixedHeight(40)
+        self.search_input.setObjectName("SearchInput")
+        self.search_input.textChanged.connect(self.on_search_text_changed)
+        search_layout.addWidget(self.search_input)
+
+        QShortcut(QKeySequence.Find, self, activated=self.focus_search)
+        QShortcut(QKeySequence(Qt.Key_Escape), self.search_input, activated=self.search_input.clear)
+        return search_bar
+
+    def focus_search(self):
+        self.search_input.setFocus()
+        self.search_input.selectAll()
+
+    def on_search_text_changed(self, text):
+        """Answer every keystroke from the in-memory index; clearing returns to the previous view"""
+        if text.strip():
+            if self.search_view is None:
+                self.search_view = SearchView()
+                self.content_stack.addWidget(self.search_view)
+            if self.content_stack.currentWidget() is not self.search_view:
+                self.view_before_search = self.content_stack.currentWidget()
+            started = time.perf_counter()
+            self.search_view.set_query(text)
+            log.debug("Search %r answered in %.1f ms", text, (time.perf_counter() - started) * 1000)
+            self.content_stack.setCurrentWidget(self.search_view)
+        elif self.content_stack.currentWidget() is self.search_view:
+            self.content_stack.setCurrentWidget(self.view_before_search or self.main_view)
+            self.view_before_search = None
+
+    def get_view(self, view_name):
+        """Return the view for a navigation id, building it on first use"""
+        view = self.views.get(view_name)
+        if view is None and view_name in self.view_factories:
+            started = time.perf_counter()
+            with profiler.span(f"Build view {view_name}"):
+                view = self.view_factories[view_name]()
+            self.views[view_name] = view
+            self.content_stack.addWidget(view)
+            log.info("Built view %s in %.0f ms", view_name, (time.perf_counter() - started) * 1000)
+        return view
+
+    def prebuild_views(self):
+        """Build the remaining views one per idle tick so the UI stays responsive"""
+        pending = [name for name in self.view_factories if name not in self.views]
+        if pending:
+            self.get_view(pending[0])
+            QTimer.singleShot(0, self.prebuild_views)
+
+    def eventFilter(self, watched, event):
+        if watched is self.main_view and event.type() == QEvent.Paint and not self.first_paint_done:
+            self.first_paint_done = True
+            self.main_view.removeEventFilter(self)
+            elapsed = (time.perf_counter() - self.startup_time) * 1000
+            log.info("Time to first paint: %.0f ms", elapsed)
+            if profiler.enabled:
+                profiler.mark("First paint")
+                profiler.stop()
+                report_path, trace_path = profiler.write(Settings.EXE_DIR)
+                log.info("Startup profile written to %s and %s\n%s", report_path, trace_path, profiler.report())
+            if Settings.PREBUILD_VIEWS_ON_IDLE:
+                QTimer.singleShot(0, self.prebuild_views)
+        return super().eventFilter(watched, event)
         
     def set_dark_palette(self):
         dark_palette = QPalette()
@@ -115,40 +249,101 @@ class MainWindow(QMainWindow):
         self.setPalette(dark_palette)
         
     def on_navigation_clicked(self, view_name):
-        print(f"Switching to view: {view_name}")  # Debug line
-        if view_name == "main":
-            self.content_stack.setCurrentWidget(self.main_view)
-        elif view_name == "Classical_AUTOSAR":
-            self.content_stack.setCurrentWidget(self.Classical_AUTOSAR)
-        elif view_name == "Adaptive_AUTOSAR":
-            self.content_stack.setCurrentWidget(self.Adaptive_AUTOSAR_view)
-        elif view_name == "generic":
-            self.content_stack.setCurrentWidget(self.generic_view)
-        elif view_name == "My downloaded Tools":  # FIX: Match the nav_id from sidebar
-            self.content_stack.setCurrentWidget(self.my_tools_view)
-            if hasattr(self.my_tools_view, 'refresh_tools'):
-                self.my_tools_view.refresh_tools()
+        log.debug("Switching to view: %s", view_name)
+        view = self.get_view(view_name)
+        if view is not None:
+            # Navigating away from the results ends the search
+            self.view_before_search = None
+            self.search_input.blockSignals(True)
+            self.search_input.clear()
+            self.search_input.blockSignals(False)
+            # MyToolsView watches the registry itself and only syncs on change
+            self.content_stack.setCurrentWidget(view)
             
     def show_add_vault_dialog(self):
+        from ui.dialogs.add_vault_dialog import AddVaultDialog
         dialog = AddVaultDialog(self)
         dialog.exec_()
         
     def show_about_dialog(self):
+        from ui.dialogs.about_dialog import AboutDialog
         dialog = AboutDialog(self)
         dialog.exec_()
     
     def check_updates_automatically(self):
         """Check for updates automatically in background"""
+        from utils.update_manager import UpdateManager
+        from utils.update_staging import UpdateStaging
+        # Staged by an earlier session but not applied yet (e.g. running from source)
+        staged_version = UpdateStaging().pending_version()
+        if staged_version:
+            self.show_update_notification(staged_version)
+
+        self.update_manager = UpdateManager()
         self.update_thread = UpdateCheckThread(self.update_manager)
-        self.update_thread.update_available.connect(self.show_update_notification)
+        self.update_thread.update_available.connect(self.stage_update)
         self.update_thread.start()
+
+    def stage_update(self, latest_version, release_data):
+        """Pre-download the new release at low priority; the user is only told once it's ready"""
+        if self.update_stage_thread is not None and self.update_stage_thread.isRunning():
+            return
+        self.update_stage_thread = UpdateStageThread(self.update_manager, latest_version, release_data)
+        self.update_stage_thread.staged.connect(self.show_update_notification)
+        self.update_stage_thread.start(QThread.LowestPriority)
+
+    def stop_update_staging(self):
+        if self.update_stage_thread is not None and self.update_stage_thread.isRunning():
+            self.update_stage_thread.requestInterruption()
+            self.update_stage_thread.wait(3000)
         
-    def show_update_notification(self, latest_version, release_data):
-        """Show update notification only if update is available"""
-        reply = QMessageBox.question(
-            self, "Update Available", 
-            f"Triple V v{latest_version} is available!\n\nWould you like to download and install it now?",
-            QMessageBox.Yes | QMessageBox.No
+    def reconcile_state(self):
+        start_log_writer()
+        repository = ToolRepository.instance()
+        repository.reconcile()
+        repository.catalog_sync.start()
+        repository.update_stager.start()
+        # Deliver vault submissions left over from earlier sessions
+        from utils.outbox import OutboxSender
+        outbox_sender = OutboxSender.instance()
+        outbox_sender.gave_up.connect(self.show_submission_failed)
+        outbox_sender.start()
+
+    def show_submission_failed(self, subject, error):
+        """A vault submission that will not be retried (no credential, rejected, out of attempts)"""
+        QMessageBox.warning(
+            self, "Submission Not Sent",
+            f"Your vault submission \"{subject}\" could not be sent and will not be retried:\n\n{error}\n\n"
+            f"It is kept in {Settings.OUTBOX_DIR} as a .failed file."
         )
-        if reply == QMessageBox.Yes:
-            self.update_manager.show_update_dialog(self, latest_version, release_data)
\ No newline at end of file
+
+    def apply_cold_storage_policy(self):
+        """Compress tools that haven't been run for a while, in background"""
+        if not Settings.COLD_STORAGE_ENABLED:
+            return
+        self.cold_storage_thread = ColdStorageThread(ToolRepository.instance().supervisor)
+        self.cold_storage_thread.start()
+        
+    def show_update_notification(self, version):
+        """Non-modal banner; the staged update is applied on restart or next launch"""
+        from utils.update_staging import UpdateStaging
+        self.update_banner.show_version(version, UpdateStaging.can_relaunch())
+
+    def restart_to_update(self):
+        """Swap in the staged exe, start it and quit; from source, only install it"""
+        from utils.update_staging import UpdateStaging
+        relaunch = UpdateStaging.can_relaunch()
+        try:
+            new_exe = UpdateStaging().apply(relaunch=relaunch)
+        except Exception as e:
+            log.error("Could not apply update: %s", e)
+            QMessageBox.warning(self, "Update Failed", f"Could not install the update:\n{e}")
+            return
+        self.update_banner.hide()
+        if new_exe is None:
+            return
+        if relaunch:
+            QApplication.instance().quit()
+        else:
+            # Nothing would start the new exe, so keep this session running
+            QMessageBox.information(self, "Update Installed", f"The update was installed as:\n{new_exe}")
\ No newline at end of file
@@ -1,7 +1,10 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect
-from PyQt5.QtGui import QPainter, QColor, QFont
+from PyQt5.QtGui import QPainter, QColor, QFont, QPixmap
 from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("ui")
 
 class SidebarButton(QPushButton):
     def __init__(self, text, icon="", parent=None):
@@ -11,29 +14,50 @@ class SidebarButton(QPushButton):
         self.setFixedHeight(50)
         self.setCursor(Qt.PointingHandCursor)
         
+        # Paint resources, built once instead of on every repaint
+        self.icon_font = QFont("Segoe UI Emoji", 20)
+        self.text_font = QFont("Segoe UI", 11)
+        self.highlight_color = QColor(0, 255, 136, 30)
+        self.accent_color = QColor(Settings.PRIMARY_COLOR)
+        self.text_color = QColor(Settings.TEXT_COLOR)
+        self.icon_pixmap = None
+        
+    def render_icon(self):
+        """Emoji glyph rendered once into a pixmap (emoji shaping is the slow part)"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(40 * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.icon_font)
+        painter.setPen(self.accent_color)
+        painter.drawText(QRect(0, 0, 40, self.height()), Qt.AlignCenter, self.icon)
+        painter.end()
+        return pixmap
+        
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Background on hover/active
         if self.isChecked() or self.underMouse():
-            painter.fillRect(self.rect(), QColor(0, 255, 136, 30))
+            painter.fillRect(self.rect(), self.highlight_color)
             
         # Active indicator
         if self.isChecked():
-            painter.fillRect(0, 0, 3, self.height(), QColor(Settings.PRIMARY_COLOR))
+            painter.fillRect(0, 0, 3, self.height(), self.accent_color)
             
         # Icon
         if self.icon:
-            painter.setFont(QFont("Segoe UI Emoji", 20))
-            painter.setPen(QColor(Settings.PRIMARY_COLOR))
-            icon_rect = QRect(10, 0, 40, self.height())
-            painter.drawText(icon_rect, Qt.AlignCenter, self.icon)
+            if self.icon_pixmap is None or self.icon_pixmap.devicePixelRatioF() != self.devicePixelRatioF():
+                self.icon_pixmap = self.render_icon()
+            painter.drawPixmap(10, 0, self.icon_pixmap)
             
         # Text (only when expanded)
         if self.width() > 100:
-            painter.setFont(QFont("Segoe UI", 11))
-            painter.setPen(QColor(Settings.TEXT_COLOR))
+            painter.setFont(self.text_font)
+            painter.setPen(self.text_color)
             text_rect = QRect(60, 0, self.width() - 70, self.height())
             painter.drawText(text_rect, Qt.AlignVCenter, self.text_label)
 
@@ -43,15 +67,13 @@ class Sidebar(QWidget):
     def __init__(self):
         super().__init__()
         self.expanded = False
+        self.background_color = QColor("#151515")
+        self.accent_color = QColor(Settings.PRIMARY_COLOR)
         self.init_ui()
         
     def init_ui(self):
         self.setFixedWidth(Settings.SIDEBAR_WIDTH)
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: #151515;
-            }}
-        """)
+        self.setObjectName("Sidebar")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -61,13 +83,8 @@ class Sidebar(QWidget):
         self.toggle_btn = QPushButton()
         self.toggle_btn.setFixedSize(60, 60)
         self.toggle_btn.setCursor(Qt.PointingHandCursor)
+        self.toggle_btn.setObjectName("SidebarToggle")
         self.toggle_btn.clicked.connect(self.toggle_sidebar)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-            }
-        """)
         layout.addWidget(self.toggle_btn)
         
         # Navigation buttons
@@ -92,7 +109,7 @@ class Sidebar(QWidget):
                 btn.setChecked(True)
             layout.addWidget(btn)
             self.nav_buttons.append(btn)
-            print(f"Added nav button: {nav_id}")  # Debug line
+            log.debug("Added nav button: %s", nav_id)
             
         layout.addStretch()
         
@@ -114,7 +131,7 @@ class Sidebar(QWidget):
         sender = self.sender()
         if sender:
             nav_id = sender.property("nav_id")
-            print(f"Navigation clicked: {nav_id}")  # Debug line
+            log.debug("Navigation clicked: %s", nav_id)
             
             # Uncheck all buttons
             for btn in self.nav_buttons:
@@ -128,11 +145,11 @@ class Sidebar(QWidget):
         
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor("#151515"))
+        painter.fillRect(self.rect(), self.background_color)
         
         # Draw hamburger menu
-        painter.setPen(QColor(Settings.PRIMARY_COLOR))
-        painter.setBrush(QColor(Settings.PRIMARY_COLOR))
+        painter.setPen(self.accent_color)
+        painter.setBrush(self.accent_color)
         
         x, y = 20, 25
         bar_height = 3
@@ -1,9 +1,17 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QRect, QSize
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QApplication
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QRect, QSize, QEvent
 from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QFont, QPixmap, QMovie
 from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("ui")
 
 class AnimatedLogo(QWidget):
+    """
+    Logo GIF with a rotating shine. Both only run while the logo can actually
+    be seen: visible, window not minimized and the application active.
+    """
+
     def __init__(self):
         super().__init__()
         self.setFixedSize(200, 200)
@@ -15,10 +23,11 @@ class AnimatedLogo(QWidget):
         
         gif_path = Settings.ASSETS_DIR / "triple_v_pulse.gif"
         if gif_path.exists():
-            self.movie = QMovie(str(gif_path))
+            self.movie = QMovie(str(gif_path), parent=self)
+            # Decode each frame once instead of on every loop of the animation
+            self.movie.setCacheMode(QMovie.CacheAll)
             self.movie.setScaledSize(QSize(180, 180))
             self.movie.frameChanged.connect(self.update)
-            self.movie.start()
         elif Settings.LOGO_PATH.exists():
             try:
                 self.logo_pixmap = QPixmap(str(Settings.LOGO_PATH))
@@ -27,12 +36,20 @@ class AnimatedLogo(QWidget):
                 else:
                     self.logo_pixmap = None
             except Exception as e:
-                print(f"Error loading logo: {e}")
+                log.warning("Error loading logo: %s", e)
         
-        # Animation timer
-        self.timer = QTimer()
+        # Shine gradient, built once and rotated by the painter
+        self.shine_gradient = QLinearGradient(-100, -100, 100, 100)
+        self.shine_gradient.setColorAt(0, QColor(255, 255, 255, 0))
+        self.shine_gradient.setColorAt(0.5, QColor(255, 255, 255, 30))
+        self.shine_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        
+        # Animation timer, started by update_running() once the logo is shown
+        self.timer = QTimer(self)
+        self.timer.setInterval(50)
         self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)
+        self.watched_window = None
+        QApplication.instance().applicationStateChanged.connect(self.update_running)
         
         # Float animation
         self.float_animation = QPropertyAnimation(self, b"geometry")
@@ -42,12 +59,53 @@ class AnimatedLogo(QWidget):
     def update_animation(self):
         self.angle = (self.angle + 2) % 360
         self.update()
+
+    def should_run(self):
+        window = self.window()
+        return (
+            self.isVisible()
+            and not window.isMinimized()
+            and QApplication.applicationState() == Qt.ApplicationActive
+        )
+
+    def update_running(self, *_args):
+        """Start or pause the timer and GIF to match whether the logo can be seen"""
+        running = self.should_run()
+        if running and not self.timer.isActive():
+            self.timer.start()
+        elif not running and self.timer.isActive():
+            self.timer.stop()
+        if self.movie:
+            if running and self.movie.state() == QMovie.NotRunning:
+                self.movie.start()
+            else:
+                self.movie.setPaused(not running)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Minimizing doesn't hide child widgets, so follow the window state too
+        window = self.window()
+        if window is not self.watched_window:
+            if self.watched_window is not None:
+                self.watched_window.removeEventFilter(self)
+            window.installEventFilter(self)
+            self.watched_window = window
+        self.update_running()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_running()
+
+    def eventFilter(self, watched, event):
+        if watched is self.watched_window and event.type() == QEvent.WindowStateChange:
+            self.update_running()
+        return super().eventFilter(watched, event)
         
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        if self.movie and self.movie.state() == QMovie.Running:
+        if self.movie and self.movie.state() != QMovie.NotRunning:
             # Draw the current frame of the GIF
             pixmap = self.movie.currentPixmap()
             x = (self.width() - pixmap.width()) // 2
@@ -64,12 +122,7 @@ class AnimatedLogo(QWidget):
         painter.translate(self.width()/2, self.height()/2)
         painter.rotate(self.angle)
         
-        shine_gradient = QLinearGradient(-100, -100, 100, 100)
-        shine_gradient.setColorAt(0, QColor(255, 255, 255, 0))
-        shine_gradient.setColorAt(0.5, QColor(255, 255, 255, 30))
-        shine_gradient.setColorAt(1, QColor(255, 255, 255, 0))
-        
-        painter.setBrush(shine_gradient)
+        painter.setBrush(self.shine_gradient)
         painter.setPen(Qt.NoPen)
         painter.drawRect(-150, -10, 300, 20)
         painter.restore()
@@ -81,30 +134,34 @@ class StyledButton(QPushButton):
         self.setFixedSize(200, 60)
         self.setCursor(Qt.PointingHandCursor if enabled else Qt.ForbiddenCursor)
         
+        # Paint resources, built once (the button has a fixed size)
+        self.text_font = QFont("Segoe UI", 14, QFont.Bold)
+        self.gradient = QLinearGradient(0, 0, self.width(), self.height())
+        self.gradient.setColorAt(0, QColor(42, 42, 42))
+        self.gradient.setColorAt(1, QColor(58, 58, 58))
+        self.hover_color = QColor(Settings.PRIMARY_COLOR)
+        self.border_color = QColor(Settings.PRIMARY_COLOR).darker()
+        self.text_color = QColor(Settings.TEXT_COLOR)
+        self.disabled_color = QColor(100, 100, 100)
+        self.disabled_background = QColor(40, 40, 40)
+        
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Button background
         if self.isEnabled():
-            gradient = QLinearGradient(0, 0, self.width(), self.height())
-            gradient.setColorAt(0, QColor(42, 42, 42))
-            gradient.setColorAt(1, QColor(58, 58, 58))
-            painter.setBrush(gradient)
-            
-            if self.underMouse():
-                painter.setPen(QColor(Settings.PRIMARY_COLOR))
-            else:
-                painter.setPen(QColor(Settings.PRIMARY_COLOR).darker())
+            painter.setBrush(self.gradient)
+            painter.setPen(self.hover_color if self.underMouse() else self.border_color)
         else:
-            painter.setBrush(QColor(40, 40, 40))
-            painter.setPen(QColor(100, 100, 100))
+            painter.setBrush(self.disabled_background)
+            painter.setPen(self.disabled_color)
             
         painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 12, 12)
         
         # Button text
-        painter.setPen(QColor(Settings.TEXT_COLOR) if self.isEnabled() else QColor(100, 100, 100))
-        painter.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        painter.setPen(self.text_color if self.isEnabled() else self.disabled_color)
+        painter.setFont(self.text_font)
         painter.drawText(self.rect(), Qt.AlignCenter, self.text())
 
 class MainView(QWidget):
@@ -1,15 +1,43 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, 
-                            QGridLayout, QLabel, QPushButton, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox
+from PyQt5.QtCore import Qt, pyqtSignal, QThread
 from PyQt5.QtGui import QFont
-from config.settings import Settings
-from ui.components.my_tool_card import MyToolCard
-import json
+from ui.components.my_tool_card import MyToolCardDelegate
+from ui.components.tool_grid import ToolListModel, ToolGridView
+from utils.tool_repository import ToolRepository
+from pathlib import Path
+from utils.log import get_logger
+
+log = get_logger("tools")
+
+class VerifyToolsThread(QThread):
+    verification_done = pyqtSignal(dict)  # tool_name -> result
+    verification_failed = pyqtSignal(str)  # error message
+    
+    def run(self):
+        try:
+            from utils.integrity import IntegrityChecker
+            results = IntegrityChecker().verify_all()
+        except Exception as e:
+            log.error("Verification failed: %s", e)
+            self.verification_failed.emit(str(e))
+            return
+        self.verification_done.emit(results)
+
 
 class MyToolsView(QWidget):
     def __init__(self):
         super().__init__()
+        # The repository watches the registry and downloads folder for us
+        self.repository = ToolRepository.instance()
         self.init_ui()
+        self.repository.tool_installed.connect(self.sync_tools)
+        self.repository.tool_removed.connect(self.sync_tools)
+        self.repository.tool_changed.connect(self.sync_tools)
+        # Running indicator and CPU/RSS on the painted cards
+        supervisor = self.repository.supervisor
+        supervisor.process_started.connect(self.model.refresh_tool)
+        supervisor.process_exited.connect(self.model.refresh_tool)
+        supervisor.stats_updated.connect(self.model.refresh_tool)
         
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -20,86 +48,87 @@ class MyToolsView(QWidget):
         
         title_label = QLabel("My Downloaded Tools")
         title_label.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        title_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        title_label.setObjectName("AccentLabel")
         
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.setFixedSize(100, 40)
         refresh_btn.setCursor(Qt.PointingHandCursor)
         refresh_btn.clicked.connect(self.refresh_tools)
-        refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 2px solid {Settings.PRIMARY_COLOR};
-                border-radius: 8px;
-                color: {Settings.PRIMARY_COLOR};
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Settings.PRIMARY_COLOR};
-                color: {Settings.BACKGROUND_COLOR};
-            }}
-        """)
+        refresh_btn.setObjectName("OutlineButton")
+        
+        self.verify_btn = QPushButton("🩺 Verify")
+        self.verify_btn.setFixedSize(100, 40)
+        self.verify_btn.setCursor(Qt.PointingHandCursor)
+        self.verify_btn.setToolTip("Check installed files against their install manifest")
+        self.verify_btn.clicked.connect(self.verify_tools)
+        self.verify_btn.setObjectName("OutlineButton")
         
         header_layout.addWidget(title_label)
         header_layout.addStretch()
+        header_layout.addWidget(self.verify_btn)
         header_layout.addWidget(refresh_btn)
         
         layout.addLayout(header_layout)
         
-        # Scroll area for tools
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #40E0D0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-        """)
-        
-        self.tools_container = QWidget()
-        self.tools_layout = QGridLayout(self.tools_container)
-        self.tools_layout.setSpacing(20)
-        
-        scroll_area.setWidget(self.tools_container)
-        layout.addWidget(scroll_area)
+        # Virtualized card grid; columns follow the available width
+        self.model = ToolListModel()
+        self.grid_view = ToolGridView(MyToolCardDelegate())
+        self.grid_view.setModel(self.model)
+        layout.addWidget(self.grid_view)
         
         # Load tools on init
-        self.refresh_tools()
-        
+        self.sync_tools()
+
+    def verify_tools(self):
+        """Verify all installed tools in the background"""
+        self.verify_btn.setEnabled(False)
+        self.verify_btn.setText("Verifying…")
+        self.verify_thread = VerifyToolsThread()
+        self.verify_thread.verification_done.connect(self.show_verification_results)
+        self.verify_thread.verification_failed.connect(self.show_verification_error)
+        self.verify_thread.start()
+
+    def reset_verify_button(self):
+        self.verify_btn.setEnabled(True)
+        self.verify_btn.setText("🩺 Verify")
+
+    def show_verification_error(self, message):
+        self.reset_verify_button()
+        QMessageBox.critical(self, "Verification",
+                             f"Verification could not run, nothing was checked:\n\n{message}")
+
+    def show_verification_results(self, results):
+        self.reset_verify_button()
+
+        problems = []
+        for tool_name, result in results.items():
+            if result.get("error"):
+                problems.append(f"{tool_name}: {result['error']}")
+            elif not result["ok"]:
+                details = []
+                if result["missing"]:
+                    details.append(f"{len(result['missing'])} missing")
+                if result["modified"]:
+                    details.append(f"{len(result['modified'])} modified")
+                problems.append(f"{tool_name}: {', '.join(details)} file(s)")
+
+        if problems:
+            QMessageBox.warning(self, "Verification",
+                                "Some installs look damaged; re-download them to repair:\n\n" +
+                                "\n".join(problems))
+        else:
+            QMessageBox.information(self, "Verification",
+                                    f"All {len(results)} installed tools are intact.")
+
     def refresh_tools(self):
-        # Clear existing widgets
-        for i in reversed(range(self.tools_layout.count())): 
-            self.tools_layout.itemAt(i).widget().setParent(None)
-            
-        # Load installed tools
-        installed_tools_file = Settings.DOWNLOADS_DIR / "installed_tools.json"
-        if installed_tools_file.exists():
-            with open(installed_tools_file, 'r') as f:
-                installed_tools = json.load(f)
-                
-            row = 0
-            col = 0
-            for tool_name, tool_info in installed_tools.items():
-                tool_card = MyToolCard(
-                    name=tool_name,
-                    version=tool_info.get("version", "Unknown"),
-                    path=tool_info.get("path", ""),
-                    github_url=tool_info.get("github_url", "")
-                )
-                self.tools_layout.addWidget(tool_card, row, col)
-                
-                col += 1
-                if col > 2:  # 3 columns
-                    col = 0
-                    row += 1
\ No newline at end of file
+        """Re-read the registry now instead of waiting for the file watcher"""
+        self.repository.reload_installed()
+        self.sync_tools()
+
+    def sync_tools(self, _tool_name=None):
+        """Bring the grid to the repository's installed tools, in registry order, applying only the changes"""
+        tools = [
+            dict(tool_info, name=tool_name, present=Path(tool_info.get("path", "")).exists())
+            for tool_name, tool_info in self.repository.installed_tools().items()
+        ]
+        self.model.sync_tools(tools)
\ No newline at end of file
@@ -0,0 +1,93 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
+from config.settings import Settings
+from ui.components.tool_card import ToolCardDelegate
+from ui.components.tool_grid import ToolListModel, ToolGridView
+from utils.tool_repository import ToolRepository
+
+
+class SearchView(QWidget):
+    """Results of the global search box, across every category"""
+
+    def __init__(self):
+        super().__init__()
+        self.query = ""
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(40, 40, 40, 40)
+
+        # Header
+        header_layout = QHBoxLayout()
+
+        title_label = QLabel("Search Results")
+        title_label.setFont(QFont("Segoe UI", 24, QFont.Bold))
+        title_label.setObjectName("AccentLabel")
+
+        self.count_label = QLabel()
+        self.count_label.setFont(QFont("Segoe UI", 11))
+        self.count_label.setObjectName("MutedLabel")
+
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+        header_layout.addWidget(self.count_label)
+
+        layout.addLayout(header_layout)
+
+        # Same virtualized grid and cards as the category views
+        self.model = ToolListModel()
+        self.grid_view = ToolGridView(ToolCardDelegate())
+        self.grid_view.setModel(self.model)
+        layout.addWidget(self.grid_view)
+
+        self.empty_label = QLabel("No tools match your search")
+        self.empty_label.setFont(QFont("Segoe UI", 14))
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.setObjectName("EmptyLabel")
+        self.empty_label.hide()
+        layout.addWidget(self.empty_label)
+
+        self.prioritize_timer = QTimer(self)
+        self.prioritize_timer.setSingleShot(True)
+        self.prioritize_timer.setInterval(50)
+        self.prioritize_timer.timeout.connect(self.prioritize_visible_cards)
+        self.grid_view.verticalScrollBar().valueChanged.connect(lambda _value: self.prioritize_timer.start())
+
+        repository = ToolRepository.instance()
+        repository.status_changed.connect(self.model.refresh_tool)
+        repository.tool_removed.connect(self.model.refresh_tool)
+        repository.catalog_changed.connect(self.on_catalog_changed)
+
+    def set_query(self, query):
+        """Run the query against the repository's index and show the results"""
+        self.query = query
+        repository = ToolRepository.instance()
+
+        tools = []
+        seen = set()
+        for _category, tool, _score in repository.search(query, Settings.SEARCH_RESULT_LIMIT):
+            # The same tool can be listed under several categories
+            if tool["name"] not in seen:
+                seen.add(tool["name"])
+                tools.append(tool)
+
+        self.model.set_tools(tools)
+        self.grid_view.scrollToTop()
+        self.grid_view.setVisible(bool(tools))
+        self.empty_label.setVisible(not tools)
+        self.count_label.setText(f"{len(tools)} tool{'s' if len(tools) != 1 else ''} found")
+
+        for tool in tools:
+            repository.request_status(tool["name"], tool["github_url"])
+        self.prioritize_timer.start()
+
+    def on_catalog_changed(self):
+        if self.query:
+            self.set_query(self.query)
+
+    def prioritize_visible_cards(self):
+        """Move status checks of cards inside the viewport to the front"""
+        visible = [self.model.tool_at(row)["name"] for row in self.grid_view.visible_rows()]
+        ToolRepository.instance().prioritize(visible)
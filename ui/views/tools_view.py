@@ -1,10 +1,9 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, 
-                            QGridLayout, QLabel, QPushButton, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont
-from config.settings import Settings
-from ui.components.tool_card import ToolCard
-import webbrowser
+from ui.components.tool_card import ToolCardDelegate
+from ui.components.tool_grid import ToolListModel, ToolGridView
+from utils.tool_repository import ToolRepository
 
 class ToolsView(QWidget):
     back_clicked = pyqtSignal()
@@ -25,26 +24,13 @@ class ToolsView(QWidget):
         
         title_label = QLabel(self.title)
         title_label.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        title_label.setStyleSheet(f"color: {Settings.PRIMARY_COLOR};")
+        title_label.setObjectName("AccentLabel")
         
         back_btn = QPushButton("← Back")
         back_btn.setFixedSize(100, 40)
         back_btn.setCursor(Qt.PointingHandCursor)
         back_btn.clicked.connect(self.go_back)
-        back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 2px solid {Settings.PRIMARY_COLOR};
-                border-radius: 8px;
-                color: {Settings.PRIMARY_COLOR};
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Settings.PRIMARY_COLOR};
-                color: {Settings.BACKGROUND_COLOR};
-            }}
-        """)
+        back_btn.setObjectName("OutlineButton")
         
         header_layout.addWidget(title_label)
         header_layout.addStretch()
@@ -52,54 +38,60 @@ class ToolsView(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Scroll area for tools
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #40E0D0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-        """)
-        
-        # Tools container
-        self.tools_container = QWidget()
-        self.tools_layout = QGridLayout(self.tools_container)
-        self.tools_layout.setSpacing(20)
-        
-        scroll_area.setWidget(self.tools_container)
-        layout.addWidget(scroll_area)
+        # Virtualized card grid; columns follow the available width
+        self.model = ToolListModel()
+        self.grid_view = ToolGridView(ToolCardDelegate())
+        self.grid_view.setModel(self.model)
+        layout.addWidget(self.grid_view)
+
+        # Status checks for cards scrolled into view jump the queue
+        self.prioritize_timer = QTimer(self)
+        self.prioritize_timer.setSingleShot(True)
+        self.prioritize_timer.setInterval(50)
+        self.prioritize_timer.timeout.connect(self.prioritize_visible_cards)
+        self.grid_view.verticalScrollBar().valueChanged.connect(lambda _value: self.prioritize_timer.start())
+
+        repository = ToolRepository.instance()
+        repository.status_changed.connect(self.model.refresh_tool)
+        repository.tool_removed.connect(self.model.refresh_tool)
+        repository.category_changed.connect(self.on_category_changed)
+        self.model.rowsInserted.connect(self.on_rows_inserted)
         
     def load_tools(self):
-        tools_config = Settings.load_tools_config()
-        tools = tools_config.get(self.category, [])
-        
-        row = 0
-        col = 0
-        for tool in tools:
-            tool_card = ToolCard(
-                tool["name"],
-                tool["description"],
-                tool["github_url"],
-                tool.get("icon", "🔧")
-            )
-            self.tools_layout.addWidget(tool_card, row, col)
-            
-            col += 1
-            if col > 2:  # 3 columns
-                col = 0
-                row += 1
-                
+        repository = ToolRepository.instance()
+        # First page now, the rest as the grid scrolls to the end (ToolListModel.fetchMore)
+        pages = repository.category_pages(self.category)
+        self.model.set_tools(next(pages, []), more_pages=pages)
+        self.request_statuses(range(self.model.rowCount()))
+
+    def request_statuses(self, rows):
+        """Installed tools need a network check; queue them all, visible ones go first on show"""
+        repository = ToolRepository.instance()
+        for row in rows:
+            tool = self.model.tool_at(row)
+            repository.request_status(tool["name"], tool["github_url"])
+
+    def on_rows_inserted(self, _parent, first, last):
+        self.request_statuses(range(first, last + 1))
+
+    def on_category_changed(self, category):
+        """Apply a catalog edit to this view row by row instead of rebuilding it"""
+        if category != self.category:
+            return
+        # New rows queue their status checks through on_rows_inserted
+        self.model.sync_tools(ToolRepository.instance().tools_in_category(self.category))
+        self.prioritize_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Wait for the layout pass so the viewport size is final
+        self.prioritize_timer.start()
+
+    def prioritize_visible_cards(self):
+        """Move status checks of cards inside the viewport to the front"""
+        visible = [self.model.tool_at(row)["name"] for row in self.grid_view.visible_rows()]
+        ToolRepository.instance().prioritize(visible)
+
     def go_back(self):
         main_window = self.window()
         main_window.on_navigation_clicked("main")
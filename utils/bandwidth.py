@@ -0,0 +1,61 @@
+import threading
+import time
+
+from config.settings import Settings
+
+
+class BandwidthLimiter:
+    """
+    Token bucket shared by every download in the process, so the
+    Settings.BANDWIDTH_LIMIT_KBPS cap applies to their total, not to each one.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    # Longest single sleep, so callers can keep pumping events while throttled
+    MAX_SLEEP = 0.05
+
+    def __init__(self, limit_kbps):
+        self.limit_kbps = limit_kbps
+        self.lock = threading.Lock()
+        self.available = 0.0
+        self.last_refill = time.monotonic()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(Settings.BANDWIDTH_LIMIT_KBPS)
+            return cls._shared
+
+    @property
+    def enabled(self):
+        return self.limit_kbps > 0
+
+    def _reserve(self, nbytes):
+        """Take nbytes from the bucket; return how long the caller must wait"""
+        rate = self.limit_kbps * 1024
+        with self.lock:
+            now = time.monotonic()
+            # Allow at most one second of burst after an idle period
+            self.available = min(rate, self.available + (now - self.last_refill) * rate)
+            self.last_refill = now
+            self.available -= nbytes
+            return max(0.0, -self.available / rate)
+
+    def throttle(self, nbytes, idle=None):
+        """
+        Block until nbytes may be transferred. idle() is called between short
+        sleeps (e.g. QApplication.processEvents on the GUI thread).
+        """
+        if not self.enabled:
+            return
+        deadline = time.monotonic() + self._reserve(nbytes)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.MAX_SLEEP))
+            if idle:
+                idle()
@@ -0,0 +1,148 @@
+import json
+import os
+from collections import ChainMap
+from pathlib import Path
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("catalog")
+
+# requests is imported by the fetch task, off the GUI thread and after startup
+
+
+def is_valid_catalog(data):
+    """{category: [tool dict with a "name"]}, as in tools_registry.json"""
+    return isinstance(data, dict) and all(
+        isinstance(tools, list) and all(isinstance(tool, dict) and "name" in tool for tool in tools)
+        for tools in data.values()
+    )
+
+
+def merge_catalogs(bundled, remote):
+    """
+    Overlay the synced catalog on the bundled one. A category present in the
+    remote copy replaces the bundled list (so tools removed upstream go away);
+    categories only the bundled copy knows are kept. The overlay is a view,
+    so a sharded bundled catalog is not parsed by merging.
+    """
+    if not remote:
+        return bundled
+    return ChainMap(remote, bundled)
+
+
+class CatalogFetchSignals(QObject):
+    finished = pyqtSignal(object)  # (catalog, etag), or None when unchanged or failed
+
+
+class CatalogFetchTask(QRunnable):
+    """Conditional GET of the published registry on a pool thread"""
+
+    def __init__(self, url, etag=None):
+        super().__init__()
+        self.url = url
+        self.etag = etag
+        self.signals = CatalogFetchSignals()
+
+    def run(self):
+        import requests
+        result = None
+        try:
+            headers = {"If-None-Match": self.etag} if self.etag else {}
+            response = requests.get(self.url, headers=headers, timeout=Settings.REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                log.debug("Catalog not modified")
+            elif response.status_code == 200:
+                catalog = response.json()
+                if is_valid_catalog(catalog):
+                    result = (catalog, response.headers.get("ETag"))
+                else:
+                    log.warning("Ignoring malformed remote catalog")
+            else:
+                log.warning("HTTP %d fetching %s", response.status_code, self.url)
+        except Exception as e:
+            log.warning("Error fetching catalog: %s", e)
+        try:
+            self.signals.finished.emit(result)
+        except RuntimeError:
+            # Receiver deleted while the request was in flight
+            pass
+
+
+class CatalogSync(QObject):
+    """
+    Keeps a local copy of the registry published in the Triple V repo, so new
+    tools reach users without a new release. Fetches are conditional on the
+    cached ETag, so an unchanged catalog costs one 304 response.
+    """
+
+    catalog_updated = pyqtSignal()  # the cached remote catalog changed
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, parent=None, cache_file=None):
+        super().__init__(parent)
+        self.cache_file = Path(cache_file or Settings.CATALOG_CACHE_FILE)
+        self._cache = None
+        self._task = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.sync)
+
+    def _load_cache(self):
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if (isinstance(data, dict) and data.get("format") == self.FORMAT_VERSION
+                        and is_valid_catalog(data.get("catalog"))):
+                    self._cache = data
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                log.warning("Ignoring unreadable cache: %s", e)
+        return self._cache
+
+    def cached_catalog(self):
+        """The last synced catalog, or None before the first successful sync"""
+        return self._load_cache().get("catalog")
+
+    def start(self):
+        """Sync now and then every CATALOG_SYNC_INTERVAL_MINUTES (0 disables syncing)"""
+        minutes = Settings.CATALOG_SYNC_INTERVAL_MINUTES
+        if minutes <= 0:
+            return
+        self.timer.start(int(minutes * 60 * 1000))
+        self.sync()
+
+    def stop(self):
+        self.timer.stop()
+
+    def sync(self):
+        if self._task is not None:
+            return
+        self._task = CatalogFetchTask(Settings.CATALOG_REMOTE_URL, self._load_cache().get("etag"))
+        self._task.signals.finished.connect(self.on_fetched)
+        QThreadPool.globalInstance().start(self._task)
+
+    def on_fetched(self, result):
+        self._task = None
+        if result is None:
+            return
+        catalog, etag = result
+        changed = catalog != self.cached_catalog()
+        self._cache = {"format": self.FORMAT_VERSION, "etag": etag, "catalog": catalog}
+        self._save_cache()
+        if changed:
+            log.info("Remote catalog updated (%d tools)", sum(len(t) for t in catalog.values()))
+            self.catalog_updated.emit()
+
+    def _save_cache(self):
+        temp_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            log.warning("Could not save cache: %s", e)
@@ -0,0 +1,179 @@
+import os
+import shutil
+import tarfile
+import time
+from pathlib import Path
+import zstandard
+from config.settings import Settings
+from utils.installed_registry import InstalledToolsRegistry
+from utils.log import get_logger
+
+log = get_logger("cold_storage")
+
+
+class _ProgressReader:
+    """File wrapper reporting how much of the archive has been read"""
+
+    def __init__(self, f, total, callback):
+        self._f = f
+        self._total = total
+        self._callback = callback
+        self._read = 0
+
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self._read += len(data)
+        if self._callback and self._total:
+            self._callback(self._read, self._total)
+        return data
+
+
+class ColdStorage:
+    """
+    Archive tier for rarely used tools.
+
+    Opt-in (cold_storage_enabled in user_config.json): tools that haven't been
+    used for cold_storage_after_days are packed into a local .tar.zst and their
+    folder is removed; the registry keeps them as "cold" so they stay in My
+    Downloaded Tools, and rehydrate() unpacks them again from disk instead of
+    re-downloading.
+    """
+
+    ARCHIVE_SUFFIX = ".tar.zst"
+
+    def __init__(self, registry=None, is_running=None):
+        self.registry = registry or InstalledToolsRegistry()
+        self.archive_dir = Settings.COLD_STORAGE_DIR
+        # ProcessSupervisor.is_running; tools Triple V launched are never archived while they run
+        self.is_running = is_running or (lambda tool_name: False)
+
+    @staticmethod
+    def last_used(info):
+        """
+        Latest of install, last launch from Triple V and the entry point's access
+        time, so tools started outside Triple V don't look unused
+        """
+        times = [info["installed_at"], info["last_run_at"] or 0]
+        if info.get("entry_point"):
+            try:
+                times.append((Path(info["path"]) / info["entry_point"]).stat().st_atime)
+            except OSError:
+                pass
+        return max(times)
+
+    def candidates(self, now=None):
+        """Hot, not running tools unused for longer than the threshold"""
+        now = now or time.time()
+        cutoff = now - Settings.COLD_STORAGE_AFTER_DAYS * 24 * 3600
+        return [
+            tool_name for tool_name, info in self.registry.all().items()
+            if info["state"] == "hot"
+            and not self.is_running(tool_name)
+            and Path(info["path"]).is_dir()
+            and self.last_used(info) < cutoff
+        ]
+
+    def apply_policy(self):
+        """Archive every tool the policy selects; returns the archived names"""
+        if not Settings.COLD_STORAGE_ENABLED:
+            return []
+
+        archived = []
+        for tool_name in self.candidates():
+            try:
+                self.archive(tool_name)
+                archived.append(tool_name)
+            except Exception as e:
+                log.warning("Could not archive %s: %s", tool_name, e)
+        return archived
+
+    def archive(self, tool_name):
+        """
+        Compress a tool folder into cold storage and remove the folder. The tool
+        is only marked cold once the folder is gone; on any failure it stays hot
+        with its files intact.
+        """
+        tool_info = self.registry.get(tool_name)
+        if not tool_info or tool_info["state"] != "hot" or self.is_running(tool_name):
+            return None
+
+        tool_dir = Path(tool_info["path"])
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_path = self.archive_dir / f"{tool_name}{self.ARCHIVE_SUFFIX}"
+        temp_path = archive_path.with_name(archive_path.name + ".part")
+
+        # Write to a temp file first so a crash never leaves a truncated archive behind
+        with open(temp_path, "wb") as raw:
+            compressor = zstandard.ZstdCompressor(level=Settings.COLD_STORAGE_ZSTD_LEVEL, threads=-1)
+            with compressor.stream_writer(raw, closefd=False) as zst:
+                with tarfile.open(fileobj=zst, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                    tar.add(str(tool_dir), arcname=".")
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(temp_path, archive_path)
+
+        # Move the folder aside in one step: this fails without touching a file
+        # while the tool (started from anywhere) holds one open on Windows
+        removing_dir = tool_dir.with_name(tool_dir.name + ".archiving")
+        try:
+            os.replace(tool_dir, removing_dir)
+        except OSError:
+            archive_path.unlink(missing_ok=True)
+            raise
+
+        try:
+            shutil.rmtree(removing_dir)
+            self.registry.set_cold(tool_name, archive_path)
+        except Exception:
+            # Put the tool back from the archive, whatever part of it was deleted
+            self._extract(archive_path, tool_dir)
+            archive_path.unlink(missing_ok=True)
+            shutil.rmtree(removing_dir, ignore_errors=True)
+            raise
+        log.info("Archived %s to %s", tool_name, archive_path.name)
+        return archive_path
+
+    def _extract(self, archive_path, tool_dir, progress_callback=None):
+        """Unpack an archive into tool_dir, replacing it only once extraction succeeded"""
+        temp_dir = tool_dir.with_name(tool_dir.name + ".rehydrating")
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir)
+        temp_dir.mkdir(parents=True)
+
+        # "data" filter rejects absolute paths and links escaping the folder
+        extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        total = archive_path.stat().st_size
+        with open(archive_path, "rb") as raw:
+            reader = _ProgressReader(raw, total, progress_callback)
+            with zstandard.ZstdDecompressor().stream_reader(reader) as zst:
+                with tarfile.open(fileobj=zst, mode="r|") as tar:
+                    tar.extractall(str(temp_dir), **extract_kwargs)
+
+        if tool_dir.exists():
+            shutil.rmtree(tool_dir)
+        os.replace(temp_dir, tool_dir)
+
+    def rehydrate(self, tool_name, progress_callback=None):
+        """
+        Extract a cold tool back into its folder.
+        progress_callback(read_bytes, total_bytes) is called while unpacking.
+        """
+        tool_info = self.registry.get(tool_name)
+        if not tool_info or tool_info["state"] != "cold":
+            return False
+
+        archive_path = Path(tool_info["archive_path"])
+        if not archive_path.exists():
+            raise FileNotFoundError(f"Archive of {tool_name} is missing: {archive_path}")
+
+        self._extract(archive_path, Path(tool_info["path"]), progress_callback)
+        self.registry.set_hot(tool_name)
+        archive_path.unlink()
+        log.info("Rehydrated %s", tool_name)
+        return True
+
+    def discard(self, tool_name):
+        """Drop the archive of a cold tool (e.g. before reinstalling it)"""
+        tool_info = self.registry.get(tool_name)
+        if tool_info and tool_info["archive_path"]:
+            Path(tool_info["archive_path"]).unlink(missing_ok=True)
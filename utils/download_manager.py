@@ -1,46 +1,84 @@
 import os
 import json
-import zipfile
-import requests
+import re
 import shutil
 from pathlib import Path
-from packaging import version
-from PyQt5.QtWidgets import QMessageBox, QProgressDialog
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog, QApplication
 from PyQt5.QtCore import Qt
 from config.settings import Settings
+from utils.installed_registry import InstalledToolsRegistry
+from utils.bandwidth import BandwidthLimiter
+from utils.log import get_logger
+
+log = get_logger("download")
+
+# requests, zipfile, packaging, integrity and cold storage are imported where they
+# are used: the registry is needed at startup, the network and archive code is not
+
+# Scheme optional, http or https: what the Add to Vault dialog's url_regex accepts
+GITHUB_URL_PREFIX = re.compile(r"^(?:https?://)?github\.com/")
 
 class DownloadManager:
     def __init__(self):
         self.downloads_dir = Settings.DOWNLOADS_DIR
-        self.installed_tools_file = self.downloads_dir / "installed_tools.json"
-        self.load_installed_tools()
-        
-    def load_installed_tools(self):
-        """Load the registry of installed tools"""
-        if self.installed_tools_file.exists():
-            with open(self.installed_tools_file, 'r') as f:
-                self.installed_tools = json.load(f)
-        else:
-            self.installed_tools = {}
-            
-    def save_installed_tools(self):
-        """Save the registry of installed tools"""
-        with open(self.installed_tools_file, 'w') as f:
-            json.dump(self.installed_tools, f, indent=4)
+        self.registry = InstalledToolsRegistry()
+        # github_url -> zip URL found by get_download_url (probing takes several HEAD requests)
+        self.resolved_urls = {}
             
     def is_tool_installed(self, tool_name):
         """Check if a tool is installed and return version"""
-        if tool_name in self.installed_tools:
-            tool_info = self.installed_tools[tool_name]
+        tool_info = self.registry.get(tool_name)
+        if tool_info:
+            # Cold tools live in an archive until their next run
+            if tool_info["state"] == "cold":
+                return True, tool_info["version"]
             tool_path = Path(tool_info["path"])
             if tool_path.exists():
                 return True, tool_info["version"]
         return False, None
         
+    @staticmethod
+    def resolve_entry_point(tool_dir, tool_name, config=None):
+        """
+        Pick the executable to launch for an installed tool.
+        Uses the optional "entry_point" field of Triple_V_Config.json, otherwise
+        scans the extracted tree deterministically: shallowest exe first, then
+        one named like the tool, then alphabetical.
+        Returns the path relative to tool_dir, or None if there is no exe.
+        """
+        tool_dir = Path(tool_dir)
+
+        if config is None:
+            config_path = tool_dir / "Triple_V_Config.json"
+            if config_path.exists():
+                try:
+                    with open(config_path, 'r') as f:
+                        config = json.load(f)
+                except Exception as e:
+                    log.warning("Could not read %s: %s", config_path, e)
+
+        declared = (config or {}).get("entry_point")
+        if declared:
+            if (tool_dir / declared).is_file():
+                return Path(declared).as_posix()
+            log.warning("Declared entry point %s not found, scanning instead", declared)
+
+        normalized_name = tool_name.lower().replace(" ", "").replace("-", "").replace("_", "")
+
+        def rank(exe_path):
+            relative = exe_path.relative_to(tool_dir)
+            stem = exe_path.stem.lower().replace(" ", "").replace("-", "").replace("_", "")
+            return (len(relative.parts), stem != normalized_name, relative.as_posix().lower())
+
+        exe_files = sorted(tool_dir.rglob("*.exe"), key=rank)
+        if exe_files:
+            return exe_files[0].relative_to(tool_dir).as_posix()
+        return None
+
     def parse_github_url(self, github_url):
         """Extract owner and repo from GitHub URL"""
-        # Remove https://github.com/ and split
-        parts = github_url.replace("https://github.com/", "").split("/")
+        # Remove http(s)://github.com/ and split
+        parts = GITHUB_URL_PREFIX.sub("", github_url.strip()).split("/")
         if len(parts) >= 2:
             return parts[0], parts[1]
         return None, None
@@ -59,11 +97,12 @@ class DownloadManager:
         # If it's already a raw URL or other format, return as is
         return github_url
         
-    def fetch_tool_config(self, github_url):
+    def fetch_tool_config(self, github_url, should_stop=None):
         """Fetch Triple_V_Config.json from GitHub repo (for tools only)"""
+        import requests
         owner, repo = self.parse_github_url(github_url)
         if not owner or not repo:
-            print(f"[DownloadManager] Could not parse GitHub URL: {github_url}")
+            log.warning("Could not parse GitHub URL: %s", github_url)
             return None
         
         # Try multiple possible locations for the config file
@@ -75,9 +114,11 @@ class DownloadManager:
         ]
         
         for config_url in config_urls:
+            if should_stop and should_stop():
+                return None
             try:
-                print(f"[DownloadManager] Trying to fetch config from: {config_url}")
-                response = requests.get(config_url, timeout=10)
+                log.debug("Trying to fetch config from: %s", config_url)
+                response = requests.get(config_url, timeout=Settings.REQUEST_TIMEOUT)
                 if response.status_code == 200:
                     # Try to parse as JSON
                     try:
@@ -86,18 +127,21 @@ class DownloadManager:
                         # If it's HTML (GitHub page), skip to next URL
                         if "<!DOCTYPE html>" in response.text:
                             continue
-                        print(f"[DownloadManager] Invalid JSON from {config_url}")
+                        log.warning("Invalid JSON from %s", config_url)
             except requests.exceptions.RequestException as e:
-                print(f"[DownloadManager] Request error for {config_url}: {e}")
+                log.debug("Request error for %s: %s", config_url, e)
             except Exception as e:
-                print(f"[DownloadManager] Error fetching config from {config_url}: {e}")
+                log.debug("Error fetching config from %s: %s", config_url, e)
 
-        print(f"[DownloadManager] Could not fetch config from any URL for {owner}/{repo}")
+        log.warning("Could not fetch config from any URL for %s/%s", owner, repo)
         return None
         
         
-    def get_download_url(self, github_url):
+    def get_download_url(self, github_url, should_stop=None):
         """Get the download URL for the zipped tool"""
+        import requests
+        if github_url in self.resolved_urls:
+            return self.resolved_urls[github_url]
         owner, repo = self.parse_github_url(github_url)
         if not owner or not repo:
             return None
@@ -127,23 +171,90 @@ class DownloadManager:
             
             # Test each URL
             for url in download_urls:
+                if should_stop and should_stop():
+                    return None
                 try:
-                    print(f"[DownloadManager] Checking if zip exists at: {url}")
-                    response = requests.head(url, timeout=5, allow_redirects=True)
+                    log.debug("Checking if zip exists at: %s", url)
+                    response = requests.head(url, timeout=Settings.PROBE_TIMEOUT, allow_redirects=True)
                     if response.status_code == 200:
                         # Verify it's actually a zip file by checking content type
                         content_type = response.headers.get('content-type', '')
                         if 'application/zip' in content_type or 'application/octet-stream' in content_type or url.endswith('.zip'):
-                            print(f"[DownloadManager] Found zip file at: {url}")
+                            log.info("Found zip file at: %s", url)
+                            self.remember_url(github_url, url)
                             return url
                 except Exception as e:
-                    print(f"[DownloadManager] Error checking {url}: {e}")
+                    log.debug("Error checking %s: %s", url, e)
         
-        print(f"[DownloadManager] Could not find zip file for {owner}/{repo}")
+        log.warning("Could not find zip file for %s/%s", owner, repo)
         return None
+
+    def inspect_repository(self, github_url, should_stop=lambda: False):
+        """
+        Resolve a repository the way download_tool() would, without downloading:
+        {"status": "ok" | "invalid" | "unreachable" | "cancelled", "message",
+         "version", "archive_url", "archive_size"}
+        """
+        import requests
+        result = {"status": "invalid", "message": "", "version": None, "archive_url": None, "archive_size": None}
+        owner, repo = self.parse_github_url(github_url)
+        if not owner or not repo:
+            result["message"] = "Not a GitHub repository URL"
+            return result
+
+        config = self.fetch_tool_config(github_url, should_stop)
+        if should_stop():
+            return dict(result, status="cancelled")
+        if config is None:
+            # Tell a missing repo from a missing config (and from being offline)
+            try:
+                response = requests.head(f"https://github.com/{owner}/{repo}",
+                                         timeout=Settings.PROBE_TIMEOUT, allow_redirects=True)
+            except requests.exceptions.RequestException:
+                return dict(result, status="unreachable",
+                            message="Could not reach GitHub, the reviewers will check the repository")
+            if response.status_code == 404:
+                result["message"] = "Repository not found (or it is private)"
+            else:
+                result["message"] = "No Triple_V_Config.json in the main or master branch"
+            return result
+        if not isinstance(config, dict) or "version" not in config:
+            result["message"] = 'Triple_V_Config.json has no "version" field'
+            return result
+        result["version"] = str(config["version"])
+
+        archive_url = self.get_download_url(github_url, should_stop)
+        if should_stop():
+            return dict(result, status="cancelled")
+        if not archive_url:
+            result["message"] = f"No {repo}.zip in the main branch"
+            return result
+        result["archive_url"] = archive_url
+
+        try:
+            response = requests.head(archive_url, timeout=Settings.PROBE_TIMEOUT, allow_redirects=True)
+            result["archive_size"] = int(response.headers.get("content-length", 0)) or None
+        except (requests.exceptions.RequestException, ValueError) as e:
+            log.warning("Could not read archive size of %s: %s", archive_url, e)
+        size_text = f" ({result['archive_size'] / 2**20:.1f} MB)" if result["archive_size"] else ""
+        from urllib.parse import unquote
+        archive_name = unquote(archive_url.rsplit("/", 1)[-1].split("?")[0])
+        result["status"] = "ok"
+        result["message"] = f"Version {result['version']}, {archive_name}{size_text}"
+        return result
+
+    def remember_url(self, github_url, url):
+        """Cache a resolved zip URL, evicting the oldest past RESOLVED_URL_CACHE_SIZE"""
+        self.resolved_urls.pop(github_url, None)
+        self.resolved_urls[github_url] = url
+        while len(self.resolved_urls) > Settings.RESOLVED_URL_CACHE_SIZE:
+            self.resolved_urls.pop(next(iter(self.resolved_urls)))
         
-    def download_tool(self, github_url, tool_name, parent_widget=None):
-        """Download and install a tool"""
+    def download_tool(self, github_url, tool_name, parent_widget=None, progress_callback=None):
+        """Download and install a tool; progress_callback(percent) mirrors the dialog"""
+        import requests
+        import zipfile
+        from utils.integrity import IntegrityChecker
         # Fetch tool config
         config = self.fetch_tool_config(github_url)
         if not config:
@@ -173,10 +284,12 @@ class DownloadManager:
         
         try:
             # Download the file
-            print(f"[DownloadManager] Downloading from: {download_url}")
-            response = requests.get(download_url, stream=True, timeout=30)
+            log.info("Downloading from: %s", download_url)
+            response = requests.get(download_url, stream=True, timeout=Settings.DOWNLOAD_TIMEOUT)
             
             if response.status_code != 200:
+                # The zip moved; probe again next time
+                self.resolved_urls.pop(github_url, None)
                 raise Exception(f"HTTP {response.status_code}: Could not download file")
                 
             total_size = int(response.headers.get('content-length', 0))
@@ -187,22 +300,27 @@ class DownloadManager:
             zip_path = tool_dir / f"{tool_name}.zip"
             
             downloaded = 0
+            limiter = BandwidthLimiter.shared()
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=Settings.DOWNLOAD_CHUNK_SIZE):
                     if progress.wasCanceled():
                         return False
                     if chunk:  # filter out keep-alive chunks
+                        limiter.throttle(len(chunk), idle=QApplication.processEvents)
                         f.write(chunk)
                         downloaded += len(chunk)
                         if total_size > 0:
-                            progress.setValue(int(downloaded * 100 / total_size))
+                            percent = int(downloaded * 100 / total_size)
+                            progress.setValue(percent)
+                            if progress_callback:
+                                progress_callback(percent)
                         
             # Verify it's a valid zip file
             try:
                 with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                     # Extract the zip
                     zip_ref.extractall(tool_dir)
-                    print(f"[DownloadManager] Extracted files: {zip_ref.namelist()}")
+                    log.debug("Extracted files: %s", zip_ref.namelist())
             except zipfile.BadZipFile:
                 raise Exception("Downloaded file is not a valid zip archive")
                 
@@ -213,16 +331,15 @@ class DownloadManager:
                 json.dump(config, f, indent=4)
 
 
-            # Update installed tools registry
-            self.installed_tools[tool_name] = {
-                "version": config["version"],
-                "path": str(tool_dir),
-                "github_url": github_url
-            }
-            self.save_installed_tools()
-            
             # Clean up zip file
             zip_path.unlink()
+
+            # Update installed tools registry (entry point is resolved once, here)
+            entry_point = self.resolve_entry_point(tool_dir, tool_name, config)
+            self.registry.upsert(tool_name, config["version"], tool_dir, github_url, entry_point)
+
+            # Record what was installed so it can be verified later
+            IntegrityChecker(self.registry).record(tool_name, tool_dir)
             
             progress.close()
             QMessageBox.information(parent_widget, "Success", 
@@ -231,40 +348,65 @@ class DownloadManager:
             
         except Exception as e:
             progress.close()
-            print(f"[DownloadManager] Download error: {str(e)}")
+            log.error("Download of %s failed: %s", tool_name, e)
             QMessageBox.critical(parent_widget, "Error", 
                                f"Failed to download tool: {str(e)}")
             return False
             
     def check_tool_update(self, github_url, current_version):
         """Check if a tool has an update available"""
-        print(f"[DownloadManager] Checking update for {github_url}, current version: {current_version}")
+        from packaging import version
+        log.debug("Checking update for %s, current version: %s", github_url, current_version)
         config = self.fetch_tool_config(github_url)
         if not config:
-            print("[DownloadManager] Could not fetch remote config")
+            log.warning("Could not fetch remote config of %s", github_url)
             return False, None
             
         latest_version = config.get("version", "0.0.0")
-        print(f"[DownloadManager] Remote version: {latest_version}, Local version: {current_version}")
+        log.debug("Remote version: %s, local version: %s", latest_version, current_version)
         
         try:
             if version.parse(latest_version) > version.parse(current_version):
-                print(f"[DownloadManager] Update available: {current_version} -> {latest_version}")
+                log.info("Update available for %s: %s -> %s", github_url, current_version, latest_version)
                 return True, latest_version
             else:
-                print("[DownloadManager] No update needed")
+                log.debug("No update needed")
         except Exception as e:
-            print(f"[DownloadManager] Error comparing versions: {e}")
+            log.warning("Error comparing versions: %s", e)
             
         return False, None
         
-    def update_tool(self, github_url, tool_name, parent_widget=None):
-        """Update an existing tool"""
-        if tool_name not in self.installed_tools:
+    def update_tool(self, github_url, tool_name, parent_widget=None, progress_callback=None,
+                    latest_version=None):
+        """
+        Update an existing tool. A pre-staged update (see stage_tool_update) is
+        swapped in without downloading, unless latest_version says it is outdated.
+        """
+        from utils.cold_storage import ColdStorage
+        tool_info = self.registry.get(tool_name)
+        if not tool_info:
             return False
             
-        tool_info = self.installed_tools[tool_name]
         old_version = tool_info["version"]
+
+        staged = self.staged_update(tool_name)
+        if staged and latest_version in (None, staged["version"]):
+            reply = QMessageBox.question(parent_widget, "Update Available",
+                                       f"Update {tool_name} from v{old_version} to v{staged['version']}?",
+                                       QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return False
+            try:
+                self.apply_staged_update(tool_name)
+            except Exception as e:
+                # e.g. the tool is running and its folder is locked
+                log.error("Could not apply staged update of %s: %s", tool_name, e)
+                QMessageBox.critical(parent_widget, "Error",
+                                   f"Failed to update tool: {str(e)}")
+                return False
+            QMessageBox.information(parent_widget, "Success",
+                                  f"{tool_name} has been updated to v{staged['version']}!")
+            return True
         
         # Check for update
         has_update, new_version = self.check_tool_update(github_url, old_version)
@@ -279,12 +421,157 @@ class DownloadManager:
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            # Remove old version
+            # Remove old version (and its cold storage archive, if any)
+            ColdStorage(self.registry).discard(tool_name)
+            self.discard_staged_update(tool_name)
             tool_dir = Path(tool_info["path"])
             if tool_dir.exists():
                 shutil.rmtree(tool_dir)
                 
             # Download new version
-            return self.download_tool(github_url, tool_name, parent_widget)
+            return self.download_tool(github_url, tool_name, parent_widget, progress_callback)
             
-        return False
\ No newline at end of file
+        return False
+
+    # ------------------------
+    # Pre-staged updates
+    # ------------------------
+    STAGED_MARKER = "Triple_V_Staged.json"
+
+    def staging_dir(self, tool_name):
+        return Settings.TOOL_UPDATE_STAGING_DIR / tool_name
+
+    def staged_update(self, tool_name):
+        """{"version", "github_url", "entry_point", "manifest"} of a complete staged update newer than the installed one, else None"""
+        from packaging import version
+        tool_info = self.registry.get(tool_name)
+        if not tool_info:
+            return None
+        try:
+            with open(self.staging_dir(tool_name) / self.STAGED_MARKER, "r", encoding="utf-8") as f:
+                marker = json.load(f)
+            if version.parse(marker["version"]) > version.parse(tool_info["version"]):
+                return marker
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Ignoring staged update of %s: %s", tool_name, e)
+        return None
+
+    def discard_staged_update(self, tool_name):
+        shutil.rmtree(self.staging_dir(tool_name), ignore_errors=True)
+
+    def prune_staged_updates(self):
+        """Drop staged folders of tools that were removed or updated another way"""
+        staging_root = Settings.TOOL_UPDATE_STAGING_DIR
+        if not staging_root.exists():
+            return
+        for path in staging_root.iterdir():
+            if path.is_dir() and self.staged_update(path.name) is None:
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.is_file():
+                path.unlink(missing_ok=True)
+
+    def stage_tool_update(self, github_url, tool_name, should_stop=lambda: False):
+        """
+        Download and extract the latest version of an installed tool into its
+        staging folder, leaving the installed copy alone. No widgets, so it
+        runs on a worker thread. Returns the staged version, or None.
+        """
+        import requests
+        import zipfile
+        from packaging import version
+        from utils.integrity import IntegrityChecker
+        tool_info = self.registry.get(tool_name)
+        if not tool_info:
+            return None
+
+        config = self.fetch_tool_config(github_url)
+        if not config or "version" not in config:
+            return None
+        latest_version = config["version"]
+        if version.parse(latest_version) <= version.parse(tool_info["version"]):
+            return None
+        staged = self.staged_update(tool_name)
+        if staged and staged["version"] == latest_version:
+            return latest_version
+
+        download_url = self.get_download_url(github_url)
+        if not download_url:
+            return None
+
+        stage_dir = self.staging_dir(tool_name)
+        zip_path = stage_dir.with_name(f"{tool_name}.zip.part")
+        shutil.rmtree(stage_dir, ignore_errors=True)
+        try:
+            stage_dir.mkdir(parents=True)
+            log.info("Staging %s v%s from: %s", tool_name, latest_version, download_url)
+            response = requests.get(download_url, stream=True, timeout=Settings.DOWNLOAD_TIMEOUT)
+            if response.status_code != 200:
+                self.resolved_urls.pop(github_url, None)
+                raise Exception(f"HTTP {response.status_code}: Could not download file")
+
+            limiter = BandwidthLimiter.shared()
+            with open(zip_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=Settings.DOWNLOAD_CHUNK_SIZE):
+                    if should_stop():
+                        raise InterruptedError("staging stopped")
+                    if chunk:
+                        limiter.throttle(len(chunk))
+                        f.write(chunk)
+
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(stage_dir)
+            zip_path.unlink()
+
+            with open(stage_dir / "Triple_V_Config.json", 'w') as f:
+                json.dump(config, f, indent=4)
+
+            # Hashed now so the swap does not have to (renames keep size and mtime)
+            marker = {
+                "version": latest_version,
+                "github_url": github_url,
+                "entry_point": self.resolve_entry_point(stage_dir, tool_name, config),
+                "manifest": IntegrityChecker(self.registry).build_manifest(stage_dir),
+            }
+            # Written last: a folder without the marker is never applied
+            temp_path = stage_dir / (self.STAGED_MARKER + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(marker, f)
+            os.replace(temp_path, stage_dir / self.STAGED_MARKER)
+            log.info("Staged %s v%s", tool_name, latest_version)
+            return latest_version
+        except Exception as e:
+            log.warning("Could not stage %s: %s", tool_name, e)
+            shutil.rmtree(stage_dir, ignore_errors=True)
+            zip_path.unlink(missing_ok=True)
+            return None
+
+    def apply_staged_update(self, tool_name):
+        """Swap the staged folder in place of the installed tool; returns the new version or None"""
+        from utils.cold_storage import ColdStorage
+        marker = self.staged_update(tool_name)
+        if marker is None:
+            return None
+        stage_dir = self.staging_dir(tool_name)
+        tool_dir = self.downloads_dir / tool_name
+        old_dir = stage_dir.with_name(f"{tool_name}.old")
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+        # Renaming fails while the tool is running (Windows locks its folder)
+        if tool_dir.exists():
+            os.replace(tool_dir, old_dir)
+        try:
+            os.replace(stage_dir, tool_dir)
+        except OSError:
+            if old_dir.exists():
+                os.replace(old_dir, tool_dir)
+            raise
+        (tool_dir / self.STAGED_MARKER).unlink()
+
+        ColdStorage(self.registry).discard(tool_name)
+        self.registry.upsert(tool_name, marker["version"], tool_dir, marker["github_url"], marker["entry_point"])
+        self.registry.replace_manifest(tool_name, [tuple(entry) for entry in marker["manifest"]])
+        shutil.rmtree(old_dir, ignore_errors=True)
+        log.info("Applied staged update %s v%s", tool_name, marker["version"])
+        return marker["version"]
\ No newline at end of file
@@ -0,0 +1,308 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("registry")
+
+
+class InstalledToolsRegistry:
+    """
+    SQLite (WAL mode) store of installed tools.
+
+    Replaces the old installed_tools.json: lookups go through the primary key
+    index on the tool name, every write is its own transaction, and several
+    TripleV instances (or a background updater) can share the file safely.
+    """
+
+    DB_NAME = "installed_tools.db"
+    LEGACY_JSON_NAME = "installed_tools.json"
+
+    # Each entry upgrades the schema by one version (PRAGMA user_version)
+    MIGRATIONS = [
+        """
+        CREATE TABLE IF NOT EXISTS installed_tools (
+            name         TEXT PRIMARY KEY,
+            version      TEXT NOT NULL,
+            path         TEXT NOT NULL,
+            github_url   TEXT NOT NULL DEFAULT '',
+            installed_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key   TEXT PRIMARY KEY,
+            value TEXT
+        );
+        """,
+        # v2: launch entry point resolved at install time (relative to the tool path)
+        """
+        ALTER TABLE installed_tools ADD COLUMN entry_point TEXT;
+        """,
+        # v3: per-file manifest recorded at install time, used by verification
+        """
+        CREATE TABLE IF NOT EXISTS manifest_files (
+            tool     TEXT NOT NULL,
+            relpath  TEXT NOT NULL,
+            size     INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            sha256   TEXT NOT NULL,
+            PRIMARY KEY (tool, relpath)
+        );
+        """,
+        # v4: storage tier ('hot' on disk, 'cold' compressed archive) and usage tracking
+        """
+        ALTER TABLE installed_tools ADD COLUMN state TEXT NOT NULL DEFAULT 'hot';
+        ALTER TABLE installed_tools ADD COLUMN last_run_at REAL;
+        ALTER TABLE installed_tools ADD COLUMN archive_path TEXT;
+        """,
+        # v5: single-instance launches per tool and launch-to-exit history (see ProcessSupervisor)
+        """
+        ALTER TABLE installed_tools ADD COLUMN single_instance INTEGER NOT NULL DEFAULT 1;
+        CREATE TABLE IF NOT EXISTS launch_history (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            tool        TEXT NOT NULL,
+            pid         INTEGER NOT NULL,
+            started_at  REAL NOT NULL,
+            ended_at    REAL,
+            exit_code   INTEGER,
+            cpu_seconds REAL,
+            peak_rss    INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS launch_history_tool ON launch_history (tool, started_at);
+        """,
+    ]
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path) if db_path else Settings.DOWNLOADS_DIR / self.DB_NAME
+        self.legacy_json_file = self.db_path.with_name(self.LEGACY_JSON_NAME)
+        # sqlite3 connections can't be shared across threads, so keep one per thread
+        self._local = threading.local()
+        self._init_schema()
+        self._migrate_legacy_json()
+
+    # ------------------------
+    # Connection / transactions
+    # ------------------------
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: we issue BEGIN/COMMIT ourselves
+            conn = sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Write transaction; BEGIN IMMEDIATE takes the write lock up front"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def _init_schema(self):
+        # Cheap read first; only take the write lock when a migration is due
+        if self._connect().execute("PRAGMA user_version").fetchone()[0] >= len(self.MIGRATIONS):
+            return
+
+        with self.transaction() as conn:
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            for index in range(current, len(self.MIGRATIONS)):
+                for statement in self.MIGRATIONS[index].split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+            if current < len(self.MIGRATIONS):
+                conn.execute(f"PRAGMA user_version = {len(self.MIGRATIONS)}")
+
+    def _migrate_legacy_json(self):
+        """One-time import of installed_tools.json, then rename it out of the way"""
+        if not self.legacy_json_file.exists():
+            return
+
+        with self.transaction() as conn:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+            if done:
+                return
+
+            try:
+                with open(self.legacy_json_file, "r") as f:
+                    legacy_tools = json.load(f)
+            except Exception as e:
+                log.warning("Could not read legacy registry: %s", e)
+                legacy_tools = {}
+
+            now = time.time()
+            for name, info in legacy_tools.items():
+                conn.execute(
+                    "INSERT OR IGNORE INTO installed_tools (name, version, path, github_url, installed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, info.get("version", "0.0.0"), info.get("path", ""),
+                     info.get("github_url", ""), now)
+                )
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)", (str(now),))
+
+        try:
+            self.legacy_json_file.rename(self.legacy_json_file.with_suffix(".json.migrated"))
+        except OSError as e:
+            log.warning("Could not rename legacy registry: %s", e)
+        log.info("Migrated %d tools from %s", len(legacy_tools), self.legacy_json_file.name)
+
+    # ------------------------
+    # Queries
+    # ------------------------
+    @staticmethod
+    def _row_to_info(row):
+        return {
+            "version": row["version"],
+            "path": row["path"],
+            "github_url": row["github_url"],
+            "entry_point": row["entry_point"],
+            "state": row["state"],
+            "installed_at": row["installed_at"],
+            "last_run_at": row["last_run_at"],
+            "single_instance": bool(row["single_instance"]),
+            "archive_path": row["archive_path"],
+        }
+
+    def get(self, tool_name):
+        """Return the info dict of an installed tool, or None"""
+        row = self._connect().execute(
+            "SELECT * FROM installed_tools WHERE name = ?", (tool_name,)
+        ).fetchone()
+        return self._row_to_info(row) if row else None
+
+    def all(self):
+        """Return {tool_name: info} for every installed tool, in install order"""
+        rows = self._connect().execute(
+            "SELECT * FROM installed_tools ORDER BY installed_at, name"
+        ).fetchall()
+        return {row["name"]: self._row_to_info(row) for row in rows}
+
+    # ------------------------
+    # Updates
+    # ------------------------
+    def upsert(self, tool_name, version, path, github_url="", entry_point=None):
+        """Insert or replace an installed tool entry"""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO installed_tools (name, version, path, github_url, installed_at, entry_point) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET version = excluded.version, path = excluded.path, "
+                "github_url = excluded.github_url, installed_at = excluded.installed_at, "
+                "entry_point = excluded.entry_point, state = 'hot', archive_path = NULL",
+                (tool_name, version, str(path), github_url, time.time(), entry_point)
+            )
+
+    def set_entry_point(self, tool_name, entry_point):
+        """Record the launch entry point of an installed tool"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE installed_tools SET entry_point = ? WHERE name = ?",
+                (entry_point, tool_name)
+            )
+
+    def mark_run(self, tool_name):
+        """Remember when a tool was last launched (drives cold storage)"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE installed_tools SET last_run_at = ? WHERE name = ?",
+                (time.time(), tool_name)
+            )
+
+    def set_single_instance(self, tool_name, enabled):
+        """Whether Run is refused while the tool is already running"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE installed_tools SET single_instance = ? WHERE name = ?",
+                (int(enabled), tool_name)
+            )
+
+    def set_cold(self, tool_name, archive_path):
+        """Mark a tool as archived to cold storage"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE installed_tools SET state = 'cold', archive_path = ? WHERE name = ?",
+                (str(archive_path), tool_name)
+            )
+
+    def set_hot(self, tool_name):
+        """Mark a tool as extracted on disk again"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE installed_tools SET state = 'hot', archive_path = NULL WHERE name = ?",
+                (tool_name,)
+            )
+
+    def remove(self, tool_name):
+        """Forget an installed tool"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM installed_tools WHERE name = ?", (tool_name,))
+            conn.execute("DELETE FROM manifest_files WHERE tool = ?", (tool_name,))
+
+    # ------------------------
+    # Launch history
+    # ------------------------
+    def record_launch(self, tool_name, pid, started_at):
+        """Open a launch history entry; returns its id for record_exit()"""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO launch_history (tool, pid, started_at) VALUES (?, ?, ?)",
+                (tool_name, pid, started_at)
+            )
+            return cursor.lastrowid
+
+    def record_exit(self, launch_id, ended_at, exit_code, cpu_seconds=None, peak_rss=None):
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE launch_history SET ended_at = ?, exit_code = ?, cpu_seconds = ?, peak_rss = ? "
+                "WHERE id = ?",
+                (ended_at, exit_code, cpu_seconds, peak_rss, launch_id)
+            )
+
+    def launch_history(self, tool_name, limit=20):
+        """Most recent launches first; ended_at is None if the tool outlived its Triple V session"""
+        rows = self._connect().execute(
+            "SELECT pid, started_at, ended_at, exit_code, cpu_seconds, peak_rss FROM launch_history "
+            "WHERE tool = ? ORDER BY started_at DESC LIMIT ?",
+            (tool_name, limit)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    # ------------------------
+    # File manifests
+    # ------------------------
+    def get_manifest(self, tool_name):
+        """Return {relpath: (size, mtime_ns, sha256)} recorded for a tool"""
+        rows = self._connect().execute(
+            "SELECT relpath, size, mtime_ns, sha256 FROM manifest_files WHERE tool = ?",
+            (tool_name,)
+        ).fetchall()
+        return {row["relpath"]: (row["size"], row["mtime_ns"], row["sha256"]) for row in rows}
+
+    def replace_manifest(self, tool_name, entries):
+        """Store a fresh manifest; entries are (relpath, size, mtime_ns, sha256)"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM manifest_files WHERE tool = ?", (tool_name,))
+            conn.executemany(
+                "INSERT INTO manifest_files (tool, relpath, size, mtime_ns, sha256) VALUES (?, ?, ?, ?, ?)",
+                [(tool_name, *entry) for entry in entries]
+            )
+
+    def refresh_manifest_stats(self, tool_name, stats):
+        """Update cached size/mtime of files whose content was re-hashed and matched"""
+        with self.transaction() as conn:
+            conn.executemany(
+                "UPDATE manifest_files SET size = ?, mtime_ns = ? WHERE tool = ? AND relpath = ?",
+                [(size, mtime_ns, tool_name, relpath) for relpath, size, mtime_ns in stats]
+            )
@@ -0,0 +1,135 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from config.settings import Settings
+from utils.installed_registry import InstalledToolsRegistry
+from utils.log import get_logger
+
+log = get_logger("integrity")
+
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """SHA-256 of a file, read in 1 MB chunks (hashlib releases the GIL)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IntegrityChecker:
+    """
+    Records a file manifest when a tool is installed and verifies installs against it.
+
+    Works like git's index: files whose size and mtime still match the manifest
+    are trusted without being read, and only the remaining ones are hashed
+    (in parallel), so re-verifying large untouched installs is nearly free.
+    """
+
+    def __init__(self, registry=None, max_workers=None):
+        self.registry = registry or InstalledToolsRegistry()
+        self.max_workers = max_workers or min(Settings.INTEGRITY_WORKERS, (os.cpu_count() or 1) + 4)
+
+    @staticmethod
+    def _scan(tool_dir):
+        """Return {relpath: os.stat_result} for every file under tool_dir"""
+        files = {}
+        for root, _dirs, names in os.walk(tool_dir):
+            for name in names:
+                full_path = Path(root) / name
+                try:
+                    files[full_path.relative_to(tool_dir).as_posix()] = full_path.stat()
+                except OSError:
+                    continue
+        return files
+
+    def _hash_many(self, tool_dir, relpaths):
+        """Hash files in parallel; unreadable files map to None"""
+        def safe_hash(relpath):
+            try:
+                return hash_file(tool_dir / relpath)
+            except OSError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(relpaths, pool.map(safe_hash, relpaths)))
+
+    def build_manifest(self, tool_dir):
+        """(relpath, size, mtime_ns, sha256) of every readable file under tool_dir"""
+        tool_dir = Path(tool_dir)
+        files = self._scan(tool_dir)
+        hashes = self._hash_many(tool_dir, list(files))
+        return [
+            (relpath, stat.st_size, stat.st_mtime_ns, hashes[relpath])
+            for relpath, stat in files.items()
+            if hashes[relpath] is not None
+        ]
+
+    def record(self, tool_name, tool_dir):
+        """Build and store the manifest of a freshly installed tool"""
+        entries = self.build_manifest(tool_dir)
+        self.registry.replace_manifest(tool_name, entries)
+        log.info("Recorded manifest of %d files for %s", len(entries), tool_name)
+        return len(entries)
+
+    def verify(self, tool_name):
+        """
+        Compare an installed tool against its manifest.
+        Returns a dict with ok, missing, modified, hashed and skipped counts;
+        installs without a manifest (pre-dating this check) get one recorded.
+        """
+        tool_info = self.registry.get(tool_name)
+        if not tool_info:
+            return {"ok": False, "error": "not installed", "missing": [], "modified": []}
+
+        if tool_info["state"] == "cold":
+            # Archived tools are checked when they are rehydrated
+            if not Path(tool_info["archive_path"] or "").is_file():
+                return {"ok": False, "error": "cold storage archive is missing", "missing": [], "modified": []}
+            return {"ok": True, "cold": True, "missing": [], "modified": [], "hashed": 0, "skipped": 0}
+
+        tool_dir = Path(tool_info["path"])
+        if not tool_dir.is_dir():
+            return {"ok": False, "error": "tool folder is missing", "missing": [], "modified": []}
+
+        manifest = self.registry.get_manifest(tool_name)
+        if not manifest:
+            recorded = self.record(tool_name, tool_dir)
+            return {"ok": True, "baseline": True, "missing": [], "modified": [],
+                    "hashed": recorded, "skipped": 0}
+
+        files = self._scan(tool_dir)
+        missing = sorted(relpath for relpath in manifest if relpath not in files)
+
+        # Only files whose stat changed need to be read
+        suspects = [
+            relpath for relpath, (size, mtime_ns, _sha) in manifest.items()
+            if relpath in files
+            and (files[relpath].st_size != size or files[relpath].st_mtime_ns != mtime_ns)
+        ]
+        hashes = self._hash_many(tool_dir, suspects)
+
+        modified = []
+        refreshed = []
+        for relpath in suspects:
+            if hashes[relpath] == manifest[relpath][2]:
+                # Same content, just touched: cache the new stat so we skip it next time
+                stat = files[relpath]
+                refreshed.append((relpath, stat.st_size, stat.st_mtime_ns))
+            else:
+                modified.append(relpath)
+        if refreshed:
+            self.registry.refresh_manifest_stats(tool_name, refreshed)
+
+        return {
+            "ok": not missing and not modified,
+            "missing": missing,
+            "modified": sorted(modified),
+            "hashed": len(suspects),
+            "skipped": len(manifest) - len(missing) - len(suspects),
+        }
+
+    def verify_all(self):
+        """Verify every installed tool; returns {tool_name: result}"""
+        return {tool_name: self.verify(tool_name) for tool_name in self.registry.all()}
@@ -0,0 +1,140 @@
+import atexit
+import collections
+import logging
+import sys
+from pathlib import Path
+
+# logging.handlers and queue (socket, pickle, threading...) are imported by
+# start_log_writer(), after the first paint
+
+# Every Triple V logger is a child of this one: get_logger("download") -> "triplev.download"
+ROOT_LOGGER = "triplev"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s [%(threadName)s] %(message)s"
+LOG_FILE_NAME = "triplev.log"
+
+_startup_buffer = None
+_listener = None
+_ring_buffer = None
+
+
+def get_logger(subsystem):
+    """
+    Logger of one subsystem. Safe at import time: records below the configured
+    level are dropped by a cached level check before any formatting, so pass
+    arguments (log.debug("x %s", y)) instead of pre-formatting f-strings.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last records formatted in memory, for the log viewer in the About dialog"""
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.lines = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.lines.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+class StartupBufferHandler(logging.Handler):
+    """Holds records unformatted until start_log_writer() hands them to the writer thread"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def setup_logging(level=None):
+    """
+    Set the Triple V log level and buffer records in memory until
+    start_log_writer() runs. Only needs the logging module itself.
+    """
+    global _startup_buffer
+    if _startup_buffer is not None or _listener is not None:
+        return
+    from config.settings import Settings
+
+    root = logging.getLogger(ROOT_LOGGER)
+    _startup_buffer = StartupBufferHandler()
+    root.addHandler(_startup_buffer)
+    root.propagate = False
+    atexit.register(shutdown_logging)
+
+    level = level or Settings.LOG_LEVEL
+    numeric_level = logging.getLevelName(str(level).upper())
+    if not isinstance(numeric_level, int):
+        get_logger("log").warning("Unknown log level %r, using INFO", level)
+        numeric_level = logging.INFO
+    root.setLevel(numeric_level)
+
+
+def start_log_writer(log_dir=None):
+    """
+    Route all Triple V records through a queue to a background thread that
+    writes a rotating log file, the in-memory ring buffer and, when there is a
+    console, stderr. Logging on the GUI thread is then only a queue put.
+    """
+    global _startup_buffer, _listener, _ring_buffer
+    if _listener is not None:
+        return
+    import logging.handlers
+    import queue
+    from config.settings import Settings
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    _ring_buffer = RingBufferHandler(Settings.LOG_RING_BUFFER_SIZE)
+    handlers = [_ring_buffer]
+    file_error = None
+    try:
+        log_dir = Path(log_dir or Settings.LOG_DIR)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_dir / LOG_FILE_NAME, maxBytes=Settings.LOG_FILE_MAX_BYTES,
+            backupCount=Settings.LOG_FILE_BACKUPS, encoding="utf-8"
+        ))
+    except OSError as e:
+        file_error = e
+    # No stderr in the windowed exe
+    if sys.stderr is not None:
+        handlers.append(logging.StreamHandler(sys.stderr))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root = logging.getLogger(ROOT_LOGGER)
+    root.propagate = False
+    _listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _listener.start()
+    if _startup_buffer is not None:
+        root.removeHandler(_startup_buffer)
+        for record in _startup_buffer.records:
+            queue_handler.handle(record)
+        _startup_buffer = None
+    root.addHandler(queue_handler)
+
+    if file_error is not None:
+        get_logger("log").warning("Could not open the log file, logging to memory only: %s", file_error)
+
+
+def shutdown_logging():
+    """Write out buffered and queued records and stop the writer thread"""
+    global _listener
+    if _startup_buffer is not None and _startup_buffer.records:
+        # Quit (or crashed) before the writer started; keep what was logged
+        start_log_writer()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def recent_lines():
+    """Formatted records kept in memory, oldest first"""
+    return list(_ring_buffer.lines) if _ring_buffer is not None else []
@@ -0,0 +1,271 @@
+import json
+import os
+import random
+import time
+import uuid
+from pathlib import Path
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("outbox")
+
+# smtplib, email and keyring are imported by the delivery task, off the GUI thread
+
+
+def retry_delay(attempts):
+    """Seconds until the next attempt: doubling from OUTBOX_RETRY_BASE_SECONDS up to the max, with jitter"""
+    delay = min(Settings.OUTBOX_RETRY_MAX_SECONDS, Settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+class OutboxCredentialError(Exception):
+    """No password for the sender account; retrying cannot fix this"""
+
+
+def is_permanent(error):
+    """Whether a delivery error will not go away by retrying (missing credential, 5xx reply)"""
+    if isinstance(error, OutboxCredentialError):
+        return True
+    import smtplib
+    return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+def smtp_password(sender):
+    """Password of the sender account from the system keyring, None if none is stored"""
+    try:
+        import keyring
+        return keyring.get_password("Triple_V", sender)
+    except Exception as e:
+        log.warning("Keyring unavailable: %s", e)
+        return None
+
+
+def send_message(message):
+    """Deliver one outbox message to SMTP_HOST:SMTP_PORT (STARTTLS and login as configured)"""
+    import smtplib
+    from email.mime.text import MIMEText
+    msg = MIMEText(message["body"], "plain", "utf-8")
+    msg["From"] = message["from"]
+    msg["To"] = message["to"]
+    msg["Subject"] = message["subject"]
+    # Same Message-ID on every attempt, so a retry after an unclear failure shows up as a duplicate
+    msg["Message-ID"] = message["message_id"]
+
+    password = smtp_password(message["from"])
+    if not password:
+        raise OutboxCredentialError(f"No password for {message['from']} in the system keyring (service Triple_V)")
+    with smtplib.SMTP(Settings.SMTP_HOST, Settings.SMTP_PORT, timeout=Settings.REQUEST_TIMEOUT) as server:
+        if Settings.SMTP_STARTTLS:
+            server.starttls()
+        server.login(message["from"], password)
+        server.send_message(msg)
+
+
+class Outbox:
+    """
+    Emails waiting for delivery, one JSON file each in OUTBOX_DIR, so a vault
+    submission survives a failed send, a crash or quitting Triple V.
+    No Qt here; OutboxSender delivers the messages.
+    """
+
+    SUFFIX = ".json"
+    # Renamed to this while being sent, so two Triple V instances never send the same message
+    CLAIMED_SUFFIX = ".sending"
+    # Given up on (permanent error or OUTBOX_MAX_ATTEMPTS used); kept for the user, never retried
+    FAILED_SUFFIX = ".failed"
+    STALE_CLAIM_SECONDS = 600
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or Settings.OUTBOX_DIR)
+
+    def _write(self, path, message):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(message, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, path)
+
+    def enqueue(self, subject, body, to, sender):
+        """Store a message for delivery; returns its file"""
+        now = time.time()
+        message_id = uuid.uuid4().hex
+        message = {
+            "id": message_id,
+            "message_id": f"<{message_id}@triplev>",
+            "from": sender,
+            "to": to,
+            "subject": subject,
+            "body": body,
+            "created_at": now,
+            "attempts": 0,
+            "next_attempt_at": now,
+            "last_error": None,
+        }
+        # Named by creation time so sorting the files keeps submissions in order
+        path = self.directory / f"{int(now * 1000)}-{message_id}{self.SUFFIX}"
+        self._write(path, message)
+        return path
+
+    def pending(self):
+        """[(path, message)] of undelivered messages, oldest first"""
+        if not self.directory.exists():
+            return []
+        items = []
+        for path in sorted(self.directory.glob("*" + self.SUFFIX)):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    items.append((path, json.load(f)))
+            except (OSError, ValueError) as e:
+                log.warning("Skipping unreadable %s: %s", path.name, e)
+        return items
+
+    def next_due(self):
+        """Earliest next_attempt_at of the waiting messages, None when the outbox is empty"""
+        return min((message["next_attempt_at"] for _path, message in self.pending()), default=None)
+
+    def claim(self, path):
+        """Take a message for sending; None if another sender got it first"""
+        claimed = path.with_suffix(self.CLAIMED_SUFFIX)
+        try:
+            os.replace(path, claimed)
+        except OSError:
+            return None
+        return claimed
+
+    def release_stale_claims(self):
+        """Put back messages whose sender died mid-delivery"""
+        if not self.directory.exists():
+            return
+        now = time.time()
+        for claimed in self.directory.glob("*" + self.CLAIMED_SUFFIX):
+            try:
+                if now - claimed.stat().st_mtime > self.STALE_CLAIM_SECONDS:
+                    os.replace(claimed, claimed.with_suffix(self.SUFFIX))
+            except OSError:
+                continue
+
+    def mark_sent(self, claimed):
+        claimed.unlink(missing_ok=True)
+
+    def mark_failed(self, claimed, message, error):
+        message["attempts"] += 1
+        message["last_error"] = str(error)
+        message["next_attempt_at"] = time.time() + retry_delay(message["attempts"])
+        self._write(claimed.with_suffix(self.SUFFIX), message)
+        claimed.unlink(missing_ok=True)
+
+    def mark_dead(self, claimed, message, error):
+        message["attempts"] += 1
+        message["last_error"] = str(error)
+        message["next_attempt_at"] = None
+        self._write(claimed.with_suffix(self.FAILED_SUFFIX), message)
+        claimed.unlink(missing_ok=True)
+
+
+class OutboxDeliverySignals(QObject):
+    finished = pyqtSignal(int, int, object)  # sent, failed, [(subject, error)] given up on
+
+
+class OutboxDeliveryTask(QRunnable):
+    """Sends every due message on a pool thread, one SMTP session each"""
+
+    def __init__(self, outbox):
+        super().__init__()
+        self.outbox = outbox
+        self.signals = OutboxDeliverySignals()
+
+    def run(self):
+        sent = failed = 0
+        given_up = []
+        now = time.time()
+        for path, message in self.outbox.pending():
+            if message["next_attempt_at"] > now:
+                continue
+            claimed = self.outbox.claim(path)
+            if claimed is None:
+                continue
+            try:
+                send_message(message)
+            except Exception as e:
+                failed += 1
+                if is_permanent(e) or message["attempts"] + 1 >= Settings.OUTBOX_MAX_ATTEMPTS:
+                    self.outbox.mark_dead(claimed, message, e)
+                    given_up.append((message["subject"], str(e)))
+                    log.error("Gave up delivering %r after %d attempts: %s",
+                              message["subject"], message["attempts"], e)
+                else:
+                    self.outbox.mark_failed(claimed, message, e)
+                    log.warning("Delivery of %r failed (attempt %d): %s",
+                                message["subject"], message["attempts"], e)
+            else:
+                self.outbox.mark_sent(claimed)
+                sent += 1
+                log.info("Delivered %r", message["subject"])
+        try:
+            self.signals.finished.emit(sent, failed, given_up)
+        except RuntimeError:
+            # The application quit while a delivery was in flight
+            pass
+
+
+class OutboxSender(QObject):
+    """
+    Delivers the outbox in the background: right after a message is queued,
+    at startup for messages left from earlier sessions, and again when the
+    backoff of a failed message runs out.
+    """
+
+    delivered = pyqtSignal(int)  # number of messages sent by a delivery pass
+    gave_up = pyqtSignal(str, str)  # subject, error of a message that will not be retried
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """The shared sender (created on first use, on the GUI thread)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None, directory=None):
+        super().__init__(parent)
+        self.outbox = Outbox(directory)
+        self._task = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def start(self):
+        self.outbox.release_stale_claims()
+        self.flush()
+
+    def enqueue(self, subject, body, to, sender):
+        """Queue a message and try to send it right away; returns its file"""
+        path = self.outbox.enqueue(subject, body, to, sender)
+        self.flush()
+        return path
+
+    def flush(self):
+        if self._task is not None:
+            # Anything queued meanwhile is picked up by schedule() after this pass
+            return
+        self.timer.stop()
+        self._task = OutboxDeliveryTask(self.outbox)
+        self._task.signals.finished.connect(self.on_finished)
+        QThreadPool.globalInstance().start(self._task)
+
+    def on_finished(self, sent, _failed, given_up):
+        self._task = None
+        if sent:
+            self.delivered.emit(sent)
+        for subject, error in given_up:
+            self.gave_up.emit(subject, error)
+        self.schedule()
+
+    def schedule(self):
+        next_due = self.outbox.next_due()
+        if next_due is None:
+            return
+        delay_ms = max(0, int((next_due - time.time()) * 1000))
+        self.timer.start(min(delay_ms, 2 ** 31 - 1))
@@ -0,0 +1,169 @@
+import os
+import sys
+import time
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from utils.log import get_logger
+
+log = get_logger("supervisor")
+
+# subprocess is imported on the first launch, not at startup
+
+
+def _sample_linux(pid):
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        # Fields after the ")" closing the command name; utime and stime are 14 and 15
+        fields = f.read().rsplit(b")", 1)[1].split()
+    with open(f"/proc/{pid}/statm", "rb") as f:
+        resident_pages = int(f.read().split()[1])
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return cpu_seconds, resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _sample_windows(handle):
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    creation, exit_time, kernel, user = (wintypes.FILETIME() for _ in range(4))
+    if not ctypes.windll.kernel32.GetProcessTimes(
+            handle, ctypes.byref(creation), ctypes.byref(exit_time), ctypes.byref(kernel), ctypes.byref(user)):
+        return None
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    # FILETIME counts 100 ns ticks
+    ticks = sum((t.dwHighDateTime << 32) | t.dwLowDateTime for t in (kernel, user))
+    return ticks / 1e7, counters.WorkingSetSize
+
+
+def sample_process(popen):
+    """(cpu_seconds, rss_bytes) of a running child process, or None where unsupported"""
+    try:
+        if sys.platform.startswith("linux"):
+            return _sample_linux(popen.pid)
+        if sys.platform == "win32":
+            # Popen keeps the process handle open, so no OpenProcess is needed
+            return _sample_windows(int(popen._handle))
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class LaunchedProcess:
+    """A tool process started through ProcessSupervisor.launch()"""
+
+    def __init__(self, tool_name, popen, launch_id):
+        self.tool_name = tool_name
+        self.popen = popen
+        self.pid = popen.pid
+        self.launch_id = launch_id
+        self.started_at = time.time()
+        self.cpu_seconds = None
+        self.cpu_percent = None
+        self.rss_bytes = None
+        self.peak_rss = None
+        self._last_sample = None  # (monotonic time, cpu seconds)
+
+    def sample(self):
+        stats = sample_process(self.popen)
+        if stats is None:
+            return
+        now = time.monotonic()
+        self.cpu_seconds, self.rss_bytes = stats
+        self.peak_rss = max(self.peak_rss or 0, self.rss_bytes)
+        if self._last_sample is not None:
+            elapsed = now - self._last_sample[0]
+            if elapsed > 0:
+                self.cpu_percent = (self.cpu_seconds - self._last_sample[1]) * 100 / elapsed
+        self._last_sample = (now, self.cpu_seconds)
+
+
+class ProcessSupervisor(QObject):
+    """
+    Keeps track of the tools Triple V launched: PID, start time, CPU and RSS
+    and exit code. Samples every SAMPLE_INTERVAL_MS while something runs (a
+    few /proc reads or two Win32 calls per process) and stops when nothing does.
+    Only the launched process itself is tracked, not processes it spawns.
+    """
+
+    process_started = pyqtSignal(str)      # tool name
+    process_exited = pyqtSignal(str, int)  # tool name, exit code
+    stats_updated = pyqtSignal(str)        # tool name
+
+    SAMPLE_INTERVAL_MS = 2000
+
+    def __init__(self, registry, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self._processes = {}  # tool name -> [LaunchedProcess]
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.SAMPLE_INTERVAL_MS)
+        self.timer.timeout.connect(self.sample)
+
+    def launch(self, tool_name, exe_path):
+        """Start exe_path in its own folder and track it"""
+        import subprocess
+        popen = subprocess.Popen(str(exe_path), cwd=str(exe_path.parent))
+        launch_id = self.registry.record_launch(tool_name, popen.pid, time.time())
+        process = LaunchedProcess(tool_name, popen, launch_id)
+        process.sample()
+        self._processes.setdefault(tool_name, []).append(process)
+        if not self.timer.isActive():
+            self.timer.start()
+        log.info("Started %s (PID %d)", tool_name, process.pid)
+        self.process_started.emit(tool_name)
+        return process
+
+    def is_running(self, tool_name):
+        return bool(self._processes.get(tool_name))
+
+    def processes(self, tool_name):
+        return list(self._processes.get(tool_name, ()))
+
+    def stats(self, tool_name):
+        """(cpu_percent, rss_bytes) summed over a tool's running processes; None where unknown"""
+        processes = self._processes.get(tool_name, ())
+        cpu = [p.cpu_percent for p in processes if p.cpu_percent is not None]
+        rss = [p.rss_bytes for p in processes if p.rss_bytes is not None]
+        return (sum(cpu) if cpu else None), (sum(rss) if rss else None)
+
+    def sample(self):
+        for tool_name, processes in list(self._processes.items()):
+            for process in list(processes):
+                exit_code = process.popen.poll()
+                if exit_code is None:
+                    process.sample()
+                    continue
+                processes.remove(process)
+                self._record_exit(process, exit_code)
+            if processes:
+                self.stats_updated.emit(tool_name)
+            else:
+                del self._processes[tool_name]
+        if not self._processes:
+            self.timer.stop()
+
+    def _record_exit(self, process, exit_code):
+        ended_at = time.time()
+        try:
+            self.registry.record_exit(process.launch_id, ended_at, exit_code,
+                                      process.cpu_seconds, process.peak_rss)
+        except Exception as e:
+            log.error("Could not record exit of %s: %s", process.tool_name, e)
+        log.info("%s (PID %d) exited with code %d after %.0f s",
+                 process.tool_name, process.pid, exit_code, ended_at - process.started_at)
+        self.process_exited.emit(process.tool_name, exit_code)
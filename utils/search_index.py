@@ -0,0 +1,279 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens ("Classical_AUTOSAR" -> classical, autosar)"""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _deletes(token):
+    """Token plus every variant with one character removed (SymSpell, distance 1)"""
+    variants = {token}
+    for i in range(len(token)):
+        variants.add(token[:i] + token[i + 1:])
+    return variants
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insert, delete, substitution or swap"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diffs = [i for i in range(len(a)) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return len(diffs) == 2 and diffs[1] == diffs[0] + 1 and \
+            a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    for i in range(len(longer)):
+        if longer[:i] + longer[i + 1:] == shorter:
+            return True
+    return False
+
+
+class SearchIndex:
+    """
+    In-memory inverted index over tool name, description and category.
+
+    Query terms match exactly, as a prefix (so results update while typing) or
+    with one typo, weighted by field (name hits rank above description hits).
+    Every term has to match for a tool to be returned. Tools are added and
+    removed one at a time, so the index follows catalog changes incrementally.
+
+    Postings are sets of document ids per field weight, so scores only take a
+    handful of values: a query is answered with set unions and intersections
+    per score tier, and only the tier that crosses the result limit is ranked
+    by name. Words in most of the catalog (category names like "autosar")
+    stay cheap that way.
+    """
+
+    FIELD_WEIGHTS = {"name": 3.0, "category": 1.0, "description": 1.0}
+    EXACT, PREFIX, FUZZY = 1.0, 0.7, 0.4
+    MIN_FUZZY_LENGTH = 4
+    MAX_PREFIX_EXPANSIONS = 64
+    MIN_TERM_LENGTH = 2
+
+    def __init__(self):
+        self._ids = {}                           # key -> document id
+        self._docs = {}                          # document id -> (tool, category, {token: field weight})
+        self._next_id = 0
+        self._postings = defaultdict(dict)       # token -> {field weight: {document ids}}
+        self._deletes = defaultdict(set)         # deletion variant -> tokens
+        self._vocabulary = []                    # sorted tokens, rebuilt lazily
+        self._vocabulary_dirty = False
+        self._names = []                         # sorted (lowercase name, document id), rebuilt lazily
+        self._name_ids = []                      # document ids in _names order
+        self._name_rank = {}                     # document id -> position in _names
+        self._names_dirty = False
+
+    def __len__(self):
+        return len(self._docs)
+
+    @staticmethod
+    def key_for(category, tool):
+        return (category, tool["name"])
+
+    # ------------------------
+    # Maintenance
+    # ------------------------
+    def add(self, category, tool):
+        """Index (or re-index) a catalog entry"""
+        key = self.key_for(category, tool)
+        if key in self._ids:
+            self.remove(category, tool["name"])
+        doc_id = self._next_id
+        self._next_id += 1
+
+        weights = {}
+        fields = {
+            "name": tool.get("name", ""),
+            "category": category.replace("_", " "),
+            "description": tool.get("description", ""),
+        }
+        for field, text in fields.items():
+            for token in tokenize(text):
+                weights[token] = max(weights.get(token, 0.0), self.FIELD_WEIGHTS[field])
+
+        for token, weight in weights.items():
+            if token not in self._postings:
+                for variant in _deletes(token):
+                    self._deletes[variant].add(token)
+                self._vocabulary_dirty = True
+            self._postings[token].setdefault(weight, set()).add(doc_id)
+        self._ids[key] = doc_id
+        self._docs[doc_id] = (tool, category, weights)
+        self._names_dirty = True
+
+    def remove(self, category, tool_name):
+        doc_id = self._ids.pop((category, tool_name), None)
+        if doc_id is None:
+            return
+        doc = self._docs.pop(doc_id)
+        self._names_dirty = True
+        for token, weight in doc[2].items():
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            doc_ids = postings.get(weight)
+            if doc_ids is not None:
+                doc_ids.discard(doc_id)
+                if not doc_ids:
+                    del postings[weight]
+            if not postings:
+                del self._postings[token]
+                for variant in _deletes(token):
+                    self._deletes[variant].discard(token)
+                    if not self._deletes[variant]:
+                        del self._deletes[variant]
+                self._vocabulary_dirty = True
+
+    def clear(self):
+        self.__init__()
+
+    def prepare(self):
+        """Sort the vocabulary and names now instead of on the next query after a change"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        self._sorted_names()
+
+    # ------------------------
+    # Queries
+    # ------------------------
+    def _prefix_tokens(self, term):
+        if self._vocabulary_dirty:
+            self.prepare()
+        start = bisect_left(self._vocabulary, term)
+        matches = []
+        for token in self._vocabulary[start:start + self.MAX_PREFIX_EXPANSIONS]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def _sorted_names(self):
+        if self._names_dirty:
+            # Ties on the name keep the (category, name) key order
+            self._names = sorted((key[1].lower(), key, doc_id) for key, doc_id in self._ids.items())
+            self._name_ids = [doc_id for _name, _key, doc_id in self._names]
+            self._name_rank = {doc_id: rank for rank, doc_id in enumerate(self._name_ids)}
+            self._names_dirty = False
+        return self._names
+
+    def _result(self, doc_id, score):
+        tool, category, _weights = self._docs[doc_id]
+        return category, tool, score
+
+    def _name_prefix_matches(self, needle, limit):
+        """Tools whose name starts with needle, alphabetically"""
+        names = self._sorted_names()
+        start = bisect_left(names, (needle,))
+        matches = []
+        for name, _key, doc_id in names[start:start + limit]:
+            if not name.startswith(needle):
+                break
+            matches.append(self._result(doc_id, self.FIELD_WEIGHTS["name"]))
+        return matches
+
+    def _name_prefix_ids(self, needle):
+        """Document ids of every tool whose name starts with needle"""
+        names = self._sorted_names()
+        start = bisect_left(names, (needle,))
+        end = bisect_left(names, (needle + "\uffff",), start)
+        return set(self._name_ids[start:end])
+
+    def _fuzzy_tokens(self, term):
+        candidates = set()
+        for variant in _deletes(term):
+            candidates.update(self._deletes.get(variant, ()))
+        return [token for token in candidates if _within_one_edit(term, token)]
+
+    def _term_tiers(self, term):
+        """[(score, document ids)] for one query term, best first; each id is only in its best tier"""
+        sources = defaultdict(list)
+
+        def merge(token, quality):
+            for weight, doc_ids in self._postings.get(token, {}).items():
+                sources[weight * quality].append(doc_ids)
+
+        merge(term, self.EXACT)
+        for token in self._prefix_tokens(term):
+            if token != term:
+                merge(token, self.PREFIX)
+        if len(term) >= self.MIN_FUZZY_LENGTH:
+            for token in self._fuzzy_tokens(term):
+                if token != term and not token.startswith(term):
+                    merge(token, self.FUZZY)
+
+        # Postings are never modified here: single sources are used as they are
+        ordered = []
+        seen = None
+        scores = sorted(sources, reverse=True)
+        for i, score in enumerate(scores):
+            doc_ids = sources[score][0] if len(sources[score]) == 1 else set().union(*sources[score])
+            if seen is not None:
+                doc_ids = doc_ids - seen
+            if not doc_ids:
+                continue
+            ordered.append((score, doc_ids))
+            if i + 1 < len(scores):
+                seen = doc_ids | seen if seen is not None else doc_ids
+        return ordered
+
+    def search(self, query, limit=100):
+        """
+        Return [(category, tool, score)] best first.
+        All terms must match; a tool name starting with the query gets a bonus.
+        """
+        needle = query.strip().lower()
+        terms = tokenize(needle)
+        if not terms:
+            return []
+        if len(needle) < self.MIN_TERM_LENGTH:
+            # A single character matches half the vocabulary; stick to name prefixes
+            return self._name_prefix_matches(needle, limit)
+
+        # (total score, document ids) groups: every combination of one tier per term.
+        # Most selective terms first so the groups shrink quickly.
+        per_term = sorted((self._term_tiers(term) for term in terms),
+                          key=lambda tiers: sum(len(doc_ids) for _score, doc_ids in tiers))
+        groups = per_term[0]
+        for tiers in per_term[1:]:
+            groups = [(total + score, matched & doc_ids) for total, matched in groups for score, doc_ids in tiers]
+            groups = [(total, doc_ids) for total, doc_ids in groups if doc_ids]
+            if not groups:
+                return []
+
+        prefixed = self._name_prefix_ids(needle)
+        if prefixed:
+            split = []
+            for total, doc_ids in groups:
+                split.append((total + 2.0, doc_ids & prefixed))
+                split.append((total, doc_ids - prefixed))
+            groups = [(total, doc_ids) for total, doc_ids in split if doc_ids]
+
+        by_total = defaultdict(list)
+        for total, doc_ids in groups:
+            by_total[round(total, 6)].append(doc_ids)
+        results = []
+        for total in sorted(by_total, reverse=True):
+            tier = by_total[total]
+            doc_ids = tier[0] if len(tier) == 1 else set().union(*tier)
+            wanted = limit - len(results)
+            # Equal scores list alphabetically. The tier crossing the limit is read off the
+            # name-sorted ids, which stops after `wanted` hits instead of ranking the whole tier.
+            if len(doc_ids) > wanted:
+                best = list(islice(filter(doc_ids.__contains__, self._name_ids), wanted))
+            else:
+                best = sorted(doc_ids, key=self._name_rank.__getitem__)
+            results.extend(self._result(doc_id, total) for doc_id in best)
+            if len(results) >= limit:
+                break
+        return results
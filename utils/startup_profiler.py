@@ -0,0 +1,197 @@
+"""
+Startup profiling for `main.py --profile-startup`.
+
+Only uses the standard library so it can be imported (and the import hook
+installed) before PyQt5 or any application module is loaded.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+
+class _TimedLoader:
+    """Wraps a module loader so executing the module is recorded as a span"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._profiler.span(module.__name__, category="import"):
+            self._loader.exec_module(module)
+
+
+class _ImportTimer:
+    """Meta path finder that defers to the real finders and times what they load"""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._finding = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._finding.active = False
+
+
+class StartupProfiler:
+    """
+    Records startup phases and per-module import times, then writes a text
+    report and a Chrome trace (open in chrome://tracing or ui.perfetto.dev).
+    Does nothing until start() is called.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events = []                 # (name, category, start, end, thread id)
+        self.pre_python_ms = None
+        self._import_timer = None
+
+    def start(self, origin=None):
+        """Begin recording; origin is the perf_counter() taken first thing in main.py"""
+        self.enabled = True
+        if origin is not None:
+            self.origin = origin
+        self.pre_python_ms = self._measure_bootloader()
+        self._import_timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._import_timer)
+
+    @staticmethod
+    def _measure_bootloader():
+        """PyInstaller onefile: time from unpacking start (temp dir creation) until now"""
+        bundle_dir = getattr(sys, "_MEIPASS", None)
+        if not bundle_dir or not getattr(sys, "frozen", False):
+            return None
+        try:
+            return max(0.0, (time.time() - os.stat(bundle_dir).st_ctime) * 1000)
+        except OSError:
+            return None
+
+    @contextmanager
+    def _record(self, name, category):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append((name, category, start, time.perf_counter(), threading.get_ident()))
+
+    def span(self, name, category="phase"):
+        """Context manager timing a block; free when profiling is off"""
+        if not self.enabled:
+            return nullcontext()
+        return self._record(name, category)
+
+    def mark(self, name):
+        """Instant event, e.g. first paint"""
+        if self.enabled:
+            now = time.perf_counter()
+            self.events.append((name, "mark", now, now, threading.get_ident()))
+
+    def stop(self):
+        self.enabled = False
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        self._import_timer = None
+
+    # ------------------------
+    # Reports
+    # ------------------------
+    def _ms(self, seconds):
+        return seconds * 1000
+
+    def import_self_times(self):
+        """[(module, self ms, total ms)] with nested imports subtracted, slowest first"""
+        imports = sorted(
+            (event for event in self.events if event[1] == "import"),
+            key=lambda event: (event[2], -event[3]),
+        )
+        results = []
+        stack = []
+        children = {}
+        for index, (name, _category, start, end, _thread) in enumerate(imports):
+            while stack and imports[stack[-1]][3] <= start:
+                stack.pop()
+            if stack:
+                parent = stack[-1]
+                children[parent] = children.get(parent, 0.0) + (end - start)
+            stack.append(index)
+        for index, (name, _category, start, end, _thread) in enumerate(imports):
+            total = end - start
+            results.append((name, self._ms(total - children.get(index, 0.0)), self._ms(total)))
+        return sorted(results, key=lambda item: item[1], reverse=True)
+
+    def report(self, top=30):
+        lines = ["Triple V startup profile", "=" * 60]
+        if self.pre_python_ms is not None:
+            lines.append(f"{'Bootloader unpack (before Python)':<44}{self.pre_python_ms:>10.1f} ms")
+        for name, category, start, end, _thread in self.events:
+            if category == "phase":
+                lines.append(f"{name:<44}{self._ms(end - start):>10.1f} ms  (at {self._ms(start - self.origin):.0f} ms)")
+            elif category == "mark":
+                lines.append(f"{name:<44}{'':>10}     at {self._ms(start - self.origin):.0f} ms")
+
+        imports = self.import_self_times()
+        lines += [
+            "",
+            f"Imports: {len(imports)} modules, {sum(item[1] for item in imports):.1f} ms total",
+            f"{'module':<44}{'self':>10}{'cumulative':>14}",
+            "-" * 68,
+        ]
+        for name, self_ms, total_ms in imports[:top]:
+            lines.append(f"{name:<44}{self_ms:>8.1f} ms{total_ms:>11.1f} ms")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Chrome trace event format (complete events in microseconds)"""
+        pid = os.getpid()
+        trace = []
+        if self.pre_python_ms is not None:
+            trace.append({"name": "Bootloader unpack", "cat": "phase", "ph": "X", "pid": pid, "tid": 0,
+                          "ts": -self.pre_python_ms * 1000, "dur": self.pre_python_ms * 1000})
+        for name, category, start, end, thread in self.events:
+            event = {"name": name, "cat": category, "pid": pid, "tid": thread,
+                     "ts": (start - self.origin) * 1e6}
+            if category == "mark":
+                event.update(ph="i", s="g")
+            else:
+                event.update(ph="X", dur=(end - start) * 1e6)
+            trace.append(event)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write(self, directory):
+        """Write startup_profile.txt and startup_trace.json; returns their paths"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        report_path = directory / "startup_profile.txt"
+        trace_path = directory / "startup_trace.json"
+        report_path.write_text(self.report(), encoding="utf-8")
+        trace_path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return report_path, trace_path
+
+
+# Shared instance; main.py starts it when launched with --profile-startup
+profiler = StartupProfiler()
@@ -0,0 +1,58 @@
+import json
+import os
+import time
+from pathlib import Path
+from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("snapshot")
+
+
+class StateSnapshot:
+    """
+    Last known catalog, install state, update availability and resolved
+    download URLs, saved on exit and when idle so the next launch can render
+    right away and reconcile with GitHub in the background.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = Path(path or Settings.STATE_SNAPSHOT_FILE)
+
+    def load(self):
+        """The saved snapshot dict, or None if missing, unreadable or from another format"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable snapshot: %s", e)
+            return None
+        if not isinstance(data, dict) or data.get("format") != self.FORMAT_VERSION:
+            return None
+        return data
+
+    def save(self, catalog, installed_versions, latest_versions, resolved_urls):
+        """
+        Write the snapshot atomically.
+        latest_versions maps tool name -> latest remote version (None when up to date)
+        for the installed version recorded in installed_versions.
+        """
+        data = {
+            "format": self.FORMAT_VERSION,
+            "saved_at": time.time(),
+            "catalog": catalog,
+            "installed_versions": installed_versions,
+            "latest_versions": latest_versions,
+            "resolved_urls": resolved_urls,
+        }
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            log.warning("Could not save snapshot: %s", e)
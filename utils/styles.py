@@ -1,7 +1,11 @@
 from config.settings import Settings
 
 def load_stylesheet():
-    """Load the global stylesheet for the application"""
+    """
+    Load the global stylesheet for the application.
+    Widgets opt into a style through their object name (e.g. "PrimaryButton")
+    and switch variants through the dynamic "state" property, see set_state().
+    """
     return f"""
         /* Global styles */
         QWidget {{
@@ -9,23 +13,23 @@ def load_stylesheet():
             color: {Settings.TEXT_COLOR};
             font-family: 'Segoe UI', Arial, sans-serif;
         }}
-        
+
         QScrollBar:vertical {{
             background-color: {Settings.SURFACE_COLOR};
             width: 10px;
             border-radius: 5px;
         }}
-        
+
         QScrollBar::handle:vertical {{
             background-color: {Settings.PRIMARY_COLOR};
             border-radius: 5px;
             min-height: 20px;
         }}
-        
+
         QScrollBar::handle:vertical:hover {{
             background-color: {Settings.SECONDARY_COLOR};
         }}
-        
+
         QToolTip {{
             background-color: {Settings.SURFACE_COLOR};
             color: {Settings.TEXT_COLOR};
@@ -33,4 +37,283 @@ def load_stylesheet():
             padding: 5px;
             border-radius: 4px;
         }}
-    """
\ No newline at end of file
+
+        /* Labels */
+        QLabel#AccentLabel {{
+            color: {Settings.PRIMARY_COLOR};
+        }}
+
+        QLabel#LightLabel {{
+            color: #ccc;
+        }}
+
+        QLabel#SecondaryLabel {{
+            color: #aaa;
+        }}
+
+        QLabel#MutedLabel {{
+            color: #888;
+        }}
+
+        QLabel#MutedLabel[state="running"] {{
+            color: {Settings.SUCCESS_COLOR};
+        }}
+
+        QLabel#EmptyLabel {{
+            color: #666;
+        }}
+
+        QLabel#ErrorLabel {{
+            color: #ff4444;
+            font-size: 12px;
+            padding: 5px 0;
+        }}
+
+        QLabel#RepoCheckLabel {{
+            color: #888;
+            font-size: 12px;
+        }}
+
+        QLabel#RepoCheckLabel[state="ok"] {{
+            color: {Settings.SUCCESS_COLOR};
+        }}
+
+        QLabel#RepoCheckLabel[state="warning"] {{
+            color: #ff9900;
+        }}
+
+        QLabel#RepoCheckLabel[state="error"] {{
+            color: #ff4444;
+        }}
+
+        QLabel#SplashLabel {{
+            background-color: {Settings.PRIMARY_COLOR};
+            color: {Settings.BACKGROUND_COLOR};
+            padding: 40px 60px;
+            border-radius: 16px;
+        }}
+
+        /* Cards: the #name selector keeps the card frame off its child labels (QLabel is a QFrame) */
+        QFrame#ToolCard, QFrame#MyToolCard {{
+            background-color: #2a2a2a;
+            border: 1px solid #444;
+            border-radius: 12px;
+        }}
+
+        QFrame#ToolCard:hover, QFrame#MyToolCard:hover {{
+            border-color: {Settings.PRIMARY_COLOR};
+        }}
+
+        QFrame#ToolCard QLabel, QFrame#MyToolCard QLabel {{
+            background-color: transparent;
+            border: none;
+        }}
+
+        QListView#ToolGrid {{
+            background-color: transparent;
+            border: none;
+        }}
+
+        /* Buttons */
+        QPushButton#PrimaryButton {{
+            background-color: {Settings.PRIMARY_COLOR};
+            border: none;
+            border-radius: 6px;
+            color: {Settings.BACKGROUND_COLOR};
+            font-weight: bold;
+            padding: 0 15px;
+        }}
+
+        QPushButton#PrimaryButton:hover {{
+            background-color: {Settings.SECONDARY_COLOR};
+        }}
+
+        QPushButton#PrimaryButton[state="update"] {{
+            background-color: #ff9900;
+        }}
+
+        QPushButton#PrimaryButton[state="update"]:hover {{
+            background-color: #ffaa00;
+        }}
+
+        QPushButton#PrimaryButton:disabled {{
+            background-color: #444;
+            border: 1px solid #555;
+            color: #888;
+        }}
+
+        QPushButton#SecondaryButton, QPushButton#IconButton {{
+            background-color: #333;
+            border: 1px solid #555;
+            border-radius: 6px;
+            color: white;
+            font-weight: bold;
+            padding: 0 15px;
+        }}
+
+        QPushButton#IconButton {{
+            font-size: 16px;
+            font-weight: normal;
+            padding: 0;
+        }}
+
+        QPushButton#SecondaryButton:hover, QPushButton#IconButton:hover {{
+            background-color: #444;
+            border-color: {Settings.PRIMARY_COLOR};
+        }}
+
+        QPushButton#OutlineButton {{
+            background-color: transparent;
+            border: 2px solid {Settings.PRIMARY_COLOR};
+            border-radius: 8px;
+            color: {Settings.PRIMARY_COLOR};
+            font-size: 14px;
+            font-weight: bold;
+        }}
+
+        QPushButton#OutlineButton:hover {{
+            background-color: {Settings.PRIMARY_COLOR};
+            color: {Settings.BACKGROUND_COLOR};
+        }}
+
+        QPushButton#SubmitButton {{
+            background-color: {Settings.PRIMARY_COLOR};
+            border: none;
+            border-radius: 8px;
+            color: {Settings.BACKGROUND_COLOR};
+            font-size: 16px;
+            font-weight: bold;
+        }}
+
+        QPushButton#SubmitButton:hover {{
+            background-color: {Settings.SECONDARY_COLOR};
+        }}
+
+        QPushButton#SubmitButton:disabled {{
+            background-color: #444;
+            color: #888;
+        }}
+
+        QPushButton#SidebarToggle {{
+            background-color: transparent;
+            border: none;
+        }}
+
+        /* Sidebar */
+        QWidget#Sidebar {{
+            background-color: #151515;
+        }}
+
+        /* Inputs */
+        QLineEdit#SearchInput, QLineEdit#FormInput, QTextEdit#FormInput, QComboBox#FormInput {{
+            background-color: rgba(255, 255, 255, 0.05);
+            border: 2px solid #444;
+            border-radius: 8px;
+            padding: 12px 15px;
+            color: {Settings.TEXT_COLOR};
+            font-size: 14px;
+        }}
+
+        QLineEdit#SearchInput {{
+            padding: 0 15px;
+        }}
+
+        QLineEdit#FormInput, QComboBox#FormInput {{
+            min-height: 25px;
+        }}
+
+        QLineEdit#FormInput[state="emoji"] {{
+            font-size: 20px;
+        }}
+
+        QLineEdit#SearchInput:focus, QLineEdit#FormInput:focus, QTextEdit#FormInput:focus {{
+            border-color: {Settings.PRIMARY_COLOR};
+            background-color: rgba(0, 255, 136, 0.05);
+        }}
+
+        QComboBox#FormInput:focus {{
+            border-color: {Settings.PRIMARY_COLOR};
+        }}
+
+        QComboBox#FormInput::drop-down {{
+            border: none;
+            width: 30px;
+        }}
+
+        QComboBox#FormInput::down-arrow {{
+            image: none;
+            border-left: 5px solid transparent;
+            border-right: 5px solid transparent;
+            border-top: 5px solid {Settings.PRIMARY_COLOR};
+            margin-right: 10px;
+        }}
+
+        QComboBox#FormInput QAbstractItemView {{
+            background-color: {Settings.SURFACE_COLOR};
+            border: 1px solid {Settings.PRIMARY_COLOR};
+            selection-background-color: {Settings.PRIMARY_COLOR};
+            color: {Settings.TEXT_COLOR};
+        }}
+
+        QCheckBox#ConfirmCheckBox {{
+            color: {Settings.TEXT_COLOR};
+            spacing: 10px;
+            padding: 5px 0;
+        }}
+
+        /* Draw a light border so the user sees a checkbox box */
+        QCheckBox#ConfirmCheckBox::indicator {{
+            width: 18px;
+            height: 18px;
+            border: 2px solid {Settings.PRIMARY_COLOR};
+            border-radius: 3px;
+            background-color: {Settings.BACKGROUND_COLOR};
+        }}
+
+        /* When checked, let Qt draw the standard checkmark over the colored box */
+        QCheckBox#ConfirmCheckBox::indicator:checked {{
+            background-color: {Settings.PRIMARY_COLOR};
+        }}
+
+        /* Update banner */
+        QFrame#UpdateBanner {{
+            background-color: {Settings.SURFACE_COLOR};
+            border-bottom: 1px solid {Settings.PRIMARY_COLOR};
+        }}
+
+        QFrame#UpdateBanner QLabel {{
+            background-color: transparent;
+        }}
+
+        /* Dialogs */
+        QScrollArea#FormScroll {{
+            background-color: transparent;
+            border: none;
+        }}
+
+        QDialog#AboutDialog, QDialog#LogDialog {{
+            background-color: {Settings.SURFACE_COLOR};
+            border: 2px solid {Settings.PRIMARY_COLOR};
+            border-radius: 16px;
+        }}
+
+        QPlainTextEdit#LogView {{
+            background-color: rgba(0, 0, 0, 0.3);
+            border: 1px solid #444;
+            border-radius: 8px;
+            color: {Settings.TEXT_COLOR};
+        }}
+    """
+
+
+def set_state(widget, state):
+    """
+    Switch a widget's "state" property (matched by [state="..."] rules) and
+    re-polish just that widget; nothing is re-parsed
+    """
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -0,0 +1,578 @@
+from collections import OrderedDict, ChainMap
+from pathlib import Path
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, QFileSystemWatcher, QTimer
+from PyQt5.QtWidgets import QApplication
+from config.settings import Settings
+from utils.download_manager import DownloadManager
+from utils.search_index import SearchIndex
+from utils.catalog_sync import CatalogSync, merge_catalogs
+from config.catalog_store import CatalogStore, tools_digest
+from utils.state_snapshot import StateSnapshot
+from utils.tool_update_stager import ToolUpdateStager
+from utils.process_supervisor import ProcessSupervisor
+from utils.log import get_logger
+
+log = get_logger("repository")
+
+
+def _category_source(catalog, category):
+    """The mapping holding a category: catalog itself, or the first map of a merged ChainMap that has it"""
+    if isinstance(catalog, ChainMap):
+        return next((m for m in catalog.maps if category in m), None)
+    return catalog if category in catalog else None
+
+
+def _category_digest(source, category):
+    """tools_digest() of a category, read from the index of a sharded catalog (None if it predates digests)"""
+    if isinstance(source, CatalogStore):
+        return source.digest(category)
+    return tools_digest(source[category])
+
+
+class StatusCheckSignals(QObject):
+    finished = pyqtSignal(str, object)  # tool name, latest version (None when up to date)
+
+
+class StatusCheckTask(QRunnable):
+    """Fetches a tool's remote config on a pool thread and reports the latest version"""
+
+    def __init__(self, download_manager, tool_name, github_url, installed_version):
+        super().__init__()
+        self.download_manager = download_manager
+        self.tool_name = tool_name
+        self.github_url = github_url
+        self.installed_version = installed_version
+        self.signals = StatusCheckSignals()
+
+    def run(self):
+        latest = None
+        try:
+            has_update, latest_version = self.download_manager.check_tool_update(
+                self.github_url, self.installed_version
+            )
+            if has_update:
+                latest = latest_version
+        except Exception as e:
+            log.warning("Status check failed for %s: %s", self.tool_name, e)
+        try:
+            self.signals.finished.emit(self.tool_name, latest)
+        except RuntimeError:
+            # The application quit while this check was still running
+            pass
+
+
+
+def build_search_index(catalog):
+    """A SearchIndex over every tool of the catalog, ready for its first query"""
+    index = SearchIndex()
+    for category, tools in catalog.items():
+        for tool in tools:
+            index.add(category, tool)
+    index.prepare()
+    return index
+
+
+class SearchIndexSignals(QObject):
+    finished = pyqtSignal(object, object)  # catalog, SearchIndex built from it
+
+
+class SearchIndexBuildTask(QRunnable):
+    """Builds the search index of a catalog on a pool thread, so no keystroke waits for it"""
+
+    def __init__(self, catalog):
+        super().__init__()
+        self.catalog = catalog
+        self.signals = SearchIndexSignals()
+
+    def run(self):
+        index = build_search_index(self.catalog)
+        try:
+            self.signals.finished.emit(self.catalog, index)
+        except RuntimeError:
+            # The application quit while the index was being built
+            pass
+
+
+class ToolRepository(QObject):
+    """
+    Single in-memory source of truth for the tool catalog, install state and
+    update state, shared by every view and card.
+
+    The catalog is parsed once, the installed-tools registry is read once and
+    then kept current by watching the database and downloads folder, and
+    changes are pushed to subscribers through fine-grained signals instead of
+    every card owning a DownloadManager and polling.
+    """
+
+    tool_installed = pyqtSignal(str)          # tool name
+    tool_removed = pyqtSignal(str)            # tool name
+    tool_changed = pyqtSignal(str)            # registry entry changed (version, state, path...)
+    update_available = pyqtSignal(str, str)   # tool name, latest version
+    status_changed = pyqtSignal(str)          # install/update status of a tool was resolved
+    catalog_changed = pyqtSignal()            # the catalog differs from the one shown so far
+    category_changed = pyqtSignal(str)        # category whose tool list changed (emitted before catalog_changed)
+    progress = pyqtSignal(str, int)           # tool name, download percent
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """The shared repository (created on first use, on the GUI thread)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.download_manager = DownloadManager()
+        self.registry = self.download_manager.registry
+
+        self._catalog = None
+        self._merged = None  # (bundled, remote, merged) behind load_catalog()
+        self._search_index = None
+        self._search_index_task = None
+        self.catalog_sync = CatalogSync(self)
+        self.catalog_sync.catalog_updated.connect(self.reload_catalog)
+        self._installed = self.registry.all()
+        self._present = self._folders_present(self._installed)
+        # tool name -> latest remote version (None when up to date)
+        self._latest_versions = {}
+        # Statuses restored from the last session's snapshot, not yet re-checked
+        self._stale = set()
+        self.snapshot = StateSnapshot()
+        self.snapshot_timer = QTimer(self)
+        self.snapshot_timer.setSingleShot(True)
+        self.snapshot_timer.setInterval(Settings.STATE_SNAPSHOT_SAVE_DELAY_MS)
+        self.snapshot_timer.timeout.connect(self.save_snapshot)
+        self.restore_snapshot()
+
+        # Status checks waiting for a worker (front = most urgent) and in flight
+        self._pending = OrderedDict()
+        self._running = {}
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(Settings.STATUS_CHECK_WORKERS)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+        # Tools launched from Triple V (running indicator, single instance, launch history)
+        self.supervisor = ProcessSupervisor(self.registry, self)
+        self.update_stager = ToolUpdateStager(self)
+        self.update_stager.tool_staged.connect(lambda tool_name, _version: self.status_changed.emit(tool_name))
+
+        self.init_watcher()
+        self.init_catalog_watcher()
+
+    # ------------------------
+    # Catalog
+    # ------------------------
+    def catalog(self):
+        """The tools registry, parsed once"""
+        if self._catalog is None:
+            self._catalog = self.load_catalog()
+        return self._catalog
+
+    def load_catalog(self):
+        """The bundled registry with the last synced remote catalog merged over it"""
+        bundled = Settings.load_catalog()
+        remote = self.catalog_sync.cached_catalog()
+        # Same inputs, same object: apply_catalog() then sees nothing changed without comparing
+        if self._merged is None or self._merged[0] is not bundled or self._merged[1] is not remote:
+            self._merged = (bundled, remote, merge_catalogs(bundled, remote))
+        return self._merged[2]
+
+    def is_sharded(self):
+        return isinstance(Settings.load_catalog(), CatalogStore)
+
+    def tools_in_category(self, category):
+        return self.catalog().get(category, [])
+
+    def category_pages(self, category):
+        """
+        Yield the tools of a category in pages of CATALOG_PAGE_SIZE. Pages of a
+        sharded catalog are only parsed when the iteration reaches them.
+        """
+        source = _category_source(self.catalog(), category) or {}
+        if isinstance(source, CatalogStore) and not source.is_loaded(category):
+            for page in range(source.page_count(category)):
+                yield source.page(category, page)
+            return
+        tools = source.get(category, [])
+        for start in range(0, len(tools), Settings.CATALOG_PAGE_SIZE):
+            yield tools[start:start + Settings.CATALOG_PAGE_SIZE]
+
+    def search_index(self):
+        """
+        Inverted index over the catalog. Normally built in background by
+        prepare_search_index(); a search before that builds it here.
+        """
+        if self._search_index is None:
+            self._search_index = build_search_index(self.catalog())
+        return self._search_index
+
+    def prepare_search_index(self):
+        """Build the search index on a pool thread once the catalog is loaded"""
+        if self._search_index is not None or self._search_index_task is not None:
+            return
+        self._search_index_task = SearchIndexBuildTask(self.catalog())
+        self._search_index_task.signals.finished.connect(self.on_search_index_built)
+        QThreadPool.globalInstance().start(self._search_index_task)
+
+    def on_search_index_built(self, catalog, index):
+        self._search_index_task = None
+        if self._search_index is not None:
+            # A search came first and built it
+            return
+        if catalog is not self._catalog:
+            # The catalog changed meanwhile; the index has to cover the current one
+            self.prepare_search_index()
+            return
+        self._search_index = index
+
+    def search(self, query, limit=100):
+        """[(category, tool, score)] best match first"""
+        return self.search_index().search(query, limit)
+
+    def apply_catalog(self, catalog):
+        """
+        Switch to a newly parsed catalog. Only categories whose tool list
+        differs are announced, and the search index is patched per tool.
+        """
+        old = self.catalog()
+        if catalog is old:
+            return False
+
+        changed = []
+        for category in list(old) + [c for c in catalog if c not in old]:
+            if self._same_category(old, catalog, category):
+                continue
+            changed.append(category)
+            old_tools = old.get(category, [])
+            new_tools = catalog.get(category, [])
+            if self._search_index is not None:
+                new_by_name = {tool["name"]: tool for tool in new_tools}
+                for tool in old_tools:
+                    if tool["name"] not in new_by_name:
+                        self._search_index.remove(category, tool["name"])
+                old_by_name = {tool["name"]: tool for tool in old_tools}
+                for tool in new_tools:
+                    if old_by_name.get(tool["name"]) != tool:
+                        self._search_index.add(category, tool)
+
+        self._catalog = catalog
+        if not changed:
+            return False
+        if self._search_index is not None:
+            self._search_index.prepare()
+        log.info("Catalog changed in: %s", ", ".join(changed))
+        for category in changed:
+            self.category_changed.emit(category)
+        self.catalog_changed.emit()
+        self.schedule_snapshot()
+        return True
+
+    @staticmethod
+    def _same_category(old, new, category):
+        """
+        Whether a category has the same tools in both catalogs. Sharded
+        categories are compared by the digest in their index, so neither
+        side's pages are parsed just to find out nothing changed.
+        """
+        old_source = _category_source(old, category)
+        new_source = _category_source(new, category)
+        if old_source is None or new_source is None:
+            return old_source is new_source
+        # Stores and synced catalogs are never modified in place
+        if old_source is new_source:
+            return True
+        if isinstance(old_source, CatalogStore) or isinstance(new_source, CatalogStore):
+            old_digest = _category_digest(old_source, category)
+            new_digest = _category_digest(new_source, category)
+            if old_digest is not None and new_digest is not None:
+                return old_digest == new_digest
+        return old_source[category] == new_source[category]
+
+    # ------------------------
+    # Install state
+    # ------------------------
+    def installed_tools(self):
+        """{tool_name: info} of installed tools, in install order"""
+        return self._installed
+
+    def installed_info(self, tool_name):
+        return self._installed.get(tool_name)
+
+    def is_tool_installed(self, tool_name):
+        """Same contract as DownloadManager.is_tool_installed, without a database read"""
+        tool_info = self._installed.get(tool_name)
+        if tool_info and (tool_info["state"] == "cold" or Path(tool_info["path"]).exists()):
+            return True, tool_info["version"]
+        return False, None
+
+    def latest_version(self, tool_name):
+        """Latest known remote version if an update is available, else None"""
+        return self._latest_versions.get(tool_name)
+
+    def pending_updates(self):
+        """(tool name, latest version, github url) of installed tools with a known update"""
+        return [
+            (tool_name, latest, self._installed[tool_name]["github_url"])
+            for tool_name, latest in self._latest_versions.items()
+            if latest and tool_name in self._installed
+        ]
+
+    def is_update_staged(self, tool_name):
+        """True if the latest version is already downloaded, so Update is instant"""
+        latest = self.latest_version(tool_name)
+        if not latest:
+            return False
+        staged = self.download_manager.staged_update(tool_name)
+        return staged is not None and staged["version"] == latest
+
+    def has_status(self, tool_name):
+        return tool_name in self._latest_versions
+
+    def is_stale(self, tool_name):
+        """True while the status shown comes from the last session and is being re-checked"""
+        return tool_name in self._stale
+
+    def is_checking(self, tool_name):
+        return tool_name in self._pending or tool_name in self._running
+
+    @staticmethod
+    def _folders_present(installed):
+        return {tool_name: Path(info["path"]).exists() for tool_name, info in installed.items()}
+
+    def reload_installed(self, invalidate_status=True):
+        """Re-read the registry and emit signals for what changed"""
+        installed = self.registry.all()
+        present = self._folders_present(installed)
+        previous, self._installed = self._installed, installed
+        previous_present, self._present = self._present, present
+
+        if previous != installed:
+            self.schedule_snapshot()
+        for tool_name in previous:
+            if tool_name not in installed:
+                self._latest_versions.pop(tool_name, None)
+                self._stale.discard(tool_name)
+                self.tool_removed.emit(tool_name)
+        for tool_name, tool_info in installed.items():
+            if tool_name not in previous:
+                self.tool_installed.emit(tool_name)
+            elif previous[tool_name] != tool_info or previous_present[tool_name] != present[tool_name]:
+                self.tool_changed.emit(tool_name)
+
+        # A new or different version invalidates what we knew about its updates
+        if invalidate_status:
+            for tool_name, tool_info in installed.items():
+                old_info = previous.get(tool_name)
+                if old_info is None or old_info["version"] != tool_info["version"]:
+                    self._latest_versions.pop(tool_name, None)
+                    self._stale.discard(tool_name)
+                    self.status_changed.emit(tool_name)
+
+    # ------------------------
+    # Update state
+    # ------------------------
+    def request_status(self, tool_name, github_url, priority=False):
+        """
+        Queue a background status check for a tool.
+        Tools that aren't installed are resolved immediately without a network call;
+        priority=True puts the check in front of the queue (e.g. visible cards).
+        """
+        if tool_name in self._running:
+            return
+        if tool_name in self._latest_versions and tool_name not in self._stale:
+            return
+        if tool_name in self._pending:
+            if priority:
+                self._pending.move_to_end(tool_name, last=False)
+            return
+
+        is_installed, installed_version = self.is_tool_installed(tool_name)
+        if not is_installed:
+            # Nothing to ask GitHub; the card already shows "Download"
+            return
+
+        self._pending[tool_name] = (github_url, installed_version)
+        if priority:
+            self._pending.move_to_end(tool_name, last=False)
+        self._dispatch()
+
+    def prioritize(self, tool_names):
+        """Move queued checks for these tools (in this order) to the front"""
+        for tool_name in reversed(list(tool_names)):
+            if tool_name in self._pending:
+                self._pending.move_to_end(tool_name, last=False)
+
+    def _dispatch(self):
+        while self._pending and len(self._running) < Settings.STATUS_CHECK_WORKERS:
+            tool_name, (github_url, installed_version) = self._pending.popitem(last=False)
+            task = StatusCheckTask(self.download_manager, tool_name, github_url, installed_version)
+            task.signals.finished.connect(self._on_status_checked)
+            self._running[tool_name] = task
+            self.thread_pool.start(task)
+
+    def _on_status_checked(self, tool_name, latest):
+        self._running.pop(tool_name, None)
+        self._latest_versions[tool_name] = latest
+        self._stale.discard(tool_name)
+        self.schedule_snapshot()
+
+        if latest:
+            self.update_available.emit(tool_name, latest)
+        self.status_changed.emit(tool_name)
+        self._dispatch()
+
+    def shutdown(self):
+        """Drop queued checks, give running ones a moment to finish and save the snapshot"""
+        self._pending.clear()
+        self.catalog_sync.stop()
+        self.update_stager.stop()
+        self.thread_pool.waitForDone(1000)
+        self.save_snapshot()
+
+    # ------------------------
+    # Warm start
+    # ------------------------
+    def restore_snapshot(self):
+        """Show the last session's catalog and update statuses until they are re-checked"""
+        snapshot = self.snapshot.load()
+        if snapshot is None:
+            return
+        # A sharded catalog opens faster than the snapshot parses
+        if snapshot.get("catalog") and not self.is_sharded():
+            self._catalog = snapshot["catalog"]
+
+        # Only trust statuses recorded for the version that is still installed
+        installed_versions = snapshot.get("installed_versions", {})
+        for tool_name, latest in snapshot.get("latest_versions", {}).items():
+            tool_info = self._installed.get(tool_name)
+            if tool_info and installed_versions.get(tool_name) == tool_info["version"]:
+                self._latest_versions[tool_name] = latest
+                self._stale.add(tool_name)
+
+        self.download_manager.resolved_urls.update(snapshot.get("resolved_urls", {}))
+        log.info("Restored %d tool statuses from the last session", len(self._stale))
+
+    def reconcile(self):
+        """Re-check everything restored from the snapshot, in background"""
+        self.apply_catalog(self.load_catalog())
+
+        for tool_name in list(self._stale):
+            tool_info = self._installed.get(tool_name)
+            if tool_info:
+                self.request_status(tool_name, tool_info["github_url"])
+        self.prepare_search_index()
+
+    def schedule_snapshot(self):
+        """Save the snapshot once things have been quiet for a few seconds"""
+        self.snapshot_timer.start()
+
+    def save_snapshot(self):
+        self.snapshot_timer.stop()
+        self.snapshot.save(
+            catalog=None if self.is_sharded() else dict(self.catalog()),
+            installed_versions={name: info["version"] for name, info in self._installed.items()},
+            latest_versions={
+                name: latest for name, latest in self._latest_versions.items()
+                if name in self._installed
+            },
+            resolved_urls=dict(self.download_manager.resolved_urls),
+        )
+
+    # ------------------------
+    # Actions
+    # ------------------------
+    def download_tool(self, github_url, tool_name, parent_widget=None):
+        success = self.download_manager.download_tool(
+            github_url, tool_name, parent_widget,
+            progress_callback=lambda percent: self.progress.emit(tool_name, percent)
+        )
+        if success:
+            # We just installed the latest version, no need to ask GitHub again
+            self._latest_versions[tool_name] = None
+            self._stale.discard(tool_name)
+            self.reload_installed(invalidate_status=False)
+            self.status_changed.emit(tool_name)
+        return success
+
+    def update_tool(self, github_url, tool_name, parent_widget=None):
+        success = self.download_manager.update_tool(
+            github_url, tool_name, parent_widget,
+            progress_callback=lambda percent: self.progress.emit(tool_name, percent),
+            latest_version=self.latest_version(tool_name)
+        )
+        if success:
+            # We just installed the latest version, no need to ask GitHub again
+            self._latest_versions[tool_name] = None
+            self._stale.discard(tool_name)
+            self.reload_installed(invalidate_status=False)
+            self.status_changed.emit(tool_name)
+        return success
+
+    # ------------------------
+    # Change tracking
+    # ------------------------
+    def init_watcher(self):
+        """Watch the registry database and downloads folder for outside changes"""
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_filesystem_changed)
+        self.watcher.fileChanged.connect(self.on_filesystem_changed)
+
+        # Coalesce bursts of events (e.g. extracting a zip) into one reload
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(250)
+        self.reload_timer.timeout.connect(self.reload_installed)
+
+        self.update_watched_paths()
+
+    def update_watched_paths(self):
+        """(Re)add watched paths; the WAL file comes and goes with checkpoints"""
+        db_path = self.registry.db_path
+        candidates = [
+            Settings.DOWNLOADS_DIR,
+            db_path,
+            db_path.with_name(db_path.name + "-wal"),
+        ]
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        missing = [str(p) for p in candidates if p.exists() and str(p) not in watched]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def init_catalog_watcher(self):
+        """Hot-reload the tools registry JSON when it is edited"""
+        self.catalog_watcher = QFileSystemWatcher(self)
+        self.catalog_watcher.fileChanged.connect(self.on_catalog_file_changed)
+        # Editors that save by replacing the file drop the file watch; the folder catches it
+        self.catalog_watcher.directoryChanged.connect(self.on_catalog_file_changed)
+
+        self.catalog_reload_timer = QTimer(self)
+        self.catalog_reload_timer.setSingleShot(True)
+        self.catalog_reload_timer.setInterval(250)
+        self.catalog_reload_timer.timeout.connect(self.reload_catalog)
+
+        self.update_catalog_watched_paths()
+
+    def update_catalog_watched_paths(self):
+        config_file = Settings.TOOLS_CONFIG_FILE
+        index_file = Settings.CATALOG_DIR / "index.json"
+        candidates = (config_file, config_file.parent, index_file, Settings.CATALOG_DIR)
+        watched = set(self.catalog_watcher.files()) | set(self.catalog_watcher.directories())
+        missing = [str(p) for p in candidates if p.exists() and str(p) not in watched]
+        if missing:
+            self.catalog_watcher.addPaths(missing)
+
+    def on_catalog_file_changed(self, _path):
+        self.update_catalog_watched_paths()
+        self.catalog_reload_timer.start()
+
+    def reload_catalog(self):
+        """Re-read the registry (no parse unless its mtime or size changed) and merge the synced copy"""
+        self.apply_catalog(self.load_catalog())
+
+    def on_filesystem_changed(self, _path):
+        self.update_watched_paths()
+        self.reload_timer.start()
@@ -0,0 +1,148 @@
+import sys
+import time
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("stager")
+
+
+def in_hour_window(hour, start, end):
+    """True if hour is in [start, end); the window may wrap midnight (22 -> 6)"""
+    if start < end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+def system_idle_seconds():
+    """Seconds since the last keyboard or mouse input anywhere (Windows only), else None"""
+    if sys.platform != "win32":
+        return None
+    import ctypes
+
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(info)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+        return None
+    get_tick_count = ctypes.windll.kernel32.GetTickCount
+    get_tick_count.restype = ctypes.c_uint
+    # Both counters wrap after 49.7 days
+    return ((get_tick_count() - info.dwTime) & 0xFFFFFFFF) / 1000.0
+
+
+class ToolStageThread(QThread):
+    """Stages one tool update without blocking the UI"""
+
+    finished_staging = pyqtSignal(str, str)  # tool name, staged version ("" when nothing was staged)
+
+    def __init__(self, download_manager, tool_name, github_url, parent=None):
+        super().__init__(parent)
+        self.download_manager = download_manager
+        self.tool_name = tool_name
+        self.github_url = github_url
+
+    def run(self):
+        version = None
+        try:
+            version = self.download_manager.stage_tool_update(
+                self.github_url, self.tool_name, should_stop=self.isInterruptionRequested
+            )
+        except Exception as e:
+            log.warning("Staging %s failed: %s", self.tool_name, e)
+        self.finished_staging.emit(self.tool_name, version or "")
+
+
+class ToolUpdateStager(QObject):
+    """
+    Opt-in (prestage_tool_updates in user_config.json): while the user is idle
+    and within the configured hours, downloads pending tool updates one at a
+    time into TOOL_UPDATE_STAGING_DIR, so clicking Update is a folder swap.
+    Downloads share the bandwidth cap with everything else.
+    """
+
+    tool_staged = pyqtSignal(str, str)  # tool name, version
+
+    CHECK_INTERVAL_MS = 60 * 1000
+
+    def __init__(self, repository):
+        super().__init__(repository)
+        self.repository = repository
+        self.download_manager = repository.download_manager
+        self.thread = None
+        # tool name -> version that failed to stage this session (not retried)
+        self._failed = {}
+        self._inactive_since = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self.on_application_state_changed)
+
+    def start(self):
+        if not Settings.PRESTAGE_TOOL_UPDATES:
+            return
+        self.download_manager.prune_staged_updates()
+        self.timer.start(self.CHECK_INTERVAL_MS)
+
+    def stop(self):
+        self.timer.stop()
+        if self.thread is not None:
+            self.thread.requestInterruption()
+            self.thread.wait(2000)
+
+    def on_application_state_changed(self, state):
+        if state == Qt.ApplicationActive:
+            self._inactive_since = None
+        elif self._inactive_since is None:
+            self._inactive_since = time.monotonic()
+
+    def idle_seconds(self):
+        """System-wide input idle time, or how long Triple V has been in the background"""
+        idle = system_idle_seconds()
+        if idle is not None:
+            return idle
+        if self._inactive_since is None:
+            return 0.0
+        return time.monotonic() - self._inactive_since
+
+    def may_stage(self):
+        hour = time.localtime().tm_hour
+        return (in_hour_window(hour, Settings.PRESTAGE_START_HOUR, Settings.PRESTAGE_END_HOUR)
+                and self.idle_seconds() >= Settings.PRESTAGE_IDLE_SECONDS)
+
+    def next_candidate(self):
+        """(tool name, github url) of a pending update not staged yet, else None"""
+        for tool_name, latest, github_url in self.repository.pending_updates():
+            if self._failed.get(tool_name) == latest:
+                continue
+            staged = self.download_manager.staged_update(tool_name)
+            if staged and staged["version"] == latest:
+                continue
+            return tool_name, github_url
+        return None
+
+    def tick(self):
+        if self.thread is not None or not self.may_stage():
+            return
+        candidate = self.next_candidate()
+        if candidate is None:
+            return
+        tool_name, github_url = candidate
+        self.thread = ToolStageThread(self.download_manager, tool_name, github_url, self)
+        self.thread.finished_staging.connect(self.on_finished_staging)
+        self.thread.start(QThread.LowestPriority)
+
+    def on_finished_staging(self, tool_name, version):
+        self.thread.wait()
+        self.thread.deleteLater()
+        self.thread = None
+        if version:
+            self.tool_staged.emit(tool_name, version)
+            # Keep going while the user is still away
+            QTimer.singleShot(0, self.tick)
+        else:
+            self._failed[tool_name] = self.repository.latest_version(tool_name)
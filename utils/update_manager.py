@@ -1,22 +1,11 @@
-import os
-import sys
-import subprocess
-import json
-import tempfile
 import shutil
-import zipfile
-import requests
-from packaging import version
-from pathlib import Path
-
-from PyQt5.QtWidgets import (
-    QMessageBox,
-    QProgressDialog,
-    QApplication
-)
-from PyQt5.QtCore import Qt
 
 from config.settings import Settings
+from utils.bandwidth import BandwidthLimiter
+from utils.update_staging import UpdateStaging
+from utils.log import get_logger
+
+log = get_logger("update")
 
 
 class UpdateManager:
@@ -33,182 +22,109 @@ class UpdateManager:
         Query GitHub Releases API and compare versions
         Returns: (is_update_available: bool, latest_version: str, release_data: dict)
         """
+        import requests
+        from packaging import version
         
 
         try:
-            print(f"[UpdateManager] Current version: {self.current_version}")
-            print(f"[UpdateManager] Checking GitHub releases: {self.github_api_url}")
-            response = requests.get(self.github_api_url, timeout=10)
+            log.info("Checking GitHub releases (current version %s): %s", self.current_version, self.github_api_url)
+            response = requests.get(self.github_api_url, timeout=Settings.REQUEST_TIMEOUT)
             response.raise_for_status()
             release_data = response.json()
             # Extract version from tag_name (e.g., "v2.0.0" -> "2.0.0")
             tag_name = release_data.get("tag_name", "")
             latest_version = tag_name.lstrip("v")
             
-            print(f"[UpdateManager] Latest release version: {latest_version}")
+            log.debug("Latest release version: %s", latest_version)
 
 
             if version.parse(latest_version) > version.parse(self.current_version):
-                print(f"[UpdateManager] Update available: {self.current_version} -> {latest_version}")
+                log.info("Update available: %s -> %s", self.current_version, latest_version)
                 return True, latest_version, release_data
             else:
-                print(f"[UpdateManager] Already up to date")
+                log.info("Already up to date")
                 
         except Exception as e:
-            print(f"[UpdateManager] Error checking for updates: {e}")
+            log.warning("Error checking for updates: %s", e)
 
         return False, None, None
 
-    def show_update_dialog(self, parent_widget, new_version, release_data=None):
-        """
-        Show update dialog and handle the update process
-        """
-        reply = QMessageBox.question(
-            parent_widget,
-            "Update Available",
-            (
-                f"Triple V v{new_version} is available!\n\n"
-                f"Current version: v{self.current_version}\n"
-                f"New version: v{new_version}\n\n"
-                "Download and install now?"
-            ),
-            QMessageBox.Yes | QMessageBox.No
-        )
-        if reply != QMessageBox.Yes:
-            print("[UpdateManager] User chose not to update.")
-            return
-
-        # Find the ZIP asset in the release
-        download_url = None
-        if release_data and "assets" in release_data:
-            for asset in release_data["assets"]:
-                if asset["name"].endswith(".zip") and "TripleV" in asset["name"]:
-                    download_url = asset["browser_download_url"]
-                    break
-        
-        if not download_url:
-            QMessageBox.warning(parent_widget, "Error", 
-                              "Could not find download URL for the update.")
-            return
+    @staticmethod
+    def find_release_asset(release_data):
+        """The TripleV zip asset of a GitHub release, or None"""
+        for asset in (release_data or {}).get("assets", []):
+            if asset["name"].endswith(".zip") and "TripleV" in asset["name"]:
+                return asset
+        return None
 
-        try:
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            success = self._download_and_install_update(parent_widget, download_url, new_version)
-
-            if success:
-                QMessageBox.information(
-                    parent_widget,
-                    "Update Complete",
-                    f"Triple V has been updated to v{new_version}!\n\n"
-                    "Please restart the application to apply changes."
-                )
-            else:
-                QMessageBox.warning(
-                    parent_widget,
-                    "Update Failed",
-                    "Failed to install the update. Please try again."
-                )
-        finally:
-            QApplication.restoreOverrideCursor()
-
-    def _download_and_install_update(self, parent, url, new_version):
+    def stage_update(self, new_version, release_data, should_stop=lambda: False):
         """
-        Download ZIP, extract new exe, rename old exe, and install new one
+        Download the release zip into the staging folder (bandwidth-capped),
+        verify it and extract the new exe next to the running one.
+        Meant for a low-priority worker thread; nothing here touches widgets.
+        Returns the staged manifest, or None if staging failed or was stopped.
         """
-        
+        import hashlib
+        import requests
+        import zipfile
+        from utils.integrity import hash_file
+
+        staging = UpdateStaging()
+        staged = staging.staged()
+        if staged and staged["version"] == new_version:
+            log.info("v%s is already staged", new_version)
+            return staged
+
+        asset = self.find_release_asset(release_data)
+        if asset is None:
+            log.warning("Could not find a TripleV zip in the release")
+            return None
+
+        staging.clear()
+        staging.directory.mkdir(parents=True, exist_ok=True)
+        zip_path = staging.directory / f"TripleV_v{new_version}.zip.part"
+        digest = hashlib.sha256()
         try:
-            # 1. Download the ZIP file
-            response = requests.get(url, stream=True, timeout=30)
+            log.info("Staging v%s from %s", new_version, asset["browser_download_url"])
+            response = requests.get(asset["browser_download_url"], stream=True, timeout=Settings.DOWNLOAD_TIMEOUT)
             response.raise_for_status()
-            total_size = int(response.headers.get("content-length", 0))
-            
-            progress = QProgressDialog("Downloading update...", "Cancel", 0, total_size, parent)
-            progress.setWindowModality(Qt.WindowModal)
-            progress.setMinimumDuration(0)
-            
-            # Download to temp file
-            temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
-            downloaded = 0
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                if progress.wasCanceled():
-                    temp_zip.close()
-                    os.unlink(temp_zip.name)
-                    return False
-                    
-                if chunk:
-                    temp_zip.write(chunk)
-                    downloaded += len(chunk)
-                    progress.setValue(downloaded)
-                    
-            temp_zip.close()
-            progress.close()
-            
-            # 2. Extract the new executable
-            with zipfile.ZipFile(temp_zip.name, 'r') as zip_ref:
-                # Find the exe file in the zip
-                exe_name = None
-                for name in zip_ref.namelist():
-                    if name.endswith('.exe') and 'TripleV' in name:
-                        exe_name = name
-                        break
-                        
+            limiter = BandwidthLimiter.shared()
+            with open(zip_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=Settings.DOWNLOAD_CHUNK_SIZE):
+                    if should_stop():
+                        raise InterruptedError("stopped")
+                    if chunk:
+                        limiter.throttle(len(chunk))
+                        f.write(chunk)
+                        digest.update(chunk)
+
+            # Verify against what the release says it ships
+            size = zip_path.stat().st_size
+            if asset.get("size") and size != asset["size"]:
+                raise Exception(f"size {size} does not match the release ({asset['size']})")
+            expected = asset.get("digest") or ""
+            if expected.startswith("sha256:") and expected[len("sha256:"):] != digest.hexdigest():
+                raise Exception("SHA-256 does not match the release")
+
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                exe_name = next(
+                    (name for name in zip_ref.namelist() if name.endswith(".exe") and "TripleV" in name), None
+                )
                 if not exe_name:
                     raise Exception("No TripleV executable found in update package")
-                
-                # Extract to temp location
-                temp_dir = tempfile.mkdtemp()
-                zip_ref.extract(exe_name, temp_dir)
-                new_exe_path = Path(temp_dir) / exe_name
-            
-            # 3. Rename current executable
-            if getattr(sys, 'frozen', False):
-                current_exe = Path(sys.executable)
-            else:
-                # Running as script, look for exe in dist
-                dist_dir = Settings.BASE_DIR / "dist"
-                current_exe = None
-                for exe_file in dist_dir.glob("TripleV*.exe"):
-                    current_exe = exe_file
-                    break
-            
-            if current_exe and current_exe.exists():
-                # Rename old exe to include its version
-                old_version = self.current_version
-                backup_name = f"TripleV_v{old_version}_old_{old_version}.exe"
-                backup_path = current_exe.parent / backup_name
-                
-                # Use a batch script to rename the running exe
-                if getattr(sys, 'frozen', False):
-                    batch_content = f"""
-                    @echo off
-                    timeout /t 2 /nobreak > nul
-                    move /y "{current_exe}" "{backup_path}"
-                    move /y "{new_exe_path}" "{current_exe.parent / f'TripleV_v{new_version}.exe'}"
-                    del "%~f0"
-                    """
-                    batch_path = current_exe.parent / "update.bat"
-                    with open(batch_path, 'w') as f:
-                        f.write(batch_content)
-                    
-                    # Execute batch script
-                    subprocess.Popen(str(batch_path), shell=True)
-                else:
-                    # Not frozen, just move files directly
-                    if current_exe.exists():
-                        current_exe.rename(backup_path)
-                    new_exe_path.rename(current_exe.parent / f"TripleV_v{new_version}.exe")
-            
-            # Clean up
-            os.unlink(temp_zip.name)
-            
-            return True
+                staged_exe = staging.directory / f"TripleV_v{new_version}.exe"
+                # Reading through ZipFile checks the member's CRC
+                with zip_ref.open(exe_name) as src, open(staged_exe, "wb") as dst:
+                    shutil.copyfileobj(src, dst, Settings.DOWNLOAD_CHUNK_SIZE)
+            zip_path.unlink()
+
+            manifest = staging.write_manifest(
+                new_version, staged_exe.name, staged_exe.stat().st_size, hash_file(staged_exe)
+            )
+            log.info("v%s staged and verified", new_version)
+            return manifest
 
         except Exception as e:
-            print(f"[UpdateManager] Update failed: {e}")
-            try:
-                if 'temp_zip' in locals():
-                    os.unlink(temp_zip.name)
-            except Exception:
-                pass
-                return False
+            log.warning("Staging update failed: %s", e)
+            staging.clear()
+            return None
@@ -0,0 +1,114 @@
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+from config.settings import Settings
+from utils.log import get_logger
+
+log = get_logger("update")
+
+# No Qt and no network here: main.py applies a staged update before anything else loads
+
+
+def version_tuple(version_str):
+    """(2, 0, 1) for "2.0.1"; enough for the TripleV_vX.Y.Z release names"""
+    return tuple(int(part) for part in re.findall(r"\d+", version_str or ""))
+
+
+class UpdateStaging:
+    """
+    A verified TripleV exe downloaded in the background by
+    UpdateManager.stage_update() and waiting in UPDATE_STAGING_DIR.
+    Applying it is two renames and a relaunch, no download.
+    """
+
+    MANIFEST = "staged_update.json"
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or Settings.UPDATE_STAGING_DIR)
+        self.manifest_path = self.directory / self.MANIFEST
+
+    def staged(self):
+        """{"version", "exe", "size", "sha256"} of a complete staged update, else None"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            exe_path = self.directory / manifest["exe"]
+            if exe_path.stat().st_size != manifest["size"]:
+                log.warning("Staged exe does not match its manifest")
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return manifest
+
+    def pending_version(self):
+        """Version of a staged update newer than the running one, else None"""
+        manifest = self.staged()
+        if manifest and version_tuple(manifest["version"]) > version_tuple(Settings.APP_VERSION):
+            return manifest["version"]
+        return None
+
+    def write_manifest(self, version, exe_name, size, sha256):
+        """Mark the staged exe complete; written last so a partial stage is never applied"""
+        manifest = {"version": version, "exe": exe_name, "size": size, "sha256": sha256}
+        temp_path = self.manifest_path.with_name(self.MANIFEST + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(temp_path, self.manifest_path)
+        return manifest
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def can_relaunch():
+        """Whether apply() can start the new exe: only when running as the exe"""
+        return getattr(sys, "frozen", False)
+
+    @staticmethod
+    def current_exe():
+        if getattr(sys, "frozen", False):
+            return Path(sys.executable)
+        # Running as script, look for exe in dist
+        return next(Settings.EXE_DIR.glob("TripleV*.exe"), None)
+
+    def apply(self, relaunch=True):
+        """
+        Put the staged exe in place of the running one and optionally start it.
+        Returns the new exe path, or None when there is nothing to apply.
+        """
+        version = self.pending_version()
+        if version is None:
+            if self.directory.exists():
+                # Older than (or same as) what is running: nothing to keep
+                self.clear()
+            return None
+
+        manifest = self.staged()
+        staged_exe = self.directory / manifest["exe"]
+        current_exe = self.current_exe()
+        target_dir = current_exe.parent if current_exe else Settings.EXE_DIR
+        # The version is read back from the file name (Settings._load_local_version)
+        new_exe = target_dir / f"TripleV_v{version}.exe"
+
+        backup_path = None
+        if current_exe and current_exe.exists():
+            old_version = Settings.APP_VERSION
+            backup_path = current_exe.with_name(f"TripleV_v{old_version}_old_{old_version}.exe")
+            # A running exe can be renamed on Windows, just not overwritten
+            os.replace(current_exe, backup_path)
+        try:
+            os.replace(staged_exe, new_exe)
+        except OSError:
+            if backup_path is not None:
+                os.replace(backup_path, current_exe)
+            raise
+        self.clear()
+        log.info("Applied update v%s", version)
+
+        if relaunch and self.can_relaunch():
+            import subprocess
+            subprocess.Popen([str(new_exe)] + sys.argv[1:], close_fds=True)
+        return new_exe